@@ -0,0 +1,72 @@
+"""Compare two benchmark result files and flag regressions.
+
+Usage::
+
+    python -m benchmarks.compare baseline.json candidate.json --threshold 0.10
+
+Exits with status 1 if any case's p50 latency or peak RSS grew by more than the threshold.
+"""
+import argparse
+import json
+import sys
+from typing import Any, Dict, List, Optional, Tuple
+
+
+def _load(path: str) -> Dict[Tuple[str, str], Dict[str, Any]]:
+    with open(path, encoding="utf-8") as file:
+        report = json.load(file)
+    return {(result["format"], result["scale"]): result for result in report["results"]}
+
+
+def _change(before: Optional[float], after: Optional[float]) -> Optional[float]:
+    if not before or after is None:
+        return None
+    return (after - before) / before
+
+
+def _format_change(change: Optional[float]) -> str:
+    return "n/a" if change is None else f"{change:+.1%}"
+
+
+def compare(baseline: str, candidate: str, threshold: float) -> List[str]:
+    """Print a comparison table and return descriptions of regressions."""
+    before, after = _load(baseline), _load(candidate)
+    regressions = []
+    print(f"{'case':<14} {'p50 before':>11} {'p50 after':>11} {'change':>8} {'rss change':>11} {'worst stage':>16}")
+    for key in sorted(set(before) & set(after)):
+        old, new = before[key], after[key]
+        latency = _change(old["latency_s"]["p50"], new["latency_s"]["p50"])
+        rss = _change(old.get("peak_rss_bytes"), new.get("peak_rss_bytes"))
+        stage_changes = {
+            stage: new["stages_s"][stage] - old["stages_s"].get(stage, 0.0) for stage in new["stages_s"]
+        }
+        slowest = max(stage_changes, key=stage_changes.get) if stage_changes else ""
+        case = f"{key[0]}:{key[1]}"
+        print(
+            f"{case:<14} {old['latency_s']['p50'] * 1000:9.1f}ms {new['latency_s']['p50'] * 1000:9.1f}ms "
+            f"{_format_change(latency):>8} {_format_change(rss):>11} {slowest:>16}"
+        )
+        if latency is not None and latency > threshold:
+            regressions.append(f"{case}: p50 latency {_format_change(latency)}")
+        if rss is not None and rss > threshold:
+            regressions.append(f"{case}: peak RSS {_format_change(rss)}")
+    for key in sorted(set(before) ^ set(after)):
+        print(f"{key[0]}:{key[1]:<14} only in {'baseline' if key in before else 'candidate'}")
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("baseline")
+    parser.add_argument("candidate")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Relative slowdown treated as a regression")
+    args = parser.parse_args(argv)
+
+    regressions = compare(args.baseline, args.candidate, args.threshold)
+    if regressions:
+        print("\nRegressions:\n  " + "\n  ".join(regressions))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
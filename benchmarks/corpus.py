@@ -0,0 +1,162 @@
+"""Deterministic synthetic corpora for the loader benchmarks.
+
+Every generator takes a scale name and an output directory and returns the path of a
+generated file. Files are cached by format and scale, so repeated runs reuse them.
+"""
+import io
+import os
+import random
+from typing import Callable, Dict, List
+
+SCALES = ["small", "medium", "large"]
+
+# Knobs per format and scale
+PARAMETERS: Dict[str, Dict[str, Dict[str, int]]] = {
+    "text": {
+        "small": {"sections": 20, "paragraphs": 3},
+        "medium": {"sections": 200, "paragraphs": 5},
+        "large": {"sections": 2000, "paragraphs": 5},
+    },
+    "docx": {
+        "small": {"sections": 10, "paragraphs": 3, "tables": 1},
+        "medium": {"sections": 100, "paragraphs": 5, "tables": 10},
+        "large": {"sections": 500, "paragraphs": 8, "tables": 40},
+    },
+    "pptx": {
+        "small": {"slides": 5, "images": 2, "unique_images": 2},
+        "medium": {"slides": 50, "images": 40, "unique_images": 10},
+        "large": {"slides": 200, "images": 200, "unique_images": 25},
+    },
+    "xlsx": {
+        "small": {"sheets": 2, "rows": 50, "columns": 5},
+        "medium": {"sheets": 10, "rows": 1000, "columns": 10},
+        "large": {"sheets": 20, "rows": 10000, "columns": 12},
+    },
+}
+
+_WORDS = (
+    "lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod tempor incididunt ut "
+    "labore et dolore magna aliqua revenue forecast quarterly pipeline margin customer churn "
+    "latency throughput region product launch roadmap hiring budget"
+).split()
+
+
+def _sentence(rng: random.Random, words: int = 12) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(words)).capitalize() + "."
+
+
+def _paragraph(rng: random.Random, sentences: int = 4) -> str:
+    return " ".join(_sentence(rng, rng.randint(6, 18)) for _ in range(sentences))
+
+
+def _heading_levels(rng: random.Random, count: int) -> List[int]:
+    """A plausible outline: levels move at most one deeper at a time, up to six."""
+    levels = []
+    level = 1
+    for _ in range(count):
+        level = rng.randint(1, min(6, level + 1))
+        levels.append(level)
+    return levels
+
+
+def _image(rng: random.Random, size: int) -> bytes:
+    from PIL import Image, ImageDraw
+    image = Image.new("RGB", (size, size), tuple(rng.randint(0, 255) for _ in range(3)))
+    draw = ImageDraw.Draw(image)
+    for _ in range(6):
+        x0, y0 = rng.randint(0, size // 2), rng.randint(0, size // 2)
+        draw.rectangle(
+            (x0, y0, x0 + rng.randint(10, size // 2), y0 + rng.randint(10, size // 2)),
+            fill=tuple(rng.randint(0, 255) for _ in range(3)),
+        )
+    buffer = io.BytesIO()
+    image.save(buffer, "PNG")
+    return buffer.getvalue()
+
+
+def generate_text(path: str, sections: int, paragraphs: int) -> None:
+    rng = random.Random(0)
+    with open(path, "w", encoding="utf-8") as file:
+        for index, level in enumerate(_heading_levels(rng, sections)):
+            file.write(f"{'#' * level} Section {index}\n\n")
+            for _ in range(paragraphs):
+                file.write(_paragraph(rng) + "\n\n")
+
+
+def generate_docx(path: str, sections: int, paragraphs: int, tables: int) -> None:
+    from docx import Document
+    rng = random.Random(0)
+    document = Document()
+    document.core_properties.author = "Benchmark"
+    document.core_properties.title = "Synthetic report"
+    table_every = max(1, sections // max(1, tables))
+    for index, level in enumerate(_heading_levels(rng, sections)):
+        document.add_heading(f"Section {index}", level=level)
+        for _ in range(paragraphs):
+            document.add_paragraph(_paragraph(rng))
+        if tables and index % table_every == 0:
+            table = document.add_table(rows=5, cols=4)
+            for row in table.rows:
+                for cell in row.cells:
+                    cell.text = rng.choice(_WORDS)
+    document.save(path)
+
+
+def generate_pptx(path: str, slides: int, images: int, unique_images: int) -> None:
+    from pptx import Presentation
+    from pptx.util import Inches
+    rng = random.Random(0)
+    # Repeated artwork (logos, template images) is typical of real decks
+    artwork = [_image(rng, rng.choice([128, 256, 512])) for _ in range(max(1, unique_images))]
+    prs = Presentation()
+    prs.core_properties.author = "Benchmark"
+    image_slides = set(rng.sample(range(slides), min(images, slides))) if images else set()
+    for index in range(slides):
+        slide = prs.slides.add_slide(prs.slide_layouts[5])
+        slide.shapes.title.text = f"Slide {index}: {_sentence(rng, 4)}"
+        text_box = slide.shapes.add_textbox(Inches(0.5), Inches(1.5), Inches(5), Inches(3))
+        for _ in range(3):
+            text_box.text_frame.add_paragraph().text = _sentence(rng)
+        if index in image_slides:
+            slide.shapes.add_picture(io.BytesIO(rng.choice(artwork)), Inches(6), Inches(1.5), Inches(3))
+        if index % 10 == 9:
+            table = slide.shapes.add_table(4, 3, Inches(0.5), Inches(4.5), Inches(6), Inches(1.5)).table
+            for row in table.rows:
+                for cell in row.cells:
+                    cell.text = rng.choice(_WORDS)
+    prs.save(path)
+
+
+def generate_xlsx(path: str, sheets: int, rows: int, columns: int) -> None:
+    from openpyxl import Workbook
+    rng = random.Random(0)
+    workbook = Workbook(write_only=True)
+    for sheet_index in range(sheets):
+        worksheet = workbook.create_sheet(f"Sheet{sheet_index}")
+        worksheet.append([f"column_{column}" for column in range(columns)])
+        for _ in range(rows):
+            worksheet.append([
+                rng.choice(_WORDS) if column % 3 == 0 else round(rng.uniform(0, 10_000), 2)
+                for column in range(columns)
+            ])
+    workbook.save(path)
+
+
+GENERATORS: Dict[str, Callable[..., None]] = {
+    "text": generate_text,
+    "docx": generate_docx,
+    "pptx": generate_pptx,
+    "xlsx": generate_xlsx,
+}
+EXTENSIONS = {"text": ".md", "docx": ".docx", "pptx": ".pptx", "xlsx": ".xlsx"}
+
+
+def corpus_file(file_format: str, scale: str, directory: str) -> str:
+    """Return the path of the synthetic file for (format, scale), generating it if needed."""
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"{file_format}-{scale}{EXTENSIONS[file_format]}")
+    if not os.path.exists(path):
+        tmp_path = path + ".tmp" + EXTENSIONS[file_format]
+        GENERATORS[file_format](tmp_path, **PARAMETERS[file_format][scale])
+        os.replace(tmp_path, path)
+    return path
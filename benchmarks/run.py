@@ -0,0 +1,311 @@
+"""Run the loader benchmarks and write machine-readable results.
+
+Usage (from the repository root)::
+
+    python -m benchmarks.run --scales small medium --output results.json
+    python -m benchmarks.compare baseline.json results.json
+
+Each (format, scale) case runs in a fresh interpreter so peak RSS is per case, and
+imports or converter pools do not leak between cases.
+"""
+import argparse
+import contextlib
+import inspect
+import json
+import math
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List, Optional
+
+from benchmarks.corpus import PARAMETERS, SCALES, corpus_file
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_CORPUS_DIR = os.path.join(ROOT, "benchmarks", ".corpus")
+
+# Cases that load another format's corpus differently: the PPTX deck with one
+# parallel_workers unit per CPU, timed against a serial load of the same deck
+CORPUS_FORMATS = {"pptx_parallel": "pptx"}
+FORMATS = list(PARAMETERS) + list(CORPUS_FORMATS)
+
+
+class FakeCaptionLLM:
+    """Local stand-in for a chat model: fixed latency per caption, no network."""
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def invoke(self, messages):
+        from langchain_core.messages import AIMessage
+        with self._lock:
+            self.calls += 1
+        time.sleep(self.latency)
+        return AIMessage(content="A synthetic benchmark caption.")
+
+    async def ainvoke(self, messages):
+        import asyncio
+        from langchain_core.messages import AIMessage
+        with self._lock:
+            self.calls += 1
+        await asyncio.sleep(self.latency)
+        return AIMessage(content="A synthetic benchmark caption.")
+
+
+class StageTimer:
+    """Attributes wall time to named stages by wrapping loader methods.
+
+    Time is exclusive: a stage nested in another is subtracted from its parent. Generator
+    results are timed as they are consumed.
+    """
+
+    def __init__(self):
+        self.totals: Dict[str, float] = {}
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def _stack(self) -> List[List[Any]]:
+        if not hasattr(self._local, "stack"):
+            self._local.stack = []
+        return self._local.stack
+
+    @contextlib.contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        stack = self._stack()
+        frame = [name, time.perf_counter(), 0.0]
+        stack.append(frame)
+        try:
+            yield
+        finally:
+            stack.pop()
+            elapsed = time.perf_counter() - frame[1]
+            with self._lock:
+                self.totals[name] = self.totals.get(name, 0.0) + elapsed - frame[2]
+            if stack:
+                stack[-1][2] += elapsed
+
+    def _timed_generator(self, name: str, generator: Iterator[Any]) -> Iterator[Any]:
+        while True:
+            with self.stage(name):
+                try:
+                    item = next(generator)
+                except StopIteration:
+                    return
+            yield item
+
+    @contextlib.contextmanager
+    def wrap(self, owner: Any, attribute: str, name: str) -> Iterator[None]:
+        original = owner.__dict__[attribute] if attribute in getattr(owner, "__dict__", {}) else getattr(owner, attribute)
+        function = original.__func__ if isinstance(original, (staticmethod, classmethod)) else original
+        timer = self
+
+        def wrapper(*args, **kwargs):
+            with timer.stage(name):
+                result = function(*args, **kwargs)
+            if inspect.isgenerator(result):
+                return timer._timed_generator(name, result)
+            return result
+
+        replacement: Any = wrapper
+        if isinstance(original, staticmethod):
+            replacement = staticmethod(wrapper)
+        setattr(owner, attribute, replacement)
+        try:
+            yield
+        finally:
+            setattr(owner, attribute, original)
+
+
+def _stage_hooks(file_format: str) -> List[tuple]:
+    """(owner, attribute, stage) triples to instrument for one format."""
+    from langchain_markitdown import base_loader, docx_loader, markdown_chunker, pptx_loader, xlsx_loader
+
+    hooks = [(base_loader.BaseMarkitdownLoader, "_convert_markdown", "convert")]
+    if file_format == "docx":
+        hooks += [
+            (docx_loader, "read_core_properties", "metadata"),
+            (markdown_chunker.MarkdownChunker, "iter_chunks", "split"),
+        ]
+    elif file_format in ("pptx", "pptx_parallel"):
+        hooks += [
+            (pptx_loader.PptxLoader, "_extract_metadata", "metadata"),
+            (pptx_loader.PptxLoader, "_caption_images", "caption"),
+            (pptx_loader.PptxLoader, "_split_markdown_into_slides", "split"),
+        ]
+    elif file_format == "xlsx":
+        hooks += [
+            (xlsx_loader, "read_core_properties", "metadata"),
+            (xlsx_loader.XlsxLoader, "_split_sheets", "split"),
+        ]
+    return hooks
+
+
+def _make_loader(file_format: str, path: str, llm: Optional[FakeCaptionLLM]) -> Any:
+    from langchain_markitdown import DocxLoader, PlainTextLoader, PptxLoader, XlsxLoader
+
+    if file_format == "text":
+        return PlainTextLoader(path)
+    if file_format == "docx":
+        return DocxLoader(path, split_by_page=True)
+    if file_format == "pptx":
+        return PptxLoader(path, split_by_page=True, llm=llm)
+    if file_format == "pptx_parallel":
+        return PptxLoader(path, split_by_page=True, parallel_workers=os.cpu_count() or 1)
+    return XlsxLoader(path, split_by_page=True)
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile."""
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, math.ceil(fraction * len(ordered)) - 1))
+    return ordered[index]
+
+
+def _peak_rss_bytes() -> Optional[int]:
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def run_case(file_format: str, scale: str, repeat: int, corpus_dir: str, caption_latency: float) -> Dict[str, Any]:
+    """Benchmark one (format, scale) case in the current process."""
+    corpus_format = CORPUS_FORMATS.get(file_format, file_format)
+    path = corpus_file(corpus_format, scale, corpus_dir)
+    file_size = os.path.getsize(path)
+    llm = FakeCaptionLLM(caption_latency) if file_format == "pptx" else None
+    timer = StageTimer()
+
+    # Warm-up: imports and the pooled MarkItDown instance are one-off costs
+    _make_loader(file_format, path, llm).load()
+    llm_calls_before = llm.calls if llm else 0
+
+    latencies = []
+    documents = characters = 0
+    with contextlib.ExitStack() as stack:
+        for owner, attribute, stage in _stage_hooks(file_format):
+            stack.enter_context(timer.wrap(owner, attribute, stage))
+        for _ in range(repeat):
+            start = time.perf_counter()
+            docs = _make_loader(file_format, path, llm).load()
+            latencies.append(time.perf_counter() - start)
+            documents = len(docs)
+            characters = sum(len(doc.page_content) for doc in docs)
+
+    serial_latencies = []
+    if file_format in CORPUS_FORMATS:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            _make_loader(corpus_format, path, None).load()
+            serial_latencies.append(time.perf_counter() - start)
+
+    stages = {name: total / repeat for name, total in sorted(timer.totals.items())}
+    stages["other"] = max(0.0, statistics.mean(latencies) - sum(stages.values()))
+    mean = statistics.mean(latencies)
+    result = {
+        "format": file_format,
+        "scale": scale,
+        "parameters": PARAMETERS[corpus_format][scale],
+        "file_size": file_size,
+        "repeat": repeat,
+        "documents": documents,
+        "characters": characters,
+        "latency_s": {
+            "mean": mean,
+            "min": min(latencies),
+            "p50": percentile(latencies, 0.50),
+            "p90": percentile(latencies, 0.90),
+            "p99": percentile(latencies, 0.99),
+        },
+        "throughput": {"files_per_s": 1 / mean, "mb_per_s": file_size / mean / 1e6},
+        "stages_s": stages,
+        "llm_calls_per_load": ((llm.calls - llm_calls_before) / repeat) if llm else 0,
+        "peak_rss_bytes": _peak_rss_bytes(),
+    }
+    if serial_latencies:
+        result["serial_latency_s"] = {"p50": percentile(serial_latencies, 0.50)}
+        result["speedup"] = result["serial_latency_s"]["p50"] / result["latency_s"]["p50"]
+    return result
+
+
+def _environment() -> Dict[str, Any]:
+    try:
+        from markitdown import __version__ as markitdown_version
+    except ImportError:
+        markitdown_version = None
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "git_commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "markitdown": markitdown_version,
+    }
+
+
+def _run_isolated(args: argparse.Namespace, file_format: str, scale: str) -> Dict[str, Any]:
+    """Run one case in a fresh interpreter and parse its JSON result."""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [ROOT, os.path.join(ROOT, "src"), env.get("PYTHONPATH")]))
+    command = [
+        sys.executable, "-m", "benchmarks.run", "--case", f"{file_format}:{scale}",
+        "--repeat", str(args.repeat), "--corpus-dir", args.corpus_dir,
+        "--caption-latency", str(args.caption_latency),
+    ]
+    output = subprocess.run(command, env=env, cwd=ROOT, capture_output=True, text=True, check=True).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--formats", nargs="+", default=FORMATS, choices=FORMATS)
+    parser.add_argument("--scales", nargs="+", default=["small", "medium"], choices=SCALES)
+    parser.add_argument("--repeat", type=int, default=5, help="Timed loads per case (after one warm-up load)")
+    parser.add_argument("--caption-latency", type=float, default=0.05, help="Seconds per fake caption call")
+    parser.add_argument("--corpus-dir", default=DEFAULT_CORPUS_DIR)
+    parser.add_argument("--output", help="Write JSON results to this file (default: stdout)")
+    parser.add_argument("--case", help=argparse.SUPPRESS)  # Internal: run one case in this process
+    args = parser.parse_args(argv)
+
+    if args.case:
+        file_format, scale = args.case.split(":")
+        print(json.dumps(run_case(file_format, scale, args.repeat, args.corpus_dir, args.caption_latency)))
+        return
+
+    results = []
+    for file_format in args.formats:
+        for scale in args.scales:
+            result = _run_isolated(args, file_format, scale)
+            results.append(result)
+            print(
+                f"{file_format:>13} {scale:<6} p50={result['latency_s']['p50'] * 1000:9.1f} ms "
+                f"{result['throughput']['mb_per_s']:7.2f} MB/s "
+                f"rss={(result['peak_rss_bytes'] or 0) / 2**20:7.1f} MiB"
+                + (f" speedup={result['speedup']:.2f}x" if "speedup" in result else ""),
+                file=sys.stderr,
+            )
+
+    report = json.dumps({"environment": _environment(), "results": results}, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(report + "\n")
+    else:
+        print(report)
+
+
+if __name__ == "__main__":
+    main()
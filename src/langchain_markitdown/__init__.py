@@ -2,24 +2,77 @@
 #
 # SPDX-License-Identifier: MIT
 
-from .base_loader import BaseMarkitdownLoader
-from .audio_loader import AudioLoader
-from .bing_serp_loader import BingSerpLoader
-from .doc_intel_loader import DocIntelLoader
-from .docx_loader import DocxLoader
-from .epub_loader import EpubLoader
-from .html_loader import HtmlLoader
-from .image_loader import ImageLoader
-from .ipynb_loader import IpynbLoader
-from .outlook_msg_loader import OutlookMsgLoader
-from .pdf_loader import PdfLoader
-from .plain_text_loader import PlainTextLoader
-from .pptx_loader import PptxLoader
-from .rss_loader import RssLoader
-from .wikipedia_loader import WikipediaLoader
-from .xlsx_loader import XlsxLoader
-from .youtube_loader import YoutubeLoader
-from .zip_loader import ZipLoader
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from .base_loader import BaseMarkitdownLoader
+    from .converter_pool import get_converter, clear_converters
+    from .concurrency import set_max_concurrency, get_max_concurrency
+    from .caption_cache import BaseCaptionCache, InMemoryCaptionCache, SQLiteCaptionCache
+    from .conversion_cache import ConversionCache
+    from .image_preprocessing import ImagePreprocessor
+    from .instrumentation import LoadStats, LoaderHooks, LoggingHooks, register_hooks, unregister_hooks
+    from .markdown_chunker import MarkdownChunker
+    from .audio_loader import AudioLoader
+    from .bing_serp_loader import BingSerpLoader
+    from .doc_intel_loader import DocIntelLoader
+    from .docx_loader import DocxLoader
+    from .epub_loader import EpubLoader
+    from .html_loader import HtmlLoader
+    from .image_loader import ImageLoader
+    from .ipynb_loader import IpynbLoader
+    from .outlook_msg_loader import OutlookMsgLoader
+    from .pdf_loader import PdfLoader
+    from .plain_text_loader import PlainTextLoader
+    from .pptx_loader import PptxLoader
+    from .rss_loader import RssLoader
+    from .wikipedia_loader import WikipediaLoader
+    from .xlsx_loader import XlsxLoader
+    from .youtube_loader import YoutubeLoader
+    from .zip_loader import ZipLoader
+    from .directory_loader import MarkitdownDirectoryLoader
+    from .manifest import FileManifest
+
+# Public name -> submodule defining it. Submodules are imported on first attribute
+# access (PEP 562), so importing the package stays cheap for short-lived processes.
+_LAZY_ATTRIBUTES = {
+    "BaseMarkitdownLoader": "base_loader",
+    "get_converter": "converter_pool",
+    "clear_converters": "converter_pool",
+    "set_max_concurrency": "concurrency",
+    "get_max_concurrency": "concurrency",
+    "BaseCaptionCache": "caption_cache",
+    "InMemoryCaptionCache": "caption_cache",
+    "SQLiteCaptionCache": "caption_cache",
+    "ConversionCache": "conversion_cache",
+    "ImagePreprocessor": "image_preprocessing",
+    "LoadStats": "instrumentation",
+    "LoaderHooks": "instrumentation",
+    "LoggingHooks": "instrumentation",
+    "register_hooks": "instrumentation",
+    "unregister_hooks": "instrumentation",
+    "MarkdownChunker": "markdown_chunker",
+    "AudioLoader": "audio_loader",
+    "BingSerpLoader": "bing_serp_loader",
+    "DocIntelLoader": "doc_intel_loader",
+    "DocxLoader": "docx_loader",
+    "EpubLoader": "epub_loader",
+    "HtmlLoader": "html_loader",
+    "ImageLoader": "image_loader",
+    "IpynbLoader": "ipynb_loader",
+    "OutlookMsgLoader": "outlook_msg_loader",
+    "PdfLoader": "pdf_loader",
+    "PlainTextLoader": "plain_text_loader",
+    "PptxLoader": "pptx_loader",
+    "RssLoader": "rss_loader",
+    "WikipediaLoader": "wikipedia_loader",
+    "XlsxLoader": "xlsx_loader",
+    "YoutubeLoader": "youtube_loader",
+    "ZipLoader": "zip_loader",
+    "MarkitdownDirectoryLoader": "directory_loader",
+    "FileManifest": "manifest",
+}
 
 __all__ = [
     "BaseMarkitdownLoader",
@@ -40,4 +93,34 @@ __all__ = [
     "XlsxLoader",
     "YoutubeLoader",
     "ZipLoader",
-]
\ No newline at end of file
+    "MarkitdownDirectoryLoader",
+    "FileManifest",
+    "get_converter",
+    "clear_converters",
+    "set_max_concurrency",
+    "get_max_concurrency",
+    "BaseCaptionCache",
+    "InMemoryCaptionCache",
+    "SQLiteCaptionCache",
+    "ConversionCache",
+    "ImagePreprocessor",
+    "LoadStats",
+    "LoaderHooks",
+    "LoggingHooks",
+    "register_hooks",
+    "unregister_hooks",
+    "MarkdownChunker",
+]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value  # Cache so later lookups bypass __getattr__
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1,8 +1,22 @@
-from langchain_markitdown.base_loader import BaseMarkitdownLoader
+from typing import Any, Optional, Sequence
+from langchain_markitdown.base_loader import BaseMarkitdownLoader, Source
+from langchain_markitdown.conversion_cache import ConversionCache
+from langchain_markitdown.instrumentation import LoaderHooks
 
 class AudioLoader(BaseMarkitdownLoader):
     """Loader for audio files."""
 
-    def __init__(self, file_path: str):
+    def __init__(
+        self,
+        file_path: Source,
+        converter: Optional[Any] = None,
+        conversion_cache: Optional[ConversionCache] = None,
+        hooks: Optional[Sequence[LoaderHooks]] = None,
+        record_stats: bool = False,
+        stream_info: Optional[Any] = None,
+    ):
         """Initialize with file path."""
-        super().__init__(file_path)
\ No newline at end of file
+        super().__init__(
+            file_path, converter=converter, conversion_cache=conversion_cache, hooks=hooks,
+            record_stats=record_stats, stream_info=stream_info,
+        )
\ No newline at end of file
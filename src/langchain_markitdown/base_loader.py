@@ -1,10 +1,34 @@
-from langchain_core.document_loaders import BaseLoader
-from typing import List
+from typing import TYPE_CHECKING, Any, AsyncIterator, BinaryIO, Callable, ContextManager, Dict, Iterator, List, Optional, Sequence, Tuple, Union
 from langchain_core.documents import Document
+from .converter_pool import converter_config, get_converter
+from .concurrency import get_async_semaphore
+from .conversion_cache import ConversionCache
+from .instrumentation import LoaderHooks, instrumented
+from .shared_metadata import SharedMetadata
+from .source_buffer import SourceBuffer, ViewReader
+from contextlib import nullcontext
+import hashlib
+import importlib.abc
 import os
+import sys
 
 import logging
 
+if TYPE_CHECKING:
+    from markitdown import StreamInfo
+    from .markdown_chunker import MarkdownChunker
+
+# A loader reads from a filesystem path, or from content already in memory or in a
+# seekable binary stream (e.g. a blob fetched from object storage).
+Source = Union[str, "os.PathLike[str]", bytes, bytearray, memoryview, BinaryIO]
+
+
+def open_source(source: Union[str, bytes, memoryview]) -> BinaryIO:
+    """Open a path or in-memory bytes as a binary file (used inside pool workers)."""
+    if isinstance(source, str):
+        return open(source, "rb")
+    return ViewReader(source)
+
 module_logger = logging.getLogger(__name__)  # Get the logger for this module
 module_logger.setLevel(logging.WARNING)  # Default level
 
@@ -15,11 +39,59 @@ if not module_logger.hasHandlers():
     ch.setFormatter(formatter)
     module_logger.addHandler(ch)
 
-class BaseMarkitdownLoader(BaseLoader):
-    """Base class for Markitdown document loaders."""
+class BaseMarkitdownLoader:
+    """Base class for Markitdown document loaders.
+
+    ``file_path`` may also be ``bytes``, a ``memoryview`` or a seekable binary stream, in
+    which case ``stream_info`` (a ``markitdown.StreamInfo``) should name the file or its
+    extension so MarkItDown picks the right converter. Nothing is written to disk.
+
+    With a ``chunker`` (a MarkdownChunker), the markdown is yielded as header-aware,
+    size-bounded chunks instead of one Document.
 
-    def __init__(self, file_path: str, verbose: bool = False):  # Add verbose parameter
-        self.file_path = file_path
+    Each load reads its input once, into a SourceBuffer (memory-mapped for large files)
+    that every consumer shares through zero-copy views; it is released when the load ends.
+
+    Loaders implement LangChain's ``BaseLoader`` interface and are registered as virtual
+    subclasses of it, so ``isinstance(loader, BaseLoader)`` holds without importing it here:
+    its module pulls in the runnables, callbacks and chat-model machinery.
+    """
+
+    def __init__(
+        self,
+        file_path: Source,
+        verbose: bool = False,  # Add verbose parameter
+        converter: Optional[Any] = None,
+        max_concurrency: Optional[int] = None,
+        conversion_cache: Optional[ConversionCache] = None,
+        hooks: Optional[Sequence[LoaderHooks]] = None,
+        record_stats: bool = False,
+        stream_info: Optional["StreamInfo"] = None,
+        chunker: Optional["MarkdownChunker"] = None,
+    ):
+        self.stream_info = stream_info  # Optional hint: filename, extension, mimetype, url
+        self.chunker = chunker  # Optional splitter into retrieval-sized chunks
+        self._stream_start = 0
+        if isinstance(file_path, (str, os.PathLike)):
+            self.file_path = os.fspath(file_path)
+            self._content: Any = None  # Bytes, memoryview or stream given instead of a path
+        else:
+            self._content = file_path
+            if not isinstance(file_path, (bytes, bytearray, memoryview)):
+                self._stream_start = file_path.tell()
+            # Used as the "source" metadata and in log and error messages
+            self.file_path = (
+                stream_info and (stream_info.local_path or stream_info.url or stream_info.filename)
+            ) or "<stream>"
+        self.converter = converter  # Optional pre-built MarkItDown instance; defaults to the shared pool
+        self.max_concurrency = max_concurrency  # Per-loader async cap; defaults to the process-wide semaphore
+        self.conversion_cache = conversion_cache  # Optional on-disk cache of converted markdown
+        self.hooks = list(hooks or [])  # Instrumentation callbacks, in addition to globally registered ones
+        self.record_stats = record_stats  # Add per-file timings and counters to metadata["load_stats"]
+        self._semaphore = None
+        self._stats = None  # LoadStats of the load in progress, when instrumented
+        self._source_buffer: Optional[SourceBuffer] = None  # Input of the load in progress
+        self._load_depth = 0
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")  # Create a logger for this instance
 
         # Set the level for this instance, but rely on the module-level handler
@@ -27,20 +99,176 @@ class BaseMarkitdownLoader(BaseLoader):
             self.logger.setLevel(logging.INFO)  # Set logging level for this instance if verbose is True
         
         self.logger.info(f"Initialized {self.__class__.__name__} for {file_path}")  # Use instance logger
-    def load(self) -> List[Document]:  # Specify return type as List[Document]
-        from markitdown import MarkItDown
+
+    def _get_converter(self):
+        """Return the injected converter, or the shared pooled MarkItDown instance."""
+        if self.converter is not None:
+            return self.converter
+        return get_converter()
+
+    def _stage(self, name: str) -> ContextManager[None]:
+        """Time a block as the given stage of the current (instrumented) load."""
+        if self._stats is None:
+            return nullcontext()
+        return self._stats.stage(name)
+
+    def _count(self, name: str, value: int = 1) -> None:
+        if self._stats is not None:
+            self._stats.count(name, value)
+
+    def _enter_load(self) -> None:
+        self._load_depth += 1
+
+    def _exit_load(self) -> None:
+        """Release the source buffer once the outermost load finishes."""
+        self._load_depth -= 1
+        if self._load_depth == 0 and self._source_buffer is not None:
+            self._source_buffer.close()
+            self._source_buffer = None
+
+    def _get_buffer(self) -> SourceBuffer:
+        """Return the load's SourceBuffer, reading (or mapping) the input on first use."""
+        if self._source_buffer is not None:
+            return self._source_buffer
+        if self._content is None:
+            buffer = SourceBuffer.from_path(self.file_path)
+        elif isinstance(self._content, (bytes, bytearray, memoryview)):
+            buffer = SourceBuffer(self._content)
+        else:
+            buffer = SourceBuffer.from_stream(self._content, self._stream_start)
+        if self._load_depth:
+            self._source_buffer = buffer  # Otherwise not inside a load: nothing would release it
+        return buffer
+
+    def _read_bytes(self) -> memoryview:
+        """Return a zero-copy view of the whole source content."""
+        return self._get_buffer().view
+
+    def _open_source(self) -> BinaryIO:
+        """Open the source as a binary file positioned at its start."""
+        return self._get_buffer().reader()
+
+    def _worker_source(self, use_processes: bool = False) -> Union[str, bytes, memoryview]:
+        """The source in a form pool workers can open with ``open_source``.
+
+        Thread workers share the load's view; process workers reopen the path, or are sent
+        a copy of in-memory content.
+        """
+        if not use_processes:
+            return self._read_bytes()
+        if self._content is None:
+            return self.file_path
+        return self._read_bytes().tobytes()
+
+    def _parallel_converter(self, use_processes: bool) -> Tuple[Optional[Any], bool]:
+        """The converter to hand to parallel workers, and whether they run in processes.
+
+        An injected converter cannot be sent to other processes, so its units run on
+        threads; process workers otherwise build their own pooled converter (None).
+        """
+        if self.converter is not None or not use_processes:
+            return self._get_converter(), False
+        return None, True
+
+    def _get_stream_info(self, extension: Optional[str] = None) -> "StreamInfo":
+        """Describe the source for MarkItDown, letting the caller's hint take precedence."""
+        from markitdown import StreamInfo
+        file_name = self._get_file_name(self.file_path)
+        stream_info = StreamInfo(
+            local_path=self.file_path if self._content is None else None,
+            extension=extension or os.path.splitext(file_name)[1] or None,
+            filename=file_name or None,
+        )
+        if self.stream_info is not None:
+            stream_info = stream_info.copy_and_update(self.stream_info)
+        return stream_info
+
+    def _convert_markdown(
+        self,
+        data: Optional[Union[bytes, memoryview]] = None,
+        extension: Optional[str] = None,
+        convert: Optional[Callable[[], str]] = None,
+    ) -> str:
+        """Convert the file (or its already-read bytes) to markdown, consulting the conversion cache.
+
+        Cache entries are keyed by the content digest, the loader class, the converter's
+        configuration and the parts of the stream info hint that pick a converter.
+        ``convert`` replaces the single-stream conversion (e.g. with a parallel one) on a
+        cache miss; it must produce the same markdown, as it shares the cache entry.
+        """
+        converter = self._get_converter()
+        if data is None:
+            with self._stage("read"):
+                data = self._read_bytes()
+
+        stream_info = self._get_stream_info(extension)
+        key = None
+        if self.conversion_cache is not None:
+            digest = hashlib.sha256(data).hexdigest()
+            options = {
+                "converter": converter_config(converter),
+                "stream_info": {
+                    "extension": stream_info.extension,
+                    "mimetype": stream_info.mimetype,
+                    "charset": stream_info.charset,
+                    "url": stream_info.url,
+                },
+            }
+            key = self.conversion_cache.make_key(digest, self.__class__.__name__, options)
+            markdown_content = self.conversion_cache.get(key)
+            if markdown_content is not None:
+                self.logger.info(f"Conversion cache hit for {self.file_path}")
+                self._count("conversion_cache_hits")
+                return markdown_content
+
+        with self._stage("convert"):
+            if convert is not None:
+                markdown_content = convert()
+            else:
+                markdown_content = converter.convert_stream(ViewReader(data), stream_info=stream_info).text_content
+        if key is not None:
+            self.conversion_cache.set(key, markdown_content)
+        return markdown_content
+
+    def _chunk_documents(
+        self,
+        markdown_content: str,
+        metadata: Dict[str, Any],
+        chunker: Optional["MarkdownChunker"] = None,
+        shared: Optional[SharedMetadata] = None,
+        fields: Optional[Dict[str, Any]] = None,
+    ) -> Iterator[Document]:
+        """Yield one Document per chunk, with its heading path and index added to the metadata.
+
+        Loaders chunking several parts of one file (e.g. slides) pass the file's ``shared``
+        metadata and each part's own ``fields``. Content made only of headings (e.g. a
+        title-only slide) is kept as a single chunk.
+        """
+        shared = shared or SharedMetadata(metadata)
+        fields = fields or {}
+        index = -1
+        for index, chunk in enumerate((chunker or self.chunker).iter_chunks(markdown_content)):
+            chunk_fields: Dict[str, Any] = {**fields, "chunk_index": index}
+            for name, title in chunk.headers.items():
+                if name not in metadata and name not in fields:  # File-level metadata wins, as with dict.update
+                    chunk_fields[name] = title
+            yield shared.document(chunk.content, chunk_fields)
+        if index < 0 and markdown_content.strip():
+            yield shared.document(markdown_content.strip(), {**fields, "chunk_index": 0})
+
+    @instrumented
+    def lazy_load(self) -> Iterator[Document]:
+        """Lazily convert the file and yield its Document (or its chunks)."""
         metadata = {"source": self.file_path, "success": False}
         try:
             file_name = self._get_file_name(self.file_path)
             metadata["file_name"] = file_name
             file_size = self._get_file_size(self.file_path)
             metadata["file_size"] = file_size
-            converter = MarkItDown()
             try:
-                markdown_content = converter.convert(self.file_path).text_content
+                markdown_content = self._convert_markdown()
                 metadata["success"] = True
                 document = Document(page_content=markdown_content, metadata=metadata)
-                return [document]
             except Exception as e:
                 metadata["success"] = False
                 metadata["error"] = str(e)
@@ -52,11 +280,103 @@ class BaseMarkitdownLoader(BaseLoader):
         except Exception as e:
             metadata["error"] = str(e)
             raise ValueError(f"Markitdown conversion failed for {self.file_path}: {e}")
+        if self.chunker is None:
+            yield document
+        else:
+            yield from self._chunk_documents(markdown_content, metadata)
+
+    def load(self) -> List[Document]:  # Specify return type as List[Document]
+        return list(self.lazy_load())
+
+    def _get_semaphore(self):
+        """Return the semaphore that bounds this loader's in-flight async work."""
+        if self.max_concurrency is None:
+            return get_async_semaphore()
+        if self._semaphore is None:
+            self._semaphore = get_async_semaphore(self.max_concurrency)
+        return self._semaphore
+
+    async def alazy_load(self) -> AsyncIterator[Document]:
+        """Asynchronously yield Documents, running each conversion step in an executor."""
+        # Imported here: langchain_core.runnables pulls in the callbacks, messages and
+        # language model modules, which synchronous loads never need
+        from langchain_core.runnables.config import run_in_executor
+
+        semaphore = self._get_semaphore()
+        async with semaphore:
+            iterator = await run_in_executor(None, self.lazy_load)
+        done = object()
+        while True:
+            async with semaphore:
+                doc = await run_in_executor(None, next, iterator, done)
+            if doc is done:
+                break
+            yield doc
+
+    async def aload(self) -> List[Document]:
+        return [doc async for doc in self.alazy_load()]
+
+    def load_and_split(self, text_splitter: Optional[Any] = None) -> List[Document]:
+        """Load Documents and split them with ``text_splitter`` (LangChain's default splitter if None)."""
+        if text_splitter is None:
+            try:
+                from langchain_text_splitters import RecursiveCharacterTextSplitter
+            except ImportError as e:
+                raise ImportError(
+                    "Unable to import from langchain_text_splitters. Please specify text_splitter "
+                    "or install langchain_text_splitters with `pip install -U langchain-text-splitters`."
+                ) from e
+            text_splitter = RecursiveCharacterTextSplitter()
+        return text_splitter.split_documents(self.load())
+
+    def _get_file_name(self, file_path: Optional[str] = None) -> str:
+        """Extract the file name from the stream hint or the file path."""
+        if self._content is not None:
+            hint = self.stream_info
+            if hint is None:
+                return ""
+            return hint.filename or os.path.basename(hint.local_path or "")
+        return os.path.basename(file_path or self.file_path)
+
+    def _get_file_size(self, file_path: Optional[str] = None) -> int:
+        """Get the size of the source in bytes."""
+        if file_path is not None and file_path != self.file_path:
+            return os.path.getsize(file_path)
+        if self._content is None and not self._load_depth:
+            return os.path.getsize(self.file_path)  # Outside a load: no need to read the file
+        return self._get_buffer().size
+
+
+_BASE_LOADER_MODULE = "langchain_core.document_loaders.base"
+
+
+class _BaseLoaderRegistration(importlib.abc.MetaPathFinder):
+    """Registers BaseMarkitdownLoader with LangChain's BaseLoader when its module is imported."""
+
+    def find_spec(self, name, path=None, target=None):
+        if name != _BASE_LOADER_MODULE:
+            return None
+        sys.meta_path.remove(self)
+        for finder in sys.meta_path:
+            spec = finder.find_spec(name, path, target) if hasattr(finder, "find_spec") else None
+            if spec is not None:
+                break
+        else:
+            return None
+        if spec.loader is None:
+            return spec
+        exec_module = spec.loader.exec_module
+
+        def exec_and_register(module):
+            exec_module(module)
+            module.BaseLoader.register(BaseMarkitdownLoader)
+
+        spec.loader.exec_module = exec_and_register
+        return spec
+
 
-    def _get_file_name(self, file_path: str) -> str:
-        """Extract the file name from the file path."""
-        return os.path.basename(file_path)
+if _BASE_LOADER_MODULE in sys.modules:
+    sys.modules[_BASE_LOADER_MODULE].BaseLoader.register(BaseMarkitdownLoader)
+else:
+    sys.meta_path.insert(0, _BaseLoaderRegistration())
 
-    def _get_file_size(self, file_path: str) -> int:
-        """Get the size of the file in bytes."""
-        return os.path.getsize(file_path)
@@ -0,0 +1,157 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+
+def model_identity(llm: Any) -> str:
+    """Return a stable identifier for a chat model (class plus model name, if any)."""
+    if llm is None:
+        return ""
+    name = None
+    for attr in ("model_name", "model", "model_id", "deployment_name"):
+        value = getattr(llm, attr, None)
+        if isinstance(value, str) and value:
+            name = value
+            break
+    return f"{llm.__class__.__module__}.{llm.__class__.__qualname__}:{name or ''}"
+
+
+def make_caption_key(image_data: bytes, prompt: str, llm: Any) -> str:
+    """Content-addressed cache key over (image digest, prompt, model identity)."""
+    digest = hashlib.sha256()
+    digest.update(hashlib.sha256(image_data).digest())
+    digest.update(b"\0")
+    digest.update(prompt.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(model_identity(llm).encode("utf-8"))
+    return digest.hexdigest()
+
+
+class BaseCaptionCache(ABC):
+    """Interface for image caption caches, with hit/miss counters."""
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def lookup(self, key: str) -> Optional[str]:
+        """Return the cached caption for ``key`` and update the hit/miss counters."""
+        caption = self.get(key)
+        with self._lock:
+            if caption is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return caption
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached caption for ``key``, or None."""
+
+    @abstractmethod
+    def set(self, key: str, caption: str) -> None:
+        """Store ``caption`` under ``key``, evicting old entries if needed."""
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Number of cached captions."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove every cached caption and reset the counters."""
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "size": len(self)}
+
+
+class InMemoryCaptionCache(BaseCaptionCache):
+    """Thread-safe in-memory LRU caption cache bounded by entry count."""
+
+    def __init__(self, max_entries: int = 1024):
+        super().__init__()
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            caption = self._entries.get(key)
+            if caption is not None:
+                self._entries.move_to_end(key)
+            return caption
+
+    def set(self, key: str, caption: str) -> None:
+        with self._lock:
+            self._entries[key] = caption
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+class SQLiteCaptionCache(BaseCaptionCache):
+    """On-disk caption cache in a SQLite file, evicting least recently used entries."""
+
+    def __init__(self, path: str, max_entries: int = 100_000):
+        super().__init__()
+        self.path = path
+        self.max_entries = max_entries
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS captions ("
+                "key TEXT PRIMARY KEY, caption TEXT NOT NULL, accessed REAL NOT NULL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS captions_accessed ON captions (accessed)")
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock, self._conn:
+            row = self._conn.execute("SELECT caption FROM captions WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            self._conn.execute("UPDATE captions SET accessed = ? WHERE key = ?", (time.time(), key))
+            return row[0]
+
+    def set(self, key: str, caption: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO captions (key, caption, accessed) VALUES (?, ?, ?)",
+                (key, caption, time.time()),
+            )
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM captions").fetchone()
+            if count > self.max_entries:
+                self._conn.execute(
+                    "DELETE FROM captions WHERE key IN "
+                    "(SELECT key FROM captions ORDER BY accessed ASC LIMIT ?)",
+                    (count - self.max_entries,),
+                )
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM captions").fetchone()
+        return count
+
+    def clear(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM captions")
+            self.hits = 0
+            self.misses = 0
+
+    def close(self) -> None:
+        self._conn.close()
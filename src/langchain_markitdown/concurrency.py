@@ -0,0 +1,47 @@
+import os
+import threading
+import weakref
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:  # asyncio is only needed once async loading is used
+    import asyncio
+
+# Default cap on in-flight async work (conversions offloaded to the executor
+# and LLM captioning calls). Semaphores are created lazily per event loop so
+# the limit can be shared by every loader running on the same loop.
+_max_concurrency: int = min(32, (os.cpu_count() or 1) + 4)
+_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = weakref.WeakKeyDictionary()
+_lock = threading.Lock()
+
+
+def set_max_concurrency(max_concurrency: int) -> None:
+    """Set the process-wide cap on in-flight async loader work."""
+    global _max_concurrency
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1")
+    with _lock:
+        _max_concurrency = max_concurrency
+        _semaphores.clear()
+
+
+def get_max_concurrency() -> int:
+    """Return the process-wide cap on in-flight async loader work."""
+    return _max_concurrency
+
+
+def get_async_semaphore(max_concurrency: Optional[int] = None) -> "asyncio.Semaphore":
+    """Return the semaphore bounding async work on the running event loop.
+
+    Passing ``max_concurrency`` returns a fresh, unshared semaphore instead.
+    """
+    import asyncio
+
+    if max_concurrency is not None:
+        return asyncio.Semaphore(max_concurrency)
+    loop = asyncio.get_running_loop()
+    with _lock:
+        semaphore = _semaphores.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(_max_concurrency)
+            _semaphores[loop] = semaphore
+    return semaphore
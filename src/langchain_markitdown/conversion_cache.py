@@ -0,0 +1,144 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import zlib
+from typing import Any, Dict, Optional
+
+# Eviction frees space down to this fraction of max_bytes, so a full cache does not
+# rescan its directory on every write.
+EVICT_TO = 0.9
+
+
+def _markitdown_version() -> str:
+    try:
+        from markitdown import __version__
+        return __version__
+    except ImportError:
+        return ""
+
+
+class ConversionCache:
+    """On-disk cache of converted markdown, keyed by content digest and conversion settings.
+
+    Converted markdown is a pure function of the file bytes, the loader, the MarkItDown
+    version and the converter configuration, so repeated loads (e.g. re-chunking
+    experiments) can skip conversion entirely. Entries are stored one per file under
+    ``directory``, optionally zlib-compressed. When the total size exceeds ``max_bytes``
+    the least recently used entries are evicted down to ``EVICT_TO`` of it (reads bump an
+    entry's mtime). Writes are atomic, so several processes may share one directory. A
+    damaged entry is deleted and counted as a miss.
+    """
+
+    def __init__(self, directory: str, max_bytes: int = 1 << 30, compress: bool = True):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.compress = compress
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        self._total_bytes = sum(os.path.getsize(path) for path in self._entry_paths())
+
+    @staticmethod
+    def make_key(content_digest: str, loader: str, options: Optional[Dict[str, Any]] = None) -> str:
+        """Key over (content digest, loader class, MarkItDown version, conversion options).
+
+        Loaders pass the converter configuration and stream info hint as ``options``.
+        """
+        payload = json.dumps(
+            [content_digest, loader, _markitdown_version(), options or {}], sort_keys=True, default=str
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], key + (".md.z" if self.compress else ".md"))
+
+    def _entry_paths(self):
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                if name.endswith((".md", ".md.z")):
+                    yield os.path.join(root, name)
+
+    def get(self, key: str) -> Optional[str]:
+        path = self._path(key)
+        try:
+            with open(path, "rb") as file:
+                data = file.read()
+            os.utime(path)  # Mark as recently used
+        except OSError:
+            with self._lock:
+                self.misses += 1
+            return None
+        try:
+            markdown = (zlib.decompress(data) if self.compress else data).decode("utf-8")
+        except (zlib.error, UnicodeDecodeError):  # Truncated or corrupt entry
+            self._discard(path, len(data))
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+        return markdown
+
+    def _discard(self, path: str, size: int) -> None:
+        try:
+            os.remove(path)
+        except OSError:
+            return
+        with self._lock:
+            self._total_bytes = max(0, self._total_bytes - size)
+
+    def set(self, key: str, markdown: str) -> None:
+        data = markdown.encode("utf-8")
+        if self.compress:
+            data = zlib.compress(data)
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        with os.fdopen(fd, "wb") as file:
+            file.write(data)
+        previous = os.path.getsize(path) if os.path.exists(path) else 0
+        os.replace(tmp_path, path)
+        with self._lock:
+            self._total_bytes += len(data) - previous
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+
+    def _evict(self) -> None:
+        """Delete least recently used entries until the cache is down to EVICT_TO of max_bytes."""
+        entries = []
+        for path in self._entry_paths():
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+        entries.sort()
+        self._total_bytes = sum(size for _, size, _ in entries)
+        target = self.max_bytes * EVICT_TO
+        for _, size, path in entries:
+            if self._total_bytes <= target:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            self._total_bytes -= size
+
+    @property
+    def size_bytes(self) -> int:
+        return self._total_bytes
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "size_bytes": self._total_bytes}
+
+    def clear(self) -> None:
+        with self._lock:
+            for path in list(self._entry_paths()):
+                os.remove(path)
+            self._total_bytes = 0
+            self.hits = 0
+            self.misses = 0
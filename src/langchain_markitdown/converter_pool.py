@@ -0,0 +1,76 @@
+import threading
+from typing import Any, Dict, Hashable, Tuple
+
+# Process-wide registry of MarkItDown instances, keyed by their configuration.
+# Building a MarkItDown registers every builtin converter (and optionally
+# discovers plugins), so loaders share one warmed-up instance per configuration
+# instead of constructing a new one for every file.
+_converters: Dict[Tuple[Tuple[str, Hashable], ...], Tuple[Any, Dict[str, Any]]] = {}
+_lock = threading.Lock()
+
+
+def _config_key(config: Dict[str, Any]) -> Tuple[Tuple[str, Hashable], ...]:
+    """Build a hashable key from converter keyword arguments.
+
+    Unhashable values (LLM clients, credentials, sessions) are keyed by identity.
+    The pool keeps a reference to the original config so those ids stay valid.
+    """
+    key = []
+    for name, value in sorted(config.items()):
+        try:
+            hash(value)
+        except TypeError:
+            value = ("__id__", id(value))
+        key.append((name, value))
+    return tuple(key)
+
+
+def get_converter(enable_plugins: bool = False, **kwargs: Any):
+    """Return a shared MarkItDown instance for the given configuration.
+
+    Accepts the same keyword arguments as ``MarkItDown`` (``llm_client``,
+    ``llm_model``, ``docintel_endpoint``, ...). Instances are created once per
+    configuration and reused by every caller in the process; creation is
+    guarded by a lock so concurrent threads never build duplicates.
+    """
+    config = dict(kwargs, enable_plugins=enable_plugins)
+    key = _config_key(config)
+
+    entry = _converters.get(key)
+    if entry is not None:
+        return entry[0]
+
+    with _lock:
+        entry = _converters.get(key)
+        if entry is None:
+            from markitdown import MarkItDown
+            entry = (MarkItDown(**config), config)
+            _converters[key] = entry
+    return entry[0]
+
+
+def _describe(value: Any) -> Any:
+    """A JSON-friendly description of one config value; objects are described by identity."""
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return f"{type(value).__module__}.{type(value).__qualname__}@{id(value):x}"
+
+
+def converter_config(converter: Any) -> Dict[str, Any]:
+    """Describe a converter's configuration, e.g. for conversion cache keys.
+
+    Pooled converters are described by the keyword arguments they were built with;
+    any other converter, and object-valued arguments such as an ``llm_client``, by
+    type and identity, so such descriptions only match within this process.
+    """
+    with _lock:
+        for instance, config in _converters.values():
+            if instance is converter:
+                return {name: _describe(value) for name, value in sorted(config.items())}
+    return {"converter": _describe(converter)}
+
+
+def clear_converters() -> None:
+    """Drop every pooled converter, e.g. after changing installed plugins."""
+    with _lock:
+        _converters.clear()
@@ -0,0 +1,104 @@
+import posixpath
+import zipfile
+from datetime import datetime, timezone
+from typing import Any, BinaryIO, Dict, Union
+from xml.etree import ElementTree
+
+from .source_buffer import ViewReader
+
+# Lightweight reader for OOXML (DOCX/PPTX/XLSX) core document properties.
+# Only the package relationships and docProps/core.xml are read from the zip,
+# so metadata no longer requires a full python-docx/python-pptx/openpyxl parse.
+
+_NAMESPACES = {
+    "cp": "http://schemas.openxmlformats.org/package/2006/metadata/core-properties",
+    "dc": "http://purl.org/dc/elements/1.1/",
+    "dcterms": "http://purl.org/dc/terms/",
+    "rel": "http://schemas.openxmlformats.org/package/2006/relationships",
+}
+_CORE_PROPERTIES_TYPE = "http://schemas.openxmlformats.org/package/2006/relationships/metadata/core-properties"
+_DEFAULT_PART = "docProps/core.xml"
+
+# Property name (as used by python-docx/python-pptx) -> element in core.xml
+_FIELDS = {
+    "author": "dc:creator",
+    "title": "dc:title",
+    "subject": "dc:subject",
+    "description": "dc:description",
+    "keywords": "cp:keywords",
+    "category": "cp:category",
+    "last_modified_by": "cp:lastModifiedBy",
+    "revision": "cp:revision",
+    "content_status": "cp:contentStatus",
+    "language": "dc:language",
+    "created": "dcterms:created",
+    "modified": "dcterms:modified",
+    "last_printed": "cp:lastPrinted",
+}
+_DATE_FIELDS = {"created", "modified", "last_printed"}
+
+
+def _parse_datetime(value: str, naive: bool = False) -> Union[datetime, str]:
+    """Parse a W3CDTF timestamp into a UTC datetime.
+
+    python-docx returns aware datetimes; python-pptx returns naive ones (``naive=True``).
+    """
+    text = value.strip()
+    if text.endswith("Z"):
+        text = text[:-1] + "+00:00"
+    try:
+        parsed = datetime.fromisoformat(text)
+    except ValueError:
+        return value
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    parsed = parsed.astimezone(timezone.utc)
+    return parsed.replace(tzinfo=None) if naive else parsed
+
+
+def _core_part_name(archive: zipfile.ZipFile) -> str:
+    """Locate the core properties part through the package relationships."""
+    try:
+        root = ElementTree.fromstring(archive.read("_rels/.rels"))
+    except (KeyError, ElementTree.ParseError):
+        return _DEFAULT_PART
+    for relationship in root.findall("rel:Relationship", _NAMESPACES):
+        if relationship.get("Type") == _CORE_PROPERTIES_TYPE:
+            return posixpath.normpath(relationship.get("Target", _DEFAULT_PART).lstrip("/"))
+    return _DEFAULT_PART
+
+
+def read_core_properties(source: Union[str, bytes, memoryview, BinaryIO], naive_datetimes: bool = False) -> Dict[str, Any]:
+    """Read the core properties of an OOXML package.
+
+    ``source`` may be a path, the package bytes or a seekable binary stream. Only
+    non-empty properties are returned; ``created``/``modified``/``last_printed`` are
+    UTC datetimes (naive with ``naive_datetimes=True``, matching python-pptx) and
+    ``revision`` is an int when it parses as one.
+    """
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        source = ViewReader(source)
+    with zipfile.ZipFile(source) as archive:
+        try:
+            xml = archive.read(_core_part_name(archive))
+        except KeyError:
+            return {}
+
+    root = ElementTree.fromstring(xml)
+    properties: Dict[str, Any] = {}
+    for name, tag in _FIELDS.items():
+        prefix, local = tag.split(":")
+        element = root.find(f"{{{_NAMESPACES[prefix]}}}{local}")
+        if element is None or not (element.text or "").strip():
+            continue
+        value: Any = element.text.strip()
+        if name in _DATE_FIELDS:
+            value = _parse_datetime(value, naive_datetimes)
+        elif name == "revision":
+            try:
+                value = int(value)
+            except ValueError:
+                pass
+        properties[name] = value
+    return properties
+
@@ -0,0 +1,353 @@
+import fnmatch
+import glob as globlib
+import hashlib
+import logging
+import os
+import uuid
+import zipfile
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Type, Union
+
+from langchain_core.document_loaders import BaseLoader
+from langchain_core.documents import Document
+
+from .base_loader import BaseMarkitdownLoader
+from .manifest import FileManifest, ManifestEntry
+from .source_buffer import SourceBuffer
+from .audio_loader import AudioLoader
+from .docx_loader import DocxLoader
+from .epub_loader import EpubLoader
+from .html_loader import HtmlLoader
+from .image_loader import ImageLoader
+from .ipynb_loader import IpynbLoader
+from .outlook_msg_loader import OutlookMsgLoader
+from .pdf_loader import PdfLoader
+from .plain_text_loader import PlainTextLoader
+from .pptx_loader import PptxLoader
+from .rss_loader import RssLoader
+from .xlsx_loader import XlsxLoader
+from .zip_loader import ZipLoader
+
+# Loader used for each file extension; anything else goes through BaseMarkitdownLoader,
+# which lets MarkItDown pick a converter itself.
+LOADER_BY_EXTENSION: Dict[str, Type[BaseMarkitdownLoader]] = {
+    ".pdf": PdfLoader,
+    ".docx": DocxLoader,
+    ".pptx": PptxLoader,
+    ".xlsx": XlsxLoader,
+    ".txt": PlainTextLoader,
+    ".md": PlainTextLoader,
+    ".csv": PlainTextLoader,
+    ".json": PlainTextLoader,
+    ".xml": PlainTextLoader,
+    ".html": HtmlLoader,
+    ".htm": HtmlLoader,
+    ".rss": RssLoader,
+    ".atom": RssLoader,
+    ".epub": EpubLoader,
+    ".ipynb": IpynbLoader,
+    ".msg": OutlookMsgLoader,
+    ".zip": ZipLoader,
+    ".jpg": ImageLoader,
+    ".jpeg": ImageLoader,
+    ".png": ImageLoader,
+    ".mp3": AudioLoader,
+    ".wav": AudioLoader,
+    ".m4a": AudioLoader,
+}
+
+# OOXML packages are zips; the top-level part directory tells them apart.
+_OOXML_PARTS = {"word/": ".docx", "ppt/": ".pptx", "xl/": ".xlsx"}
+
+_GLOB_CHARS = set("*?[")
+
+
+def sniff_extension(file_path: str) -> Optional[str]:
+    """Guess a file's extension from its leading bytes, for files with a missing or unknown suffix."""
+    try:
+        with open(file_path, "rb") as file:
+            header = file.read(8)
+    except OSError:
+        return None
+    if header.startswith(b"%PDF"):
+        return ".pdf"
+    if header.startswith(b"PK\x03\x04"):
+        try:
+            with zipfile.ZipFile(file_path) as archive:
+                for name in archive.namelist():
+                    for prefix, extension in _OOXML_PARTS.items():
+                        if name.startswith(prefix):
+                            return extension
+        except zipfile.BadZipFile:
+            return None
+        return ".zip"
+    if header.startswith(b"\xd0\xcf\x11\xe0"):
+        return ".msg"
+    return None
+
+
+def _manifest_key(file_path: str) -> str:
+    """Manifest entries are keyed by absolute path, so runs from another cwd agree."""
+    return os.path.abspath(file_path)
+
+
+def _glob_match(parts: List[str], pattern: List[str], recursive: bool) -> bool:
+    """Match path segments against glob segments, with ``**`` spanning directories when recursive."""
+    if not pattern:
+        return not parts
+    if recursive and pattern[0] == "**":
+        return any(
+            _glob_match(parts[index:], pattern[1:], recursive)
+            for index in range(len(parts) + 1)
+            if not any(part.startswith(".") for part in parts[:index])  # Like glob, ** skips hidden entries
+        )
+    if not parts or (parts[0].startswith(".") and not pattern[0].startswith(".")):
+        return False
+    return fnmatch.fnmatch(parts[0], pattern[0]) and _glob_match(parts[1:], pattern[1:], recursive)
+
+
+def _split(path: str) -> List[str]:
+    return [part for part in path.replace(os.sep, "/").split("/") if part]
+
+
+def _error_document(file_path: str, loader_cls: Type[BaseMarkitdownLoader], error: BaseException) -> Document:
+    metadata = {
+        "source": file_path,
+        "file_name": os.path.basename(file_path),
+        "conversion_success": False,
+        "error": str(error),
+        "loader": loader_cls.__name__,
+    }
+    return Document(page_content="", metadata=metadata)
+
+
+def _load_file(
+    file_path: str,
+    loader_cls: Type[BaseMarkitdownLoader],
+    loader_kwargs: Dict[str, Any],
+    content: Optional[memoryview] = None,
+) -> List[Document]:
+    """Load one file, turning any failure into an error Document (runs inside pool workers).
+
+    ``content`` is the file's already-read bytes, which the loader then uses instead of
+    reading the path again.
+    """
+    try:
+        if content is None:
+            return list(loader_cls(file_path, **loader_kwargs).lazy_load())
+        from markitdown import StreamInfo
+        stream_info = StreamInfo(local_path=file_path, filename=os.path.basename(file_path))
+        return list(loader_cls(content, stream_info=stream_info, **loader_kwargs).lazy_load())
+    except Exception as e:
+        return [_error_document(file_path, loader_cls, e)]
+
+
+def _load_if_changed(
+    file_path: str, loader_cls: Type[BaseMarkitdownLoader], loader_kwargs: Dict[str, Any], previous_digest: Optional[str]
+) -> Tuple[str, Optional[List[Document]]]:
+    """Hash the file and load it only if its digest differs from the manifest (runs inside pool workers).
+
+    The file is read once: the loader converts the same buffer that was hashed.
+    """
+    buffer = SourceBuffer.from_path(file_path)
+    try:
+        digest = hashlib.sha256(buffer.view).hexdigest()
+        if digest == previous_digest:
+            return digest, None
+        return digest, _load_file(file_path, loader_cls, loader_kwargs, buffer.view)
+    finally:
+        buffer.close()
+
+
+def _is_error(document: Document) -> bool:
+    return document.metadata.get("conversion_success") is False or document.metadata.get("success") is False
+
+
+class _Job(NamedTuple):
+    file_path: str
+    loader_cls: Type[BaseMarkitdownLoader]
+    stat: Optional[os.stat_result]
+    entry: Optional[ManifestEntry]
+
+
+class MarkitdownDirectoryLoader(BaseLoader):
+    """Load many files in parallel, dispatching each one to the matching Markitdown loader.
+
+    ``path`` may be a directory, a glob pattern, a single file, or an iterable of any of
+    these. Files are converted on a thread pool (or a process pool when
+    ``use_processes=True``) and their Documents are yielded as each file completes. A file
+    that fails to convert yields a single Document with ``conversion_success=False`` and an
+    ``error`` message instead of aborting the batch.
+
+    With a ``manifest``, re-runs only convert new or changed files. Unchanged files are
+    listed in ``skipped``, and files recorded in the manifest that this loader's paths and
+    glob would match but that are not found any more are reported in ``deleted``
+    (absolute path -> Document IDs). The IDs of Documents superseded by a changed or
+    deleted file are collected in ``stale_document_ids``. Entries outside this loader's
+    scope are left alone, so one manifest can be shared by several loaders. Documents
+    produced in manifest mode get deterministic IDs derived from the absolute path,
+    content digest and index.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Iterable[str]],
+        glob: str = "**/*",
+        recursive: bool = True,
+        loader_mapping: Optional[Dict[str, Type[BaseMarkitdownLoader]]] = None,
+        loader_kwargs: Optional[Dict[str, Dict[str, Any]]] = None,
+        max_workers: Optional[int] = None,
+        use_processes: bool = False,
+        manifest: Optional[FileManifest] = None,
+        verbose: bool = False,
+    ):
+        self.paths = [path] if isinstance(path, (str, os.PathLike)) else list(path)
+        self.glob = glob
+        self.recursive = recursive
+        self.loader_mapping = {**LOADER_BY_EXTENSION, **(loader_mapping or {})}
+        self.loader_kwargs = loader_kwargs or {}  # Per-extension constructor kwargs, e.g. {".pptx": {"split_by_page": True}}
+        self.max_workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
+        self.use_processes = use_processes
+        self.manifest = manifest
+        self.skipped: List[str] = []
+        self.deleted: Dict[str, List[str]] = {}
+        self.stale_document_ids: List[str] = []
+        self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+        if verbose:
+            self.logger.setLevel(logging.INFO)
+
+    def _iter_files(self) -> Iterator[str]:
+        """Expand directories and glob patterns into file paths, without duplicates."""
+        seen = set()
+        for path in self.paths:
+            path = os.fspath(path)
+            if os.path.isdir(path):
+                candidates = globlib.iglob(os.path.join(path, self.glob), recursive=self.recursive)
+            elif _GLOB_CHARS & set(path):
+                candidates = globlib.iglob(path, recursive=self.recursive)
+            else:
+                candidates = [path]
+            for candidate in candidates:
+                if candidate in seen or os.path.isdir(candidate):
+                    continue
+                seen.add(candidate)
+                yield candidate
+
+    def _in_scope(self, key: str) -> bool:
+        """True if this loader's paths and glob would pick up the (absolute) manifest path ``key``.
+
+        Only such entries can be reported as deleted, so loaders over other directories or
+        globs can share one manifest.
+        """
+        for path in self.paths:
+            path = os.fspath(path)
+            root = os.path.abspath(path)
+            if _GLOB_CHARS & set(path) and not os.path.isdir(path):
+                if _glob_match(_split(key), _split(root), self.recursive):
+                    return True
+            elif key == root:  # A single file
+                return True
+            elif key.startswith(os.path.join(root, "")):  # A directory (possibly removed since)
+                if _glob_match(_split(os.path.relpath(key, root)), _split(self.glob), self.recursive):
+                    return True
+        return False
+
+    def _resolve_loader(self, file_path: str) -> Type[BaseMarkitdownLoader]:
+        """Pick a loader class by extension, falling back to sniffing the file header."""
+        extension = os.path.splitext(file_path)[1].lower()
+        if extension not in self.loader_mapping:
+            extension = sniff_extension(file_path) or extension
+        return self.loader_mapping.get(extension, BaseMarkitdownLoader)
+
+    def _loader_kwargs_for(self, loader_cls: Type[BaseMarkitdownLoader], file_path: str) -> Dict[str, Any]:
+        extension = os.path.splitext(file_path)[1].lower()
+        kwargs = self.loader_kwargs.get(extension)
+        if kwargs is None:
+            kwargs = self.loader_kwargs.get(loader_cls.__name__, {})
+        return kwargs
+
+    def _make_executor(self) -> Executor:
+        if self.use_processes:
+            return ProcessPoolExecutor(max_workers=self.max_workers)
+        return ThreadPoolExecutor(max_workers=self.max_workers)
+
+    def lazy_load(self) -> Iterator[Document]:
+        """Yield Documents file by file as conversions complete (completion order)."""
+        self.skipped, self.deleted, self.stale_document_ids = [], {}, []
+        seen = set()
+        # Keep a bounded number of files in flight so huge trees are not enumerated up front
+        max_pending = self.max_workers * 2
+        with self._make_executor() as executor:
+            pending: Dict[Future, _Job] = {}
+            for file_path in self._iter_files():
+                seen.add(_manifest_key(file_path))
+                job = self._submit(executor, file_path)
+                if job is None:
+                    continue
+                pending[job[0]] = job[1]
+                if len(pending) >= max_pending:
+                    yield from self._drain(pending)
+            while pending:
+                yield from self._drain(pending)
+
+        if self.manifest is not None:
+            self.deleted = self.manifest.remove(
+                path for path in self.manifest.paths() if path not in seen and self._in_scope(path)
+            )
+            for document_ids in self.deleted.values():
+                self.stale_document_ids.extend(document_ids)
+
+    def _submit(self, executor: Executor, file_path: str) -> Optional[Tuple[Future, _Job]]:
+        """Schedule one file, or return None if the manifest shows it is unchanged."""
+        loader_cls = self._resolve_loader(file_path)
+        loader_kwargs = self._loader_kwargs_for(loader_cls, file_path)
+        if self.manifest is None:
+            self.logger.info(f"Dispatching {file_path} to {loader_cls.__name__}")
+            return executor.submit(_load_file, file_path, loader_cls, loader_kwargs), _Job(file_path, loader_cls, None, None)
+
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            stat = None
+        key = _manifest_key(file_path)
+        if stat is not None and self.manifest.is_unchanged(key, stat):
+            self.skipped.append(file_path)
+            return None
+        entry = self.manifest.get(key)
+        self.logger.info(f"Dispatching {file_path} to {loader_cls.__name__}")
+        future = executor.submit(_load_if_changed, file_path, loader_cls, loader_kwargs, entry.digest if entry else None)
+        return future, _Job(file_path, loader_cls, stat, entry)
+
+    def _drain(self, pending: Dict[Future, _Job]) -> Iterator[Document]:
+        """Wait for at least one file to finish and yield its Documents."""
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            job = pending.pop(future)
+            try:
+                result = future.result()
+            except Exception as e:  # e.g. a crashed worker process or unreadable file
+                self.logger.warning(f"Failed to load {job.file_path}: {e}")
+                result = [_error_document(job.file_path, job.loader_cls, e)]
+            if self.manifest is not None and isinstance(result, tuple):
+                result = self._update_manifest(job, *result)
+            yield from result
+
+    def _update_manifest(self, job: _Job, digest: str, documents: Optional[List[Document]]) -> List[Document]:
+        """Record a processed file in the manifest and assign deterministic Document IDs."""
+        size, mtime_ns = (job.stat.st_size, job.stat.st_mtime_ns) if job.stat else (0, 0)
+        key = _manifest_key(job.file_path)
+        if documents is None:
+            # Touched but not modified: refresh size/mtime so the next run skips it cheaply
+            self.skipped.append(job.file_path)
+            self.manifest.record(key, size, mtime_ns, digest, job.entry.document_ids)
+            return []
+        if any(_is_error(document) for document in documents):
+            return documents  # Not recorded, so the file is retried on the next run
+
+        for index, document in enumerate(documents):
+            if document.id is None:
+                document.id = str(uuid.uuid5(uuid.NAMESPACE_URL, f"{key}#{digest}#{index}"))
+        if job.entry is not None:
+            self.stale_document_ids.extend(job.entry.document_ids)
+        self.manifest.record(key, size, mtime_ns, digest, [document.id for document in documents])
+        return documents
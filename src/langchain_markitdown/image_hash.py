@@ -0,0 +1,76 @@
+import io
+from typing import List, NamedTuple, Optional, Sequence, Tuple, Union
+
+# Perceptual fingerprints used to spot the same artwork re-encoded at different sizes
+# or qualities (e.g. a template logo on every slide), so it is captioned only once.
+
+
+class ImageFingerprint(NamedTuple):
+    """A difference hash (dHash) plus the image's mean colour.
+
+    dHash only captures brightness gradients, so flat images of different colours all
+    hash to zero; the mean colour keeps those apart.
+    """
+    dhash: int
+    color: Tuple[int, int, int]
+
+
+def image_fingerprint(image_data: Union[bytes, memoryview], hash_size: int = 8) -> Optional[ImageFingerprint]:
+    """Fingerprint an image, or return None if PIL is unavailable or cannot decode it."""
+    try:
+        from PIL import Image
+        with Image.open(io.BytesIO(image_data)) as image:
+            image.draft("RGB", (hash_size * 4, hash_size * 4))  # JPEG: decode at reduced scale
+            image = image.convert("RGB")
+            color = image.resize((1, 1), Image.BILINEAR).getpixel((0, 0))
+            pixels = image.convert("L").resize((hash_size + 1, hash_size), Image.BILINEAR).tobytes()
+    except Exception:
+        return None
+
+    dhash = 0
+    for row in range(hash_size):
+        offset = row * (hash_size + 1)
+        for column in range(hash_size):
+            dhash = (dhash << 1) | (pixels[offset + column] > pixels[offset + column + 1])
+    return ImageFingerprint(dhash, color)
+
+
+def hamming_distance(a: int, b: int) -> int:
+    return bin(a ^ b).count("1")
+
+
+def is_near_duplicate(
+    a: ImageFingerprint, b: ImageFingerprint, max_distance: int = 5, color_tolerance: int = 24,
+) -> bool:
+    return (
+        hamming_distance(a.dhash, b.dhash) <= max_distance
+        and max(abs(x - y) for x, y in zip(a.color, b.color)) <= color_tolerance
+    )
+
+
+def group_near_duplicates(
+    fingerprints: Sequence[Optional[ImageFingerprint]], max_distance: int = 5, color_tolerance: int = 24,
+) -> List[List[int]]:
+    """Group indices of near-identical fingerprints, preserving first-seen order.
+
+    Each image joins the first group whose representative (its first member) is within
+    ``max_distance`` bits and ``color_tolerance`` per channel. Images without a
+    fingerprint always form their own group.
+    """
+    groups: List[List[int]] = []
+    representatives: List[Optional[ImageFingerprint]] = []
+    for index, fingerprint in enumerate(fingerprints):
+        if fingerprint is not None:
+            for group, representative in zip(groups, representatives):
+                if representative is not None and is_near_duplicate(
+                    fingerprint, representative, max_distance, color_tolerance
+                ):
+                    group.append(index)
+                    break
+            else:
+                groups.append([index])
+                representatives.append(fingerprint)
+        else:
+            groups.append([index])
+            representatives.append(None)
+    return groups
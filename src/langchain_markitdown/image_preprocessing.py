@@ -0,0 +1,96 @@
+import io
+from typing import NamedTuple, Optional, Union
+
+# Mimetypes that are already compact enough to send as-is when no resize is needed
+_PASSTHROUGH_MIMETYPES = {"image/jpeg", "image/webp", "image/gif"}
+# Formats the captioning models accept, so the original can be kept if re-encoding doesn't help
+_WEB_MIMETYPES = _PASSTHROUGH_MIMETYPES | {"image/png"}
+
+
+class PreparedImage(NamedTuple):
+    """Image bytes ready to be sent to a captioning model, with their mimetype."""
+    data: Union[bytes, memoryview]
+    mimetype: str
+
+
+class ImagePreprocessor:
+    """Shrinks images before they are captioned.
+
+    Images larger than ``max_edge`` pixels on their longest side are downscaled and
+    re-encoded as ``output_format`` (JPEG or WEBP). Images that already fit and are in a
+    compact format are passed through untouched, without copying. Images with a side
+    shorter than ``min_edge`` pixels, or smaller than ``min_bytes``, are treated as
+    decorative (bullets, spacers, logos) and skipped, so no LLM call is made for them.
+    """
+
+    def __init__(
+        self,
+        max_edge: Optional[int] = 1024,
+        output_format: str = "JPEG",
+        quality: int = 85,
+        min_edge: int = 16,
+        min_bytes: int = 0,
+    ):
+        self.max_edge = max_edge
+        self.output_format = output_format.upper()
+        self.quality = quality
+        self.min_edge = min_edge
+        self.min_bytes = min_bytes
+
+    @property
+    def output_mimetype(self) -> str:
+        return f"image/{self.output_format.lower()}"
+
+    def __call__(self, image_data: Union[bytes, memoryview], mimetype: str) -> Optional[PreparedImage]:
+        """Return the image to send, or None if it should not be captioned."""
+        if len(image_data) < self.min_bytes:
+            return None
+        try:
+            from PIL import Image
+        except ImportError:
+            return PreparedImage(image_data, mimetype)
+
+        try:
+            image = Image.open(io.BytesIO(image_data))  # Lazy: only the header is parsed here
+        except Exception:
+            return PreparedImage(image_data, mimetype)
+
+        with image:
+            width, height = image.size
+            if min(width, height) < self.min_edge:
+                return None
+
+            needs_resize = self.max_edge is not None and max(width, height) > self.max_edge
+            if not needs_resize and mimetype in _PASSTHROUGH_MIMETYPES:
+                return PreparedImage(image_data, mimetype)
+
+            if needs_resize:
+                target = (self.max_edge, self.max_edge)
+                image.draft("RGB", target)  # Lets JPEG decode straight at a reduced scale
+                image.thumbnail(target)
+            encoded = self._encode(image)
+
+        if not needs_resize and mimetype in _WEB_MIMETYPES and len(encoded) >= len(image_data):
+            return PreparedImage(image_data, mimetype)
+        return PreparedImage(encoded, self.output_mimetype)
+
+    def _encode(self, image) -> bytes:
+        from PIL import Image
+
+        if self.output_format == "JPEG" and image.mode != "RGB":
+            if image.mode in ("RGBA", "LA", "P"):
+                image = image.convert("RGBA")
+                background = Image.new("RGB", image.size, (255, 255, 255))
+                background.paste(image, mask=image.getchannel("A"))
+                image = background
+            else:
+                image = image.convert("RGB")
+        buffer = io.BytesIO()
+        image.save(buffer, format=self.output_format, quality=self.quality)
+        return buffer.getvalue()
+
+    def __repr__(self) -> str:
+        return (
+            f"ImagePreprocessor(max_edge={self.max_edge}, output_format={self.output_format!r}, "
+            f"quality={self.quality}, min_edge={self.min_edge}, min_bytes={self.min_bytes})"
+        )
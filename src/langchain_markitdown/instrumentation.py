@@ -0,0 +1,230 @@
+import functools
+import inspect
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+# Stage names used by the loaders. Time spent producing Documents outside any named
+# stage (header/page splitting, building Documents) is attributed to "split".
+STAGES = ("read", "convert", "metadata", "caption", "split")
+
+
+class LoadStats:
+    """Timings and counters for one loader run over one file.
+
+    ``stages`` holds seconds per stage and ``counters`` holds integer counts such as
+    ``bytes_in``, ``chars_out``, ``documents``, ``llm_calls``, ``caption_cache_hits`` and
+    ``conversion_cache_hits``. ``summary`` is a plain dict that is kept up to date while
+    the load runs; it is what gets recorded in Document metadata.
+    """
+
+    def __init__(self, source: str, loader: str, hooks: Sequence["LoaderHooks"] = ()):
+        self.source = source
+        self.loader = loader
+        self.stages: Dict[str, float] = {}
+        self.counters: Dict[str, int] = {}
+        self.total_seconds = 0.0
+        self.error: Optional[str] = None
+        self.summary: Dict[str, Any] = {}
+        self._hooks = list(hooks)
+        self._lock = threading.Lock()
+
+    def add_stage(self, stage: str, seconds: float) -> None:
+        with self._lock:
+            self.stages[stage] = self.stages.get(stage, 0.0) + seconds
+        self._emit("on_stage_end", stage, seconds)
+
+    def count(self, name: str, value: int = 1) -> None:
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_stage(name, time.perf_counter() - start)
+
+    def stage_seconds(self) -> float:
+        with self._lock:
+            return sum(self.stages.values())
+
+    def as_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            values: Dict[str, Any] = {
+                "total_s": self.total_seconds,
+                "stages_s": dict(self.stages),
+            }
+            values.update(self.counters)
+        if self.error is not None:
+            values["error"] = self.error
+        return values
+
+    def refresh_summary(self) -> Dict[str, Any]:
+        """Update ``summary`` in place, so Documents that already hold it see the latest numbers."""
+        self.summary.update(self.as_dict())
+        return self.summary
+
+    def _emit(self, method: str, *args: Any) -> None:
+        for hooks in self._hooks:
+            try:
+                getattr(hooks, method)(self, *args)
+            except Exception as e:  # Instrumentation must never break a load
+                logger.warning(f"{type(hooks).__name__}.{method} failed: {e}")
+
+
+class LoaderHooks:
+    """Receives instrumentation events from loaders. Override the methods you need.
+
+    Events are delivered synchronously on the thread doing the work, so implementations
+    should be cheap (e.g. record a metric or end a tracing span).
+    """
+
+    def on_load_start(self, stats: LoadStats) -> None:
+        pass
+
+    def on_stage_end(self, stats: LoadStats, stage: str, seconds: float) -> None:
+        pass
+
+    def on_load_end(self, stats: LoadStats) -> None:
+        pass
+
+
+class LoggingHooks(LoaderHooks):
+    """Logs one structured line per loaded file."""
+
+    def __init__(self, level: int = logging.INFO):
+        self.level = level
+
+    def on_load_end(self, stats: LoadStats) -> None:
+        logger.log(self.level, f"Loaded {stats.source} with {stats.loader}: {stats.as_dict()}")
+
+
+_global_hooks: List[LoaderHooks] = []
+_global_hooks_lock = threading.Lock()
+
+
+def register_hooks(hooks: LoaderHooks) -> None:
+    """Register hooks that receive events from every loader in this process."""
+    with _global_hooks_lock:
+        _global_hooks.append(hooks)
+
+
+def unregister_hooks(hooks: LoaderHooks) -> None:
+    with _global_hooks_lock:
+        _global_hooks.remove(hooks)
+
+
+def _begin(loader: Any) -> Optional[LoadStats]:
+    """Start a LoadStats for this load, or return None when nobody is listening."""
+    if getattr(loader, "_stats", None) is not None:
+        return None  # Already instrumented by an outer call (e.g. super().lazy_load())
+    hooks = list(getattr(loader, "hooks", None) or ()) + list(_global_hooks)
+    if not hooks and not getattr(loader, "record_stats", False):
+        return None
+
+    stats = LoadStats(loader.file_path, type(loader).__name__, hooks)
+    try:
+        stats.count("bytes_in", loader._get_file_size())
+    except (OSError, TypeError, ValueError):
+        pass
+    loader._stats = stats
+    stats._emit("on_load_start")
+    return stats
+
+
+def _produced(loader: Any, stats: LoadStats, document: Any, seconds: float, stage_seconds: float) -> None:
+    """Account for one yielded Document and the unattributed time it took to produce."""
+    with stats._lock:  # Reported to hooks once, at the end of the load
+        stats.stages["split"] = stats.stages.get("split", 0.0) + max(0.0, seconds - stage_seconds)
+    stats.count("documents")
+    stats.count("chars_out", len(document.page_content))
+    if loader.record_stats:
+        document.metadata["load_stats"] = stats.refresh_summary()
+
+
+def _end(loader: Any, stats: LoadStats, start: float) -> None:
+    loader._stats = None
+    stats.total_seconds = time.perf_counter() - start
+    if "split" in stats.stages:
+        stats._emit("on_stage_end", "split", stats.stages["split"])
+    stats.refresh_summary()
+    stats._emit("on_load_end")
+
+
+@contextmanager
+def _loading(loader: Any) -> Iterator[None]:
+    """Mark a load in progress, so the loader can release per-load resources at its end."""
+    enter = getattr(loader, "_enter_load", None)
+    if enter is None:
+        yield
+        return
+    enter()
+    try:
+        yield
+    finally:
+        loader._exit_load()
+
+
+def instrumented(method: Any) -> Any:
+    """Decorate a loader's ``lazy_load``/``alazy_load`` to collect LoadStats for each run.
+
+    The wrapper also delimits the load, so the loader's source buffer is released when
+    the run finishes or the generator is closed.
+    """
+    if inspect.isasyncgenfunction(method):
+        @functools.wraps(method)
+        async def async_wrapper(self, *args, **kwargs):
+            with _loading(self):
+                stats = _begin(self)
+                if stats is None:
+                    async for document in method(self, *args, **kwargs):
+                        yield document
+                    return
+                start = time.perf_counter()
+                try:
+                    documents = method(self, *args, **kwargs).__aiter__()
+                    while True:
+                        before, staged = time.perf_counter(), stats.stage_seconds()
+                        try:
+                            document = await documents.__anext__()
+                        except StopAsyncIteration:
+                            break
+                        _produced(self, stats, document, time.perf_counter() - before, stats.stage_seconds() - staged)
+                        yield document
+                except Exception as e:
+                    stats.error = str(e)
+                    raise
+                finally:
+                    _end(self, stats, start)
+        return async_wrapper
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with _loading(self):
+            stats = _begin(self)
+            if stats is None:
+                yield from method(self, *args, **kwargs)
+                return
+            start = time.perf_counter()
+            try:
+                documents = iter(method(self, *args, **kwargs))
+                while True:
+                    before, staged = time.perf_counter(), stats.stage_seconds()
+                    try:
+                        document = next(documents)
+                    except StopIteration:
+                        break
+                    _produced(self, stats, document, time.perf_counter() - before, stats.stage_seconds() - staged)
+                    yield document
+            except Exception as e:
+                stats.error = str(e)
+                raise
+            finally:
+                _end(self, stats, start)
+    return wrapper
@@ -0,0 +1,83 @@
+import json
+import os
+import sqlite3
+import threading
+from typing import Dict, Iterable, List, NamedTuple, Optional
+
+
+class ManifestEntry(NamedTuple):
+    """What the manifest remembers about one ingested file."""
+    path: str
+    size: int
+    mtime_ns: int
+    digest: str
+    document_ids: List[str]
+
+
+class FileManifest:
+    """Persistent SQLite record of ingested files, used to skip unchanged files on re-runs.
+
+    Each entry stores the path, size, mtime, content digest and the IDs of the Documents
+    produced from it. A file whose size and mtime match its entry is treated as unchanged
+    without being read; otherwise its digest decides whether it really changed.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS files ("
+                "path TEXT PRIMARY KEY, size INTEGER NOT NULL, mtime_ns INTEGER NOT NULL, "
+                "digest TEXT NOT NULL, document_ids TEXT NOT NULL)"
+            )
+
+    def get(self, file_path: str) -> Optional[ManifestEntry]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT path, size, mtime_ns, digest, document_ids FROM files WHERE path = ?", (file_path,)
+            ).fetchone()
+        if row is None:
+            return None
+        return ManifestEntry(row[0], row[1], row[2], row[3], json.loads(row[4]))
+
+    def is_unchanged(self, file_path: str, stat: Optional[os.stat_result] = None) -> bool:
+        """Cheap check: True if size and mtime still match the recorded entry."""
+        entry = self.get(file_path)
+        if entry is None:
+            return False
+        stat = stat or os.stat(file_path)
+        return entry.size == stat.st_size and entry.mtime_ns == stat.st_mtime_ns
+
+    def record(self, file_path: str, size: int, mtime_ns: int, digest: str, document_ids: Iterable[str]) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO files (path, size, mtime_ns, digest, document_ids) VALUES (?, ?, ?, ?, ?)",
+                (file_path, size, mtime_ns, digest, json.dumps(list(document_ids))),
+            )
+
+    def paths(self) -> List[str]:
+        with self._lock:
+            return [row[0] for row in self._conn.execute("SELECT path FROM files")]
+
+    def remove(self, file_paths: Iterable[str]) -> Dict[str, List[str]]:
+        """Forget the given files, returning the Document IDs that were recorded for them."""
+        removed = {}
+        for file_path in file_paths:
+            entry = self.get(file_path)
+            if entry is not None:
+                removed[file_path] = entry.document_ids
+        with self._lock, self._conn:
+            self._conn.executemany("DELETE FROM files WHERE path = ?", [(path,) for path in removed])
+        return removed
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM files").fetchone()
+        return count
+
+    def close(self) -> None:
+        self._conn.close()
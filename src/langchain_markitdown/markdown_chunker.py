@@ -0,0 +1,149 @@
+import re
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+from langchain_core.documents import Document
+
+DEFAULT_HEADERS: List[Tuple[str, str]] = [("#", "Header 1"), ("##", "Header 2"), ("###", "Header 3")]
+
+# One matcher for every line that matters to the chunker: ATX headings and code fences
+# (headings inside fenced code are not section boundaries).
+_LINE = re.compile(
+    r"^(?:(?P<hashes>#{1,6})[ \t]+(?P<title>.*?)(?:[ \t]+#+)?[ \t]*"
+    r"|[ \t]{0,3}(?P<fence>`{3,}|~{3,})(?P<info>.*))$",
+    re.MULTILINE,
+)
+
+# Oversized sections are cut at paragraphs, then lines, then words
+_SEPARATORS = ("\n\n", "\n", " ")
+
+
+class Chunk(NamedTuple):
+    content: str
+    headers: Dict[str, str]  # Heading path, e.g. {"Header 1": "Intro", "Header 2": "Scope"}
+
+
+class MarkdownChunker:
+    """Split markdown into header-aware, size-bounded chunks in a single pass.
+
+    Content is grouped under its heading path for the levels in ``headers_to_split_on``
+    (same format as MarkdownHeaderTextSplitter). With ``chunk_size``, sections longer
+    than the budget (measured with ``length_function``, e.g. a token counter) are cut at
+    paragraph, line and then word boundaries, and consecutive pieces of a section share
+    up to ``chunk_overlap`` of trailing text.
+    """
+
+    def __init__(
+        self,
+        headers_to_split_on: Optional[Sequence[Tuple[str, str]]] = None,
+        chunk_size: Optional[int] = None,
+        chunk_overlap: int = 0,
+        length_function: Callable[[str], int] = len,
+        strip_headers: bool = True,
+    ):
+        if chunk_size is not None and chunk_size <= 0:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+        if chunk_overlap < 0 or (chunk_size is not None and chunk_overlap >= chunk_size):
+            raise ValueError(f"chunk_overlap must be >= 0 and smaller than chunk_size, got {chunk_overlap}")
+        headers = DEFAULT_HEADERS if headers_to_split_on is None else headers_to_split_on
+        self._names = {len(prefix): name for prefix, name in headers}
+        self.chunk_size = chunk_size
+        self.chunk_overlap = chunk_overlap
+        self.length_function = length_function
+        self.strip_headers = strip_headers  # Keep heading lines out of the chunk text (they are in the metadata)
+
+    def iter_chunks(self, text: str) -> Iterator[Chunk]:
+        """Yield chunks in document order."""
+        path: Dict[int, str] = {}  # Heading level -> title
+        start = 0
+        fence = None
+        for match in _LINE.finditer(text):
+            marker = match.group("fence")
+            if marker is not None:
+                if fence is None:
+                    fence = marker
+                elif marker[0] == fence[0] and len(marker) >= len(fence) and not match.group("info").strip():
+                    fence = None
+                continue
+            level = len(match.group("hashes"))
+            if fence is not None or level not in self._names:
+                continue
+
+            yield from self._section(text[start:match.start()], path)
+            path = {depth: title for depth, title in path.items() if depth < level}
+            path[level] = match.group("title")
+            start = match.end() if self.strip_headers else match.start()
+        yield from self._section(text[start:], path)
+
+    def split_text(self, text: str) -> List[Document]:
+        """Split into Documents whose metadata is the heading path, like MarkdownHeaderTextSplitter."""
+        return [Document(page_content=chunk.content, metadata=chunk.headers) for chunk in self.iter_chunks(text)]
+
+    def _section(self, body: str, path: Dict[int, str]) -> Iterator[Chunk]:
+        body = body.strip()
+        if not body:
+            return
+        headers = {self._names[level]: path[level] for level in sorted(path)}
+        if self.chunk_size is None or self.length_function(body) <= self.chunk_size:
+            yield Chunk(body, headers)
+            return
+        for piece in self._pack(self._segments(body, 0)):
+            yield Chunk(piece, dict(headers))
+
+    def _segments(self, text: str, depth: int) -> List[str]:
+        """Cut text into segments within the budget, each keeping its trailing separator."""
+        if self.length_function(text) <= self.chunk_size:
+            return [text]
+        if depth == len(_SEPARATORS):  # A single word over budget: hard cut
+            return [text[index:index + self.chunk_size] for index in range(0, len(text), self.chunk_size)]
+        separator = _SEPARATORS[depth]
+        parts = text.split(separator)
+        segments: List[str] = []
+        for index, part in enumerate(parts):
+            pieces = self._segments(part, depth + 1) if part else [part]
+            if index < len(parts) - 1:
+                pieces[-1] += separator
+            segments.extend(piece for piece in pieces if piece)
+        return segments
+
+    def _pack(self, segments: List[str]) -> Iterator[str]:
+        """Greedily join segments into pieces of at most chunk_size, carrying the overlap."""
+        piece: List[str] = []
+        lengths: List[int] = []
+        total = 0
+        for segment in segments:
+            length = self.length_function(segment)
+            if piece and total + length > self.chunk_size:
+                yield "".join(piece).strip()
+                piece, lengths = self._overlap(piece, lengths)
+                total = sum(lengths)
+                while piece and total + length > self.chunk_size:
+                    total -= lengths.pop(0)
+                    piece.pop(0)
+            piece.append(segment)
+            lengths.append(length)
+            total += length
+        if piece:
+            yield "".join(piece).strip()
+
+    def _overlap(self, piece: List[str], lengths: List[int]) -> Tuple[List[str], List[int]]:
+        """Trailing segments (or, failing that, trailing words) within chunk_overlap."""
+        if not self.chunk_overlap:
+            return [], []
+        count = total = 0
+        for length in reversed(lengths):
+            if total + length > self.chunk_overlap:
+                break
+            total += length
+            count += 1
+        if count:
+            return piece[-count:], lengths[-count:]
+
+        words: List[str] = []
+        total = 0
+        for word in reversed(piece[-1].rstrip().split(" ")):
+            length = self.length_function(word + " ")
+            if total + length > self.chunk_overlap:
+                break
+            words.insert(0, word + " ")
+            total += length
+        return ["".join(words)] if words else [], [total] if words else []
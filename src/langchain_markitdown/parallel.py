@@ -0,0 +1,54 @@
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Iterable, Iterator, List, Optional, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Helpers for intra-document parallelism: a file is partitioned into work units
+# (page ranges, slide ranges, sheets) that are converted on a pool and then
+# reassembled in document order.
+
+
+def default_workers() -> int:
+    return os.cpu_count() or 1
+
+
+def partition(count: int, max_workers: int, units_per_worker: int = 4) -> List[range]:
+    """Split ``range(count)`` into contiguous chunks, a few per worker for load balancing."""
+    if count <= 0:
+        return []
+    unit_count = min(count, max(1, max_workers * units_per_worker))
+    size, remainder = divmod(count, unit_count)
+    units = []
+    start = 0
+    for index in range(unit_count):
+        end = start + size + (1 if index < remainder else 0)
+        units.append(range(start, end))
+        start = end
+    return units
+
+
+def map_in_order(
+    func: Callable[..., R],
+    units: Iterable[T],
+    *args: Any,
+    max_workers: Optional[int] = None,
+    use_processes: bool = True,
+) -> Iterator[R]:
+    """Run ``func(unit, *args)`` for every unit on a pool, yielding results in input order.
+
+    Results are yielded as soon as every earlier unit has finished, so callers can stream
+    the reassembled document while later units are still converting.
+    """
+    units = list(units)
+    max_workers = min(max_workers or default_workers(), max(1, len(units)))
+    executor_cls = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+    with executor_cls(max_workers=max_workers) as executor:
+        futures = [executor.submit(func, unit, *args) for unit in units]
+        try:
+            for future in futures:
+                yield future.result()
+        finally:
+            for future in futures:
+                future.cancel()
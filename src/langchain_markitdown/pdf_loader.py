@@ -1,4 +1,239 @@
-from langchain_markitdown.base_loader import BaseMarkitdownLoader
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple, Union
+import hashlib
+import io
+import json
+import re
+from langchain_core.documents import Document
+from langchain_markitdown.base_loader import BaseMarkitdownLoader, Source, open_source
+from langchain_markitdown.conversion_cache import ConversionCache
+from langchain_markitdown.parallel import map_in_order, partition
+from langchain_markitdown.instrumentation import LoaderHooks, instrumented
+from langchain_markitdown.shared_metadata import SharedMetadata
+
+PageRange = Union[Tuple[int, int], Iterable[int]]
+
+
+def _normalize_page_range(page_range: Optional[PageRange]) -> Optional[Set[int]]:
+    """Turn a 1-based inclusive (start, end) tuple or an iterable of page numbers into 0-based indices."""
+    if page_range is None:
+        return None
+    if isinstance(page_range, tuple) and len(page_range) == 2:
+        start, end = page_range
+        if start < 1 or end < start:
+            raise ValueError(f"Invalid page_range {page_range}: expected 1 <= start <= end")
+        return set(range(start - 1, end))
+    pages = {page - 1 for page in page_range}
+    if not pages:
+        raise ValueError("Invalid page_range: no pages selected")
+    if any(page < 0 for page in pages):
+        raise ValueError("Page numbers are 1-based")
+    return pages
+
+
+def iter_pdf_pages(file_stream: Any, page_indices: Optional[Set[int]] = None) -> Iterator[Tuple[int, str]]:
+    """Yield (1-based page number, text) for each selected page of a PDF, one page at a time.
+
+    Uses a single pdfminer interpreter over the document, so pages are parsed lazily and
+    pages outside ``page_indices`` are skipped without being laid out.
+    """
+    from pdfminer.converter import TextConverter
+    from pdfminer.layout import LAParams
+    from pdfminer.pdfinterp import PDFPageInterpreter, PDFResourceManager
+    from pdfminer.pdfpage import PDFPage
+
+    resource_manager = PDFResourceManager()
+    output = io.StringIO()
+    device = TextConverter(resource_manager, output, laparams=LAParams())
+    try:
+        interpreter = PDFPageInterpreter(resource_manager, device)
+        last_page = max(page_indices) if page_indices else None
+        for index, page in enumerate(PDFPage.get_pages(file_stream)):
+            if last_page is not None and index > last_page:
+                break
+            if page_indices is not None and index not in page_indices:
+                continue
+            interpreter.process_page(page)
+            text = output.getvalue().rstrip("\f")
+            output.seek(0)
+            output.truncate(0)
+            yield index + 1, text
+    finally:
+        device.close()
+
+
+def count_pdf_pages(file_stream: Any) -> int:
+    """Count pages by walking the page tree, without laying any page out."""
+    from pdfminer.pdfpage import PDFPage
+    return sum(1 for _ in PDFPage.get_pages(file_stream))
+
+
+def _merge_pages(pages: Iterable[Tuple[int, str]]) -> str:
+    """Assemble page texts the way MarkItDown's whole-file PDF conversion does.
+
+    pdfminer ends every page with a form feed; MarkItDown's PDF converter then merges
+    partial numbering lines (when the installed version does so), and MarkItDown strips
+    trailing whitespace from every line and collapses runs of blank lines.
+    """
+    text = "".join(page_text + "\f" for _, page_text in pages)
+    try:
+        from markitdown.converters._pdf_converter import _merge_partial_numbering_lines
+        text = _merge_partial_numbering_lines(text)
+    except ImportError:
+        pass
+    text = "\n".join(line.rstrip() for line in re.split(r"\r?\n", text))
+    return re.sub(r"\n{3,}", "\n\n", text)
+
+
+def _extract_pdf_pages(page_indices: Set[int], source: Union[str, bytes, memoryview]) -> List[Tuple[int, str]]:
+    """Extract one work unit of pages (runs inside pool workers)."""
+    with open_source(source) as file_stream:
+        return list(iter_pdf_pages(file_stream, page_indices))
+
 
 class PdfLoader(BaseMarkitdownLoader):
-    pass
\ No newline at end of file
+    """Loader for PDF files, optionally yielding one Document per page."""
+
+    def __init__(
+        self,
+        file_path: Source,
+        split_by_page: bool = False,
+        page_range: Optional[PageRange] = None,
+        verbose: bool = False,
+        converter: Optional[Any] = None,
+        max_concurrency: Optional[int] = None,
+        conversion_cache: Optional[ConversionCache] = None,
+        parallel_workers: Optional[int] = None,
+        use_processes: bool = True,
+        hooks: Optional[Sequence[LoaderHooks]] = None,
+        record_stats: bool = False,
+        stream_info: Optional[Any] = None,
+    ):
+        """Initialize with file path.
+
+        ``page_range`` selects pages, either as a 1-based inclusive ``(start, end)`` tuple or
+        as an iterable of page numbers; pages past the end of the PDF are ignored, but a
+        range that selects no page at all fails the load. With ``split_by_page`` (or a
+        ``page_range``) pages are extracted one at a time with pdfminer, and a
+        ``conversion_cache`` stores the extracted pages per page selection; an injected
+        ``converter`` is not used. Otherwise the whole file goes through MarkItDown.
+        ``parallel_workers`` partitions the pages into ranges that are extracted on a process
+        (or thread) pool and reassembled in page order. A whole-file load assembles them like
+        MarkItDown does, unless a ``converter`` is injected, which converts the file serially.
+        """
+        super().__init__(
+            file_path, verbose=verbose, converter=converter, max_concurrency=max_concurrency,
+            conversion_cache=conversion_cache, hooks=hooks, record_stats=record_stats,
+            stream_info=stream_info,
+        )
+        self.split_by_page = split_by_page
+        self.page_range = page_range
+        self.parallel_workers = parallel_workers
+        self.use_processes = use_processes
+        self._page_indices = _normalize_page_range(page_range)
+
+    def _base_metadata(self) -> Dict[str, Any]:
+        return {
+            "source": self.file_path,
+            "file_name": self._get_file_name(self.file_path),
+            "file_size": self._get_file_size(),
+            "conversion_success": True,
+        }
+
+    def _pages_cache_key(self) -> Optional[str]:
+        """Conversion cache key of the extracted page texts, which depend on the page selection."""
+        if self.conversion_cache is None:
+            return None
+        digest = hashlib.sha256(self._read_bytes()).hexdigest()
+        pages = sorted(self._page_indices) if self._page_indices is not None else None
+        return self.conversion_cache.make_key(digest, self.__class__.__name__, {"extractor": "pdfminer", "pages": pages})
+
+    def _iter_pages(self, file_stream: Any) -> Iterator[Tuple[int, str]]:
+        """Yield (page number, text) in page order, from the conversion cache or timed as the convert stage."""
+        if self.converter is not None:
+            self.logger.warning(f"Pages of {self.file_path} are extracted with pdfminer; the injected converter is not used")
+        key = self._pages_cache_key()
+        if key is not None:
+            cached = self.conversion_cache.get(key)
+            if cached is not None:
+                self.logger.info(f"Conversion cache hit for {self.file_path}")
+                self._count("conversion_cache_hits")
+                for page_number, text in json.loads(cached):
+                    yield page_number, text
+                return
+
+        pages = self._extract_pages(file_stream)
+        extracted: List[Tuple[int, str]] = []
+        while True:
+            with self._stage("convert"):
+                page = next(pages, None)
+            if page is None:
+                break
+            if key is not None:
+                extracted.append(page)
+            yield page
+        if key is not None:
+            self.conversion_cache.set(key, json.dumps(extracted))
+
+    def _convert_parallel(self) -> str:
+        """Whole-file markdown from pages extracted in parallel, matching a serial conversion."""
+        with self._open_source() as file_stream:
+            return _merge_pages(self._extract_pages(file_stream))
+
+    def _extract_pages(self, file_stream: Any) -> Iterator[Tuple[int, str]]:
+        """Yield (page number, text) in page order, serially or from parallel page ranges."""
+        if not self.parallel_workers:
+            yield from iter_pdf_pages(file_stream, self._page_indices)
+            return
+
+        if self._page_indices is not None:
+            indices = sorted(self._page_indices)
+        else:
+            indices = list(range(count_pdf_pages(file_stream)))
+        units = [set(indices[unit.start:unit.stop]) for unit in partition(len(indices), self.parallel_workers)]
+        self.logger.info(f"Extracting {len(indices)} pages in {len(units)} parallel units")
+        for pages in map_in_order(
+            _extract_pdf_pages, units, self._worker_source(self.use_processes),
+            max_workers=self.parallel_workers, use_processes=self.use_processes,
+        ):
+            yield from pages
+
+    def _check_pages_selected(self) -> None:
+        """Fail a load whose page_range matched none of the PDF's pages."""
+        if self._page_indices is not None:
+            raise ValueError("page_range selects no pages of this PDF")
+
+    @instrumented
+    def lazy_load(self) -> Iterator[Document]:
+        """Lazily load the PDF, yielding one Document per page when split_by_page is set."""
+        try:
+            metadata = self._base_metadata()
+            if not self.split_by_page and self._page_indices is None:
+                # Pages can't be handed to an injected converter, so it converts the whole file
+                convert = self._convert_parallel if self.parallel_workers and self.converter is None else None
+                metadata["success"] = True  # Key of the whole-file Document before pages were supported
+                yield Document(page_content=self._convert_markdown(convert=convert), metadata=metadata)
+                return
+
+            with self._open_source() as file_stream:
+                if self.split_by_page:
+                    shared = SharedMetadata(metadata)
+                    yielded = False
+                    for page_number, text in self._iter_pages(file_stream):
+                        yielded = True
+                        yield shared.document(text, {"page_number": page_number, "content_type": "pdf_page"})
+                    if not yielded:
+                        self._check_pages_selected()
+                else:
+                    pages: List[str] = []
+                    page_numbers: List[int] = []
+                    for page_number, text in self._iter_pages(file_stream):
+                        pages.append(text)
+                        page_numbers.append(page_number)
+                    if not page_numbers:
+                        self._check_pages_selected()
+                    metadata.update({"page_numbers": page_numbers, "content_type": "pdf_pages"})
+                    yield Document(page_content="\n\n".join(pages), metadata=metadata)
+        except FileNotFoundError:
+            raise ValueError(f"Markitdown conversion failed for {self.file_path}: File not found")
+        except Exception as e:
+            raise ValueError(f"Markitdown conversion failed for {self.file_path}: {e}")
@@ -1,145 +1,470 @@
-from typing import List, Dict, Any, Optional
+from typing import TYPE_CHECKING, AsyncIterator, Iterator, List, Dict, Any, NamedTuple, Optional, Sequence, Set, Tuple, Union
 from langchain_core.documents import Document
-from .base_loader import BaseMarkitdownLoader
-from langchain_text_splitters import MarkdownHeaderTextSplitter
-from langchain_core.language_models import BaseChatModel
+from .base_loader import BaseMarkitdownLoader, Source, open_source
+from .source_buffer import ViewReader
 import re
 import os
 import io
+import functools
 import logging
-from .utils import langchain_caption_adapter, get_image_format  # Import both at top
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from .concurrency import get_async_semaphore, get_max_concurrency
+from .caption_cache import BaseCaptionCache
+from .conversion_cache import ConversionCache
+from .image_preprocessing import ImagePreprocessor
+from .image_hash import group_near_duplicates, image_fingerprint
+from .core_properties import read_core_properties
+from .converter_pool import get_converter
+from .parallel import map_in_order, partition
+from .instrumentation import LoaderHooks, LoadStats, instrumented
+from .markdown_chunker import MarkdownChunker
+from .shared_metadata import SharedMetadata
+from .utils import langchain_caption_adapter, alangchain_caption_adapter, get_image_format
+
+if TYPE_CHECKING:
+    from langchain_core.language_models import BaseChatModel
+
+
+class _SlideImage(NamedTuple):
+    """A captionable picture: its slide, cleaned shape name (as used in the markdown), bytes and format."""
+    slide_number: int
+    name: str
+    data: bytes
+    stream_info: Any
+
+
+_SLIDE_MARKER = re.compile(r"<!-- Slide number: (\d+) -->")
+# A slide marker, or an image reference with the picture's cleaned shape name
+_CAPTION_TARGET = re.compile(r"<!-- Slide number: (\d+) -->|!\[[^\]\n]*\]\(([^)]+)\.jpg\)")
+
+
+def _convert_slide_range(
+    slides: range, source: Union[str, bytes, memoryview], converter: Optional[Any] = None
+) -> str:
+    """Convert one contiguous range of slides (runs inside pool workers).
+
+    All other slides are dropped from a copy of the presentation before it goes through
+    MarkItDown (``converter``, or the worker's pooled one), and the slide markers are
+    renumbered to their position in the full deck.
+    """
+    from markitdown import StreamInfo
+    from pptx import Presentation
+
+    with open_source(source) as file:
+        prs = Presentation(file)
+    slide_ids = prs.slides._sldIdLst
+    for index, slide_id in reversed(list(enumerate(slide_ids))):
+        if index not in slides:
+            prs.part.drop_rel(slide_id.rId)
+            slide_ids.remove(slide_id)
+    buffer = io.BytesIO()
+    prs.save(buffer)
+    buffer.seek(0)
+
+    result = (converter or get_converter()).convert_stream(buffer, stream_info=StreamInfo(extension=".pptx"))
+    return _SLIDE_MARKER.sub(
+        lambda match: f"<!-- Slide number: {int(match.group(1)) + slides.start} -->", result.text_content
+    )
 
 
 class PptxLoader(BaseMarkitdownLoader):
-    def __init__(self, file_path: str, split_by_page: bool = False, llm: Optional[BaseChatModel] = None, prompt: Optional[str] = None, verbose: Optional[bool] = None):
-        super().__init__(file_path, verbose=verbose)
+    def __init__(
+        self,
+        file_path: Source,
+        split_by_page: bool = False,
+        llm: Optional["BaseChatModel"] = None,
+        prompt: Optional[str] = None,
+        verbose: Optional[bool] = None,
+        converter: Optional[Any] = None,
+        max_concurrency: Optional[int] = None,
+        caption_max_concurrency: Optional[int] = None,
+        caption_timeout: Optional[float] = None,
+        caption_cache: Optional[BaseCaptionCache] = None,
+        conversion_cache: Optional[ConversionCache] = None,
+        parallel_workers: Optional[int] = None,
+        use_processes: bool = True,
+        image_preprocessor: Optional[ImagePreprocessor] = None,
+        dedupe_images: bool = False,
+        dedupe_max_distance: int = 5,
+        hooks: Optional[Sequence[LoaderHooks]] = None,
+        record_stats: bool = False,
+        stream_info: Optional[Any] = None,
+        chunker: Optional[MarkdownChunker] = None,
+    ):
+        super().__init__(
+            file_path, verbose=verbose, converter=converter, max_concurrency=max_concurrency,
+            conversion_cache=conversion_cache, hooks=hooks, record_stats=record_stats,
+            stream_info=stream_info, chunker=chunker,
+        )
         self.split_by_page = split_by_page
+        self.parallel_workers = parallel_workers  # Convert slide ranges on a pool of this size
+        self.use_processes = use_processes
         self.llm = llm
         self.prompt = prompt
-        self.logger.info(f"Initialized PptxLoader for {file_path} with split_by_page={split_by_page}")
+        self.caption_max_concurrency = caption_max_concurrency  # Max in-flight caption requests
+        self.caption_timeout = caption_timeout  # Seconds to wait for each caption before skipping it
+        self.caption_cache = caption_cache  # Optional cache keyed by (image digest, prompt, model)
+        self.image_preprocessor = image_preprocessor  # Optional downscale/skip stage before captioning
+        self.dedupe_images = dedupe_images  # Caption perceptually near-identical pictures once
+        self.dedupe_max_distance = dedupe_max_distance  # Max dHash bit difference within a group
+        self.logger.info(f"Initialized PptxLoader for {self.file_path} with split_by_page={split_by_page}")
         self.logger.info(f"Langchain LLM for image captioning: {llm.__class__.__name__ if llm else 'None'}")
 
-    def _extract_metadata(self) -> Dict[str, Any]:
+    # python-pptx MSO_SHAPE_TYPE values counted in the metadata
+    _SHAPE_COUNT_KEYS = {13: "image_count", 17: "text_box_count", 3: "chart_count", 19: "table_count"}
+
+    def _extract_metadata(self, data: Union[bytes, memoryview]) -> Tuple[Dict[str, Any], List[_SlideImage]]:
+        """Parse the presentation once, returning metadata and the captionable images.
+
+        Shape statistics and image blobs are gathered in a single walk over the slides;
+        image blobs are only collected when an LLM is configured for captioning.
+        """
         from pptx import Presentation
 
         metadata = {
             "source": self.file_path,
             "file_name": self._get_file_name(self.file_path),
-            "file_size": self._get_file_size(self.file_path),
+            "file_size": len(data),
             "conversion_success": True,
         }
+        images = []
 
         try:
-            prs = Presentation(self.file_path)
+            prs = Presentation(ViewReader(data))
             metadata["slide_count"] = len(prs.slides)
             self.logger.info(f"Found {metadata['slide_count']} slides in the presentation")
 
-            core_props = prs.core_properties
+            # Naive timestamps keep the str() format python-pptx produced
+            core_props = read_core_properties(data, naive_datetimes=True)
 
             def add_if_present(attr_name, key=None):
-                value = getattr(core_props, attr_name, None)
+                value = core_props.get(attr_name)
                 if value:
                     metadata[key or attr_name] = str(value)
 
             for attr in ["author", "title", "subject", "keywords", "created", "modified", "last_modified_by", "category", "revision"]:
                 add_if_present(attr)
 
-            image_count = sum(1 for slide in prs.slides for shape in slide.shapes if shape.shape_type == 13)
-            text_box_count = sum(1 for slide in prs.slides for shape in slide.shapes if shape.shape_type == 17)
-            chart_count = sum(1 for slide in prs.slides for shape in slide.shapes if shape.shape_type == 3)
-            table_count = sum(1 for slide in prs.slides for shape in slide.shapes if shape.shape_type == 19)
+            counts = dict.fromkeys(self._SHAPE_COUNT_KEYS.values(), 0)
+            for slide_number, slide in enumerate(prs.slides, start=1):
+                for shape in slide.shapes:
+                    shape_type = shape.shape_type
+                    if shape_type in self._SHAPE_COUNT_KEYS:
+                        counts[self._SHAPE_COUNT_KEYS[shape_type]] += 1
+                    if shape_type == 13 and self.llm:
+                        image = self._captionable_image(slide_number, shape)
+                        if image is not None:
+                            images.append(image)
 
-            metadata.update({
-                "image_count": image_count,
-                "text_box_count": text_box_count,
-                "chart_count": chart_count,
-                "table_count": table_count
-            })
+            metadata.update(counts)
 
         except Exception as e:
             self.logger.warning(f"Failed to extract detailed metadata: {str(e)}")
             metadata["metadata_extraction_error"] = str(e)
 
-        return metadata
+        return metadata, images
 
-    def _caption_images(self, markdown_content: str) -> str:
-        from pptx import Presentation
+    def _captionable_image(self, slide_number: int, shape: Any) -> Optional[_SlideImage]:
+        """Return the captionable picture for a shape, or None if its format is unsupported."""
+        image_data = shape.image.blob
+        stream_info = type("DummyStreamInfo", (object,), {
+            "mimetype": "", "extension": "", "name": shape.name
+        })()
+
+        stream_info.mimetype, stream_info.extension = get_image_format(image_data)
+        supported = ["image/png", "image/jpeg", "image/gif", "image/webp"]
+        if self.image_preprocessor is not None:
+            supported += ["image/bmp", "image/tiff"]  # Re-encoded by the preprocessor
+        if stream_info.mimetype not in supported:
+            self.logger.warning(f"Skipping captioning for unsupported image format: {stream_info.mimetype}")
+            return None
+
+        cleaned_shape_name = re.sub(r"\W", "", shape.name)
+        return _SlideImage(slide_number, cleaned_shape_name, image_data, stream_info)
+
+    def _apply_captions(self, markdown_content: str, captions: Dict[Tuple[int, str], str]) -> str:
+        """Substitute all captions in one scan over the markdown.
+
+        One fixed pattern matches the slide markers and every image reference; each
+        captured name is looked up in ``captions``, so the cost is linear in the document
+        length however many images were captioned. Captions are keyed by (slide number,
+        cleaned shape name), which keeps shapes that share a name on different slides apart.
+        """
+        if not captions:
+            return markdown_content
+
+        current_slide = 0
+
+        def replace(match: "re.Match") -> str:
+            nonlocal current_slide
+            if match.group(1) is not None:
+                current_slide = int(match.group(1))
+                return match.group(0)
+            caption = captions.get((current_slide, match.group(2)))
+            if caption is None:
+                return match.group(0)
+            return f"![{caption}]({match.group(2)}.jpg)"
+
+        return _CAPTION_TARGET.sub(replace, markdown_content)
+
+    def _caption_one(self, image_data: bytes, stream_info: Any, stats: LoadStats) -> Optional[str]:
+        return langchain_caption_adapter(
+            file_stream=io.BytesIO(image_data),
+            stream_info=stream_info,
+            client=self.llm,
+            model=None,
+            prompt=self.prompt,
+            cache=self.caption_cache,
+            preprocessor=self.image_preprocessor,
+            stats=stats,
+        )
+
+    def _caption_stats(self) -> Tuple[LoadStats, int]:
+        """Stats that count this load's LLM calls (a private one when not instrumented), and the count so far."""
+        stats = self._stats or LoadStats(self.file_path, type(self).__name__)
+        return stats, stats.counters.get("llm_calls", 0)
+
+    def _group_images(self, images: List[_SlideImage]) -> List[List[_SlideImage]]:
+        """Group near-duplicate pictures (by perceptual hash) so each group is captioned once."""
+        if not self.dedupe_images:
+            return [[image] for image in images]
+        fingerprints = [image_fingerprint(image.data) for image in images]
+        groups = group_near_duplicates(fingerprints, max_distance=self.dedupe_max_distance)
+        self.logger.info(f"Grouped {len(images)} images into {len(groups)} near-duplicate groups")
+        return [[images[index] for index in group] for group in groups]
+
+    @staticmethod
+    def _add_caption(captions: Dict[Tuple[int, str], str], group: List[_SlideImage], caption: str) -> None:
+        for image in group:
+            captions[(image.slide_number, image.name)] = caption
+
+    def _caption_images(
+        self, markdown_content: str, groups: List[List[_SlideImage]], stats: LoadStats
+    ) -> str:
+        """Caption one picture per group concurrently on a thread pool, then apply captions in shape order.
+
+        ``caption_timeout`` applies to each request from the moment it starts. A request
+        that runs past it is abandoned and its caption skipped, but the call itself cannot
+        be interrupted: at most ``max_workers`` abandoned calls may still be running in the
+        background after the load returns. When every worker is stuck on an abandoned
+        call, queued requests wait up to one more ``caption_timeout`` for a worker and
+        are skipped after that.
+        """
+        if not groups:
+            return markdown_content
+
+        max_workers = min(len(groups), self.caption_max_concurrency or get_max_concurrency())
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        started: Dict[int, float] = {}  # Group index -> monotonic start time of its request
+
+        def caption_group(index: int) -> Optional[str]:
+            started[index] = time.monotonic()
+            image = groups[index][0]
+            return self._caption_one(image.data, image.stream_info, stats)
+
+        futures = {executor.submit(caption_group, index): index for index in range(len(groups))}
+        pending = set(futures)
+        abandoned: Set[Future] = set()
+        stuck_since: Optional[float] = None  # When every worker became busy with abandoned calls
+        captions = {}
+        try:
+            while pending:
+                timeout = None
+                if self.caption_timeout is not None:
+                    deadlines = [started[futures[future]] for future in pending if futures[future] in started]
+                    if stuck_since is not None:
+                        deadlines.append(stuck_since)
+                    timeout = self.caption_timeout
+                    if deadlines:
+                        timeout = max(0.0, min(deadlines) + self.caption_timeout - time.monotonic())
+                # Abandoned calls are waited on too: one finishing frees a worker for the queue
+                done, _ = wait(pending | abandoned, timeout=timeout, return_when=FIRST_COMPLETED)
+                abandoned -= done
+                for future in done & pending:
+                    pending.discard(future)
+                    self._collect_caption(captions, groups[futures[future]], future)
+                if self.caption_timeout is None:
+                    continue
 
-        prs = Presentation(self.file_path)
-        for slide in prs.slides:
-            for shape in slide.shapes:
-                if hasattr(shape, 'shape_type') and shape.shape_type == 13:
-                    image_data = shape.image.blob
-                    stream_info = type("DummyStreamInfo", (object,), {
-                        "mimetype": "", "extension": "", "name": shape.name
-                    })()
-
-                    stream_info.mimetype, stream_info.extension = get_image_format(image_data)
-                    if stream_info.mimetype not in ["image/png", "image/jpeg", "image/gif", "image/webp"]:
-                        self.logger.warning(f"Skipping captioning for unsupported image format: {stream_info.mimetype}")
-                        continue
-
-                    image_stream = io.BytesIO(image_data)
-                    try:
-                        caption = langchain_caption_adapter(
-                            file_stream=image_stream,
-                            stream_info=stream_info,
-                            client=self.llm,
-                            model=None,
-                            prompt=self.prompt
-                        )
-                        if caption:
-                            self.logger.info(f"Generated caption: {caption[:50]}...")
-                            cleaned_shape_name = re.sub(r"\W", "", shape.name)
-                            alt_text_pattern = r"!\[.*?]\(" + re.escape(f"{cleaned_shape_name}.jpg") + r"\)"
-                            markdown_content = re.sub(alt_text_pattern, f"![{caption}]({cleaned_shape_name}.jpg)", markdown_content)
-                    except Exception as e:
-                        self.logger.error(f"Error during LLM captioning: {e}")
-        return markdown_content
-
-    def _split_markdown_into_documents(self, markdown_content: str, metadata: Dict[str, Any]) -> List[Document]:
-        slide_pattern = r"^\n*<!-- Slide number: (\d+) -->\n"
-        slide_splits = re.split(slide_pattern, markdown_content, flags=re.MULTILINE)
-
-        documents = []
-        current_page_content = slide_splits[0]
+                now = time.monotonic()
+                for future in list(pending):
+                    start = started.get(futures[future])
+                    if start is not None and now - start >= self.caption_timeout:
+                        pending.discard(future)
+                        abandoned.add(future)
+                        self.logger.error(f"LLM captioning timed out for {groups[futures[future]][0].name}")
+                if not pending or len(abandoned) < max_workers:
+                    stuck_since = None
+                elif stuck_since is None:
+                    stuck_since = now
+                elif now - stuck_since >= self.caption_timeout:
+                    self.logger.error(f"Skipping {len(pending)} captions: every worker is stuck on a timed-out request")
+                    break
+        finally:
+            for future in futures:
+                future.cancel()  # Only affects requests that have not started
+            executor.shutdown(wait=False)
+        return self._apply_captions(markdown_content, captions)
+
+    def _collect_caption(self, captions: Dict[Tuple[int, str], str], group: List[_SlideImage], future: Future) -> None:
+        try:
+            caption = future.result()
+        except Exception as e:
+            self.logger.error(f"Error during LLM captioning: {e}")
+            return
+        if caption:
+            self.logger.info(f"Generated caption: {caption[:50]}...")
+            self._add_caption(captions, group, caption)
+
+    async def _acaption_images(
+        self, markdown_content: str, groups: List[List[_SlideImage]], stats: LoadStats
+    ) -> str:
+        """Caption images concurrently with the model's ainvoke, bounded by a semaphore."""
+        import asyncio
+
+        if self.caption_max_concurrency is not None:
+            semaphore = get_async_semaphore(self.caption_max_concurrency)
+        else:
+            semaphore = self._get_semaphore()
+
+        async def caption_one(image_data: bytes, stream_info: Any) -> Optional[str]:
+            async with semaphore:
+                return await asyncio.wait_for(
+                    alangchain_caption_adapter(
+                        file_stream=io.BytesIO(image_data),
+                        stream_info=stream_info,
+                        client=self.llm,
+                        model=None,
+                        prompt=self.prompt,
+                        cache=self.caption_cache,
+                        preprocessor=self.image_preprocessor,
+                        stats=stats,
+                    ),
+                    timeout=self.caption_timeout,
+                )
+
+        results = await asyncio.gather(
+            *(caption_one(group[0].data, group[0].stream_info) for group in groups),
+            return_exceptions=True,
+        )
+        captions = {}
+        for group, caption in zip(groups, results):
+            image = group[0]
+            if isinstance(caption, asyncio.TimeoutError):
+                self.logger.error(f"LLM captioning timed out for {image.name}")
+            elif isinstance(caption, Exception):
+                self.logger.error(f"Error during LLM captioning: {caption}")
+            elif caption:
+                self.logger.info(f"Generated caption: {caption[:50]}...")
+                self._add_caption(captions, group, caption)
+        return self._apply_captions(markdown_content, captions)
+
+    def _split_markdown_into_slides(self, markdown_content: str) -> Iterator[Tuple[int, str]]:
+        """Yield (slide number, content) per non-empty slide, scanning the slide markers incrementally."""
+        slide_pattern = re.compile(r"^\n*<!-- Slide number: (\d+) -->\n", flags=re.MULTILINE)
         current_page_num = 1
+        current_start = 0
 
-        for i in range(1, len(slide_splits), 2):
+        for match in slide_pattern.finditer(markdown_content):
+            current_page_content = markdown_content[current_start:match.start()]
             if current_page_content.strip():
-                page_metadata = metadata.copy()
-                page_metadata.update({"page_number": current_page_num, "content_type": "presentation_slide"})
-                documents.append(Document(page_content=current_page_content, metadata=page_metadata))
+                yield current_page_num, current_page_content
 
-            current_page_num = int(slide_splits[i])
-            current_page_content = slide_splits[i + 1]
+            current_page_num = int(match.group(1))
+            current_start = match.end()
 
+        current_page_content = markdown_content[current_start:]
         if current_page_content.strip():
-            page_metadata = metadata.copy()
-            page_metadata.update({"page_number": current_page_num, "content_type": "presentation_slide"})
-            documents.append(Document(page_content=current_page_content, metadata=page_metadata))
-
-        return documents if documents else [Document(page_content="", metadata=metadata)]
-
-    def load(self, headers_to_split_on: Optional[List[str]] = None) -> List[Document]:
-        from markitdown import MarkItDown
+            yield current_page_num, current_page_content
 
+    def _convert(self) -> Tuple[Dict[str, Any], str, List[_SlideImage]]:
+        """Read the file once, then extract metadata and images and convert it to markdown (without captions)."""
         self.logger.info(f"Starting to load PPTX file: {self.file_path}")
-        metadata = self._extract_metadata()
+        with self._stage("read"):
+            data = self._read_bytes()
+        with self._stage("metadata"):
+            metadata, images = self._extract_metadata(data)
 
-        converter = MarkItDown()
         self.logger.info("Converting PPTX to markdown")
-        result = converter.convert(self.file_path)
-        markdown_content = result.text_content
+        convert = None
+        if (self.parallel_workers or 0) > 1 and metadata.get("slide_count", 0) > 1:  # A single unit would only add a parse
+            convert = functools.partial(self._convert_parallel, metadata["slide_count"])
+        markdown_content = self._convert_markdown(data, extension=".pptx", convert=convert)
+        return metadata, markdown_content, images
 
-        if self.llm:
-            self.logger.info("Processing images and generating captions...")
-            markdown_content = self._caption_images(markdown_content)
+    def _convert_parallel(self, slide_count: int) -> str:
+        """Convert slide ranges on a pool and join them in slide order.
+
+        Every unit parses the whole package before dropping the other slides, so there is
+        one unit per worker rather than several for load balancing.
+        """
+        units = partition(slide_count, self.parallel_workers, units_per_worker=1)
+        self.logger.info(f"Converting {slide_count} slides in {len(units)} parallel units")
+        converter, use_processes = self._parallel_converter(self.use_processes)
+        parts = map_in_order(
+            _convert_slide_range, units, self._worker_source(use_processes), converter,
+            max_workers=self.parallel_workers, use_processes=use_processes,
+        )
+        return "\n\n".join(part for part in parts if part)
 
+    def _to_documents(self, markdown_content: str, metadata: Dict[str, Any]) -> Iterator[Document]:
+        """Yield the deck, or one Document per slide, optionally in size-bounded chunks."""
         self.logger.info(f"Conversion complete, markdown content length: {len(markdown_content)} characters")
 
         if not self.split_by_page:
             metadata["content_type"] = "presentation_full"
-            return [Document(page_content=markdown_content, metadata=metadata)]
-        else:
-            return self._split_markdown_into_documents(markdown_content, metadata)
+            if self.chunker is None:
+                yield Document(page_content=markdown_content, metadata=metadata)
+            else:
+                yield from self._chunk_documents(markdown_content, metadata)
+            return
+
+        shared = SharedMetadata(metadata)  # One per deck, shared by every slide and chunk
+        yielded = False
+        for page_number, page_content in self._split_markdown_into_slides(markdown_content):
+            yielded = True
+            fields = {"page_number": page_number, "content_type": "presentation_slide"}
+            if self.chunker is None:
+                yield shared.document(page_content, fields)
+            else:
+                yield from self._chunk_documents(page_content, metadata, shared=shared, fields=fields)
+        if not yielded:
+            yield Document(page_content="", metadata=metadata)
+
+    @instrumented
+    def lazy_load(self, headers_to_split_on: Optional[List[str]] = None) -> Iterator[Document]:
+        """Lazily load the PPTX file, yielding one Document per slide when split_by_page is set."""
+        metadata, markdown_content, images = self._convert()
+
+        if self.llm:
+            self.logger.info("Processing images and generating captions...")
+            with self._stage("caption"):
+                groups = self._group_images(images)
+                stats, calls = self._caption_stats()
+                markdown_content = self._caption_images(markdown_content, groups, stats)
+                metadata["caption_call_count"] = stats.counters.get("llm_calls", 0) - calls
+
+        yield from self._to_documents(markdown_content, metadata)
+
+    def load(self, headers_to_split_on: Optional[List[str]] = None) -> List[Document]:
+        return list(self.lazy_load(headers_to_split_on))
+
+    @instrumented
+    async def alazy_load(self) -> AsyncIterator[Document]:
+        """Asynchronously load the PPTX file, offloading conversion and captioning via ainvoke."""
+        from langchain_core.runnables.config import run_in_executor  # Heavy; see BaseMarkitdownLoader.alazy_load
+
+        async with self._get_semaphore():
+            metadata, markdown_content, images = await run_in_executor(None, self._convert)
+
+        if self.llm:
+            self.logger.info("Processing images and generating captions...")
+            with self._stage("caption"):
+                groups = self._group_images(images)
+                stats, calls = self._caption_stats()
+                markdown_content = await self._acaption_images(markdown_content, groups, stats)
+                metadata["caption_call_count"] = stats.counters.get("llm_calls", 0) - calls
+
+        for document in self._to_documents(markdown_content, metadata):
+            yield document
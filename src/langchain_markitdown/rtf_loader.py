@@ -1,35 +1,36 @@
-from typing import List, Dict, Any, Optional
+from typing import Iterator, List, Dict, Any, Optional
 from langchain_core.documents import Document
-from .base_loader import BaseMarkitdownLoader
+from .base_loader import BaseMarkitdownLoader, Source
+from .instrumentation import instrumented
 
 class RtfLoader(BaseMarkitdownLoader):
-    def __init__(self, file_path: str):
-        super().__init__(file_path)
+    def __init__(self, file_path: Source, stream_info: Optional[Any] = None):
+        super().__init__(file_path, stream_info=stream_info)
 
-    def load(self, headers_to_split_on: Optional[List[str]] = None) -> List[Document]:
+    @instrumented
+    def lazy_load(self, headers_to_split_on: Optional[List[str]] = None) -> Iterator[Document]:
         try:
-            from markitdown import MarkItDown, StreamInfo
             from markitdown_sample_plugin import RtfConverter
 
-            with open(self.file_path, "rb") as file_stream:
+            with self._stage("convert"), self._open_source() as file_stream:
                 converter = RtfConverter()
                 result = converter.convert(
                     file_stream=file_stream,
-                    stream_info=StreamInfo(
-                        mimetype="text/rtf", 
-                        extension=".rtf", 
-                        filename=self._get_file_name(self.file_path)
-                    ),
+                    stream_info=self._get_stream_info(".rtf").copy_and_update(mimetype="text/rtf"),
                 )
 
             metadata = {
                 "source": self.file_path,
-                "file_name": self._get_file_name(self.file_path),
-                "file_size": self._get_file_size(self.file_path),
+                "file_name": self._get_file_name(),
+                "file_size": self._get_file_size(),
                 "conversion_success": True,
             }
 
-            return [Document(page_content=result.text_content, metadata=metadata)]
+            document = Document(page_content=result.text_content, metadata=metadata)
 
         except Exception as e:
-            raise ValueError(f"Failed to load and convert RTF file: {e}")
\ No newline at end of file
+            raise ValueError(f"Failed to load and convert RTF file: {e}")
+        yield document
+
+    def load(self, headers_to_split_on: Optional[List[str]] = None) -> List[Document]:
+        return list(self.lazy_load(headers_to_split_on))
\ No newline at end of file
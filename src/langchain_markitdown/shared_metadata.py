@@ -0,0 +1,75 @@
+import functools
+import platform
+import sys
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+from langchain_core.documents import Document
+
+# Split Documents (slides, sheets, pages, chunks) repeat the file-level metadata of their
+# source. Copying it into a fresh dict per chunk repeats the whole hash table each time;
+# here the chunk dicts instead share one key table, so each chunk only stores its value
+# pointers. They are still exact ``dict`` objects, so pydantic, json, orjson and
+# langchain serialization see a normal mapping.
+#
+# This leans on CPython implementation details, not on any documented API: the instance
+# ``__dict__``s of one class share their keys (PEP 412) while every instance inserts the
+# same keys in the same order and the table stays small (about 30 keys). Only CPython
+# 3.11+ saves memory this way; 3.8-3.10 give split dicts of a copy's size once they hold
+# more than a handful of keys. Whether a chunk's dict stayed shared is checked when it is
+# built (``sys.getsizeof`` counts a shared dict's values but not its keys); one that did
+# not is replaced by a plain copy, so the worst case is the cost of copying.
+_KEY_SHARING = platform.python_implementation() == "CPython" and sys.version_info >= (3, 11)
+
+
+@functools.lru_cache(maxsize=128)
+def _holder(layout: Tuple[str, ...]) -> type:
+    """One holder class per file-level key layout, reused across files (a class costs ~2.5 KB)."""
+    return type("ChunkMetadata", (), {"__slots__": ("__dict__",)})
+
+
+@functools.lru_cache(maxsize=256)
+def _plain_size(key_count: int) -> int:
+    """``sys.getsizeof`` of an ordinary dict with ``key_count`` keys."""
+    return sys.getsizeof(dict.fromkeys(range(key_count)))
+
+
+class SharedMetadata:
+    """File-level metadata stored once, from which each chunk's metadata dict is built.
+
+    Build one per file and pass each part's own fields (page number, chunk index, ...) to
+    ``for_chunk``. Chunk dicts are independent: changing one never affects the others or
+    ``metadata``. Chunks get plain copies instead when key sharing is unavailable (see
+    the module comment), for non-string keys, and for any chunk whose dict would not
+    stay shared (too many keys, or its fields inserted in another order).
+    """
+
+    def __init__(self, metadata: Mapping[str, Any]):
+        self.metadata = metadata
+        self._shared: Optional[type] = None
+        if _KEY_SHARING and all(type(key) is str for key in metadata):
+            self._shared = _holder(tuple(metadata))
+
+    def for_chunk(self, fields: Optional[Mapping[str, Any]] = None) -> Dict[str, Any]:
+        """Return a new metadata dict: the file-level metadata plus the chunk's ``fields``."""
+        fields = fields or {}
+        if self._shared is None or not all(type(key) is str for key in fields):
+            return {**self.metadata, **fields}
+        values = self._shared().__dict__
+        # Item by item: dict.update() on the empty dict would clone a non-shared table
+        for key, value in self.metadata.items():
+            values[key] = value
+        for key, value in fields.items():
+            values[key] = value
+        if sys.getsizeof(values) >= _plain_size(len(values)):
+            return {**values}  # No longer shared: a plain copy is smaller
+        return values
+
+    def document(self, page_content: str, fields: Optional[Mapping[str, Any]] = None) -> Document:
+        """Build a chunk Document around ``for_chunk(fields)``.
+
+        Validation would copy the metadata into a new (unshared) dict, so the Document is
+        constructed directly; the checks it skips are done here.
+        """
+        if not isinstance(page_content, str):
+            raise TypeError(f"page_content must be a str, not {type(page_content).__name__}")
+        return Document.model_construct(page_content=page_content, metadata=self.for_chunk(fields))
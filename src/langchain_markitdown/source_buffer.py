@@ -0,0 +1,111 @@
+import io
+import mmap
+import os
+from typing import Any, BinaryIO, Optional, Union
+
+# Files at least this large are memory-mapped instead of read into memory, so pages are
+# only faulted in as the converters touch them.
+MMAP_THRESHOLD = 8 * 1024 * 1024
+
+
+class ViewReader(io.BufferedIOBase):
+    """A seekable, read-only binary file over a buffer.
+
+    Nothing is copied up front (unlike ``io.BytesIO`` over a memoryview); each read copies
+    only the bytes it returns. Closing the reader releases its own view but leaves the
+    underlying buffer alone.
+    """
+
+    def __init__(self, data: Union[bytes, bytearray, memoryview, mmap.mmap]):
+        super().__init__()
+        self._view = memoryview(data).cast("B")
+        self._position = 0
+
+    def close(self) -> None:
+        if not self.closed:
+            self._view.release()  # Drop this reader's export of the buffer
+        super().close()
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        # Same semantics as io.BytesIO: relative seeks before the start clamp to zero
+        if whence == io.SEEK_SET:
+            if offset < 0:
+                raise ValueError(f"Negative seek position {offset}")
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = max(0, self._position + offset)
+        elif whence == io.SEEK_END:
+            position = max(0, self._view.nbytes + offset)
+        else:
+            raise ValueError(f"Invalid whence ({whence})")
+        self._position = position
+        return position
+
+    def read(self, size: Optional[int] = -1) -> bytes:
+        start = min(self._position, self._view.nbytes)
+        end = self._view.nbytes if size is None or size < 0 else min(start + size, self._view.nbytes)
+        self._position = max(self._position, end)
+        return self._view[start:end].tobytes()
+
+    def read1(self, size: Optional[int] = -1) -> bytes:
+        return self.read(size)
+
+    def readinto(self, buffer: Any) -> int:
+        data = self.read(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+
+
+class SourceBuffer:
+    """The content of one load's input, read or memory-mapped once.
+
+    ``view`` is a zero-copy memoryview of the whole content and ``reader()`` opens an
+    independent file object over it, so conversion, metadata extraction, hashing and
+    caching all share the single read.
+    """
+
+    def __init__(self, data: Union[bytes, bytearray, memoryview, mmap.mmap]):
+        self._data = data
+        self.view = memoryview(data).cast("B")
+
+    @classmethod
+    def from_path(cls, path: str, mmap_threshold: int = MMAP_THRESHOLD) -> "SourceBuffer":
+        with open(path, "rb") as file:
+            if os.fstat(file.fileno()).st_size >= mmap_threshold:
+                try:
+                    return cls(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
+                except (OSError, ValueError):  # Not mappable (e.g. a pipe); read it instead
+                    pass
+            return cls(file.read())
+
+    @classmethod
+    def from_stream(cls, stream: BinaryIO, start: int = 0) -> "SourceBuffer":
+        stream.seek(start)
+        return cls(stream.read())
+
+    @property
+    def size(self) -> int:
+        return self.view.nbytes
+
+    def reader(self) -> ViewReader:
+        return ViewReader(self.view)
+
+    def close(self) -> None:
+        try:
+            self.view.release()
+        except BufferError:
+            return
+        if isinstance(self._data, mmap.mmap):
+            try:
+                self._data.close()
+            except BufferError:  # A consumer still holds a view; the map closes when it is collected
+                pass
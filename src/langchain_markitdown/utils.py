@@ -1,39 +1,49 @@
-from typing import BinaryIO, Optional, Tuple, Union
-from langchain_core.language_models import BaseChatModel
-from langchain_core.messages import HumanMessage
+from typing import TYPE_CHECKING, BinaryIO, Optional, Tuple, Union
+from .caption_cache import BaseCaptionCache, make_caption_key
+from .image_preprocessing import ImagePreprocessor
+from .source_buffer import ViewReader
 import base64
-import io
+import logging
 import mimetypes
 
-def get_image_caption(
-    llm: BaseChatModel, file_stream: BinaryIO, stream_info, prompt: Optional[str] = None,
-) -> Optional[str]:
-    """Generates a caption for an image using a Langchain chat model."""
+if TYPE_CHECKING:  # Chat-model machinery is heavy; only import it when captioning
+    from langchain_core.language_models import BaseChatModel
+    from langchain_core.messages import HumanMessage
+    from .instrumentation import LoadStats
 
-    if prompt is None or prompt.strip() == "":
-        prompt = "Write a detailed caption for this image. If you cannot, try and describe what you see. If this is not possible simply return 'no caption provided for this image'"
+logger = logging.getLogger(__name__)
 
-    # Get the content type
-    content_type = stream_info.mimetype
-    if not content_type:
-        content_type, _ = mimetypes.guess_type("_dummy" + (stream_info.extension or ""))
-    if not content_type:
-        content_type = "application/octet-stream"
+DEFAULT_CAPTION_PROMPT = "Write a detailed caption for this image. If you cannot, try and describe what you see. If this is not possible simply return 'no caption provided for this image'"
 
-    # Convert to base64
+def _read_image(file_stream: BinaryIO) -> Optional[bytes]:
+    """Reads the image bytes without moving the stream position."""
     cur_pos = file_stream.tell()
     try:
-        base64_image = base64.b64encode(file_stream.read()).decode("utf-8")
+        return file_stream.read()
     except Exception as e:
         return None
     finally:
         file_stream.seek(cur_pos)
 
-    # Prepare the data-uri
-    data_uri = f"data:{content_type};base64,{base64_image}"
+def _build_caption_message(
+    image_data: Union[bytes, memoryview], stream_info, prompt: str, content_type: Optional[str] = None,
+) -> "HumanMessage":
+    """Builds the multimodal HumanMessage sent to the chat model for captioning."""
+    from langchain_core.messages import HumanMessage
+
+    # Get the content type
+    content_type = content_type or stream_info.mimetype
+    if not content_type:
+        content_type, _ = mimetypes.guess_type("_dummy" + (stream_info.extension or ""))
+    if not content_type:
+        content_type = "application/octet-stream"
+
+    # Convert to base64 and prepare the data-uri
+    # (b64encode reads memoryviews directly; ASCII decode is the only other copy)
+    data_uri = f"data:{content_type};base64," + base64.b64encode(image_data).decode("ascii")
 
     # Create a HumanMessage with the image and prompt
-    message = HumanMessage(
+    return HumanMessage(
         content=[
             {"type": "text", "text": prompt},
             {
@@ -43,59 +53,169 @@ def get_image_caption(
         ]
     )
 
+def _prepare_caption(
+    llm: "BaseChatModel", file_stream: BinaryIO, prompt: Optional[str], cache: Optional[BaseCaptionCache],
+) -> Tuple[Optional[bytes], str, Optional[str], Optional[str]]:
+    """Returns (image bytes, prompt, cache key, cached caption) for a caption request."""
+    if prompt is None or prompt.strip() == "":
+        prompt = DEFAULT_CAPTION_PROMPT
+    image_data = _read_image(file_stream)
+    if image_data is None or cache is None:
+        return image_data, prompt, None, None
+    key = make_caption_key(image_data, prompt, llm)
+    return image_data, prompt, key, cache.lookup(key)
+
+def _build_message(
+    image_data: bytes, stream_info, prompt: str, preprocessor: Optional[ImagePreprocessor],
+) -> Optional["HumanMessage"]:
+    """Runs the optional preprocessing stage, returning None for images it skips."""
+    if preprocessor is None:
+        return _build_caption_message(image_data, stream_info, prompt)
+    prepared = preprocessor(image_data, stream_info.mimetype)
+    if prepared is None:
+        return None
+    return _build_caption_message(prepared.data, stream_info, prompt, content_type=prepared.mimetype)
+
+def get_image_caption(
+    llm: "BaseChatModel", file_stream: BinaryIO, stream_info, prompt: Optional[str] = None,
+    cache: Optional[BaseCaptionCache] = None, preprocessor: Optional[ImagePreprocessor] = None,
+    stats: Optional["LoadStats"] = None,
+) -> Optional[str]:
+    """Generates a caption for an image using a Langchain chat model, consulting the cache first.
+
+    With a ``preprocessor`` the image is downscaled/recompressed before it is sent, and
+    images it rejects as decorative are not captioned at all.
+    """
+    image_data, prompt, key, caption = _prepare_caption(llm, file_stream, prompt, cache)
+    if image_data is None:
+        return None
+    if caption is not None:
+        if stats is not None:
+            stats.count("caption_cache_hits")
+        return caption
+
+    message = _build_message(image_data, stream_info, prompt, preprocessor)
+    if message is None:
+        return None
     try:
         # Invoke the Langchain model
+        if stats is not None:
+            stats.count("llm_calls")
         response = llm.invoke([message])  # Assuming .invoke() method
-        return response.content
     except Exception as e:
-        print(f"Error during LLM captioning: {e}")
+        logger.error(f"Error during LLM captioning: {e}")
         return None
+    if key is not None and response.content:
+        cache.set(key, response.content)
+    return response.content
 
-def get_image_format(image_data: bytes) -> Tuple[str, str]:
-    """
-    Identifies the image format and returns the MIME type and extension.
-    Replaces deprecated imghdr module with PIL-based detection.
-    """
+async def aget_image_caption(
+    llm: "BaseChatModel", file_stream: BinaryIO, stream_info, prompt: Optional[str] = None,
+    cache: Optional[BaseCaptionCache] = None, preprocessor: Optional[ImagePreprocessor] = None,
+    stats: Optional["LoadStats"] = None,
+) -> Optional[str]:
+    """Asynchronously generates a caption for an image using the model's ainvoke."""
+    image_data, prompt, key, caption = _prepare_caption(llm, file_stream, prompt, cache)
+    if image_data is None:
+        return None
+    if caption is not None:
+        if stats is not None:
+            stats.count("caption_cache_hits")
+        return caption
+
+    message = _build_message(image_data, stream_info, prompt, preprocessor)
+    if message is None:
+        return None
+    try:
+        if stats is not None:
+            stats.count("llm_calls")
+        response = await llm.ainvoke([message])
+    except Exception as e:
+        logger.error(f"Error during LLM captioning: {e}")
+        return None
+    if key is not None and response.content:
+        cache.set(key, response.content)
+    return response.content
+
+# (magic prefix, offset, mimetype, extension) checked against the first bytes of an image
+_IMAGE_SIGNATURES = [
+    (b"\x89PNG\r\n\x1a\n", 0, "image/png", ".png"),
+    (b"\xff\xd8\xff", 0, "image/jpeg", ".jpg"),
+    (b"GIF87a", 0, "image/gif", ".gif"),
+    (b"GIF89a", 0, "image/gif", ".gif"),
+    (b"WEBP", 8, "image/webp", ".webp"),  # After the "RIFF" + size header
+    (b"BM", 0, "image/bmp", ".bmp"),
+    (b"II*\x00", 0, "image/tiff", ".tiff"),
+    (b"MM\x00*", 0, "image/tiff", ".tiff"),
+    (b" EMF", 40, "image/x-emf", ".emf"),  # dSignature of the EMR_HEADER record
+    (b"\xd7\xcd\xc6\x9a", 0, "image/x-wmf", ".wmf"),  # Placeable WMF
+    (b"\x01\x00\x09\x00", 0, "image/x-wmf", ".wmf"),
+    (b"\x02\x00\x09\x00", 0, "image/x-wmf", ".wmf"),
+]
+_SNIFF_BYTES = 512  # Enough for every signature and an SVG prolog
+_PIL_FORMATS = {"jpeg": ("image/jpeg", ".jpg"), "png": ("image/png", ".png"), "gif": ("image/gif", ".gif"), "webp": ("image/webp", ".webp")}
+_UNKNOWN_FORMAT = ("application/octet-stream", ".bin")
+
+
+def sniff_image_format(header: Union[bytes, memoryview]) -> Optional[Tuple[str, str]]:
+    """Identify an image from its leading bytes, returning (mimetype, extension) or None."""
+    for magic, offset, mimetype, extension in _IMAGE_SIGNATURES:
+        if header[offset:offset + len(magic)] == magic:
+            if magic == b"WEBP" and header[:4] != b"RIFF":
+                continue
+            return mimetype, extension
+    text = bytes(header).lstrip(b"\xef\xbb\xbf \t\r\n").lower()
+    if text.startswith((b"<svg", b"<?xml", b"<!doctype svg")) and b"<svg" in text:
+        return "image/svg+xml", ".svg"
+    return None
+
+
+def _pil_image_format(image_data: memoryview) -> Tuple[str, str]:
+    """Slow path: let PIL identify the format, reading the view in place."""
     try:
         from PIL import Image
-        image = Image.open(io.BytesIO(image_data))
-        
-        # Get format from PIL
-        img_format = image.format.lower() if image.format else None
-        
-        if img_format == 'jpeg':
-            return "image/jpeg", ".jpg"
-        elif img_format == 'png':
-            return "image/png", ".png"
-        elif img_format == 'gif':
-            return "image/gif", ".gif"
-        elif img_format == 'webp':
-            return "image/webp", ".webp"
-        else:
-            # Default fallback if format not specifically handled
-            return "application/octet-stream", ".bin"
-    except ImportError:
-        # Fallback if Pillow is not installed
-        print("Warning: Pillow not installed. Image format detection may be less accurate.")
-        # Very basic signature detection
-        if image_data.startswith(b'\xff\xd8\xff'):
-            return "image/jpeg", ".jpg"
-        elif image_data.startswith(b'\x89PNG\r\n\x1a\n'):
-            return "image/png", ".png"
-        elif image_data.startswith(b'GIF87a') or image_data.startswith(b'GIF89a'):
-            return "image/gif", ".gif"
-        elif image_data.startswith(b'RIFF') and image_data[8:12] == b'WEBP':
-            return "image/webp", ".webp"
-        else:
-            return "application/octet-stream", ".bin"
+        with ViewReader(image_data) as reader, Image.open(reader) as image:
+            img_format = image.format.lower() if image.format else None
     except Exception:
-        return "application/octet-stream", ".bin"
+        return _UNKNOWN_FORMAT
+    return _PIL_FORMATS.get(img_format, _UNKNOWN_FORMAT)
+
+
+def get_image_format(image_data: Union[bytes, bytearray, memoryview]) -> Tuple[str, str]:
+    """
+    Identifies the image format and returns the MIME type and extension.
+    Only the leading bytes are inspected via header signatures; PIL is consulted
+    solely for blobs no signature matches.
+    """
+    with memoryview(image_data) as view:
+        format_info = sniff_image_format(view[:_SNIFF_BYTES])
+        if format_info is not None:
+            return format_info
+        return _pil_image_format(view)
 
 def langchain_caption_adapter(
-    file_stream: BinaryIO, stream_info, client, model, prompt: Optional[str] = None
+    file_stream: BinaryIO, stream_info, client, model, prompt: Optional[str] = None,
+    cache: Optional[BaseCaptionCache] = None, preprocessor: Optional[ImagePreprocessor] = None,
+    stats: Optional["LoadStats"] = None,
 ) -> Union[None, str]:
     if not stream_info.mimetype:
-        stream_info.mimetype, stream_info.extension = get_image_format(file_stream.getvalue())
+        with file_stream.getbuffer() as view:  # Zero-copy view of the in-memory image
+            stream_info.mimetype, stream_info.extension = get_image_format(view)
     return get_image_caption(
-        llm=client, file_stream=file_stream, stream_info=stream_info, prompt=prompt
+        llm=client, file_stream=file_stream, stream_info=stream_info, prompt=prompt, cache=cache,
+        preprocessor=preprocessor, stats=stats,
+    )
+
+
+async def alangchain_caption_adapter(
+    file_stream: BinaryIO, stream_info, client, model, prompt: Optional[str] = None,
+    cache: Optional[BaseCaptionCache] = None, preprocessor: Optional[ImagePreprocessor] = None,
+    stats: Optional["LoadStats"] = None,
+) -> Union[None, str]:
+    if not stream_info.mimetype:
+        with file_stream.getbuffer() as view:  # Zero-copy view of the in-memory image
+            stream_info.mimetype, stream_info.extension = get_image_format(view)
+    return await aget_image_caption(
+        llm=client, file_stream=file_stream, stream_info=stream_info, prompt=prompt, cache=cache,
+        preprocessor=preprocessor, stats=stats,
     )
@@ -1,72 +1,119 @@
-from typing import List, Dict, Any
+from typing import Iterator, List, Dict, Any, Optional, Sequence, Union
+import io
+import itertools
+import re
 from langchain_core.documents import Document
-from .base_loader import BaseMarkitdownLoader
+from .base_loader import BaseMarkitdownLoader, Source, open_source
+from .conversion_cache import ConversionCache
+from .converter_pool import get_converter
+from .core_properties import read_core_properties
+from .parallel import map_in_order, partition
+from .instrumentation import LoaderHooks, instrumented
+from .shared_metadata import SharedMetadata
+
+
+def _convert_sheets(
+    sheet_names: List[str], source: Union[str, bytes, memoryview], converter: Optional[Any] = None
+) -> str:
+    """Convert a group of sheets to "## <sheet>" markdown sections (runs inside pool workers).
+
+    All other sheets are dropped from a copy of the workbook before it goes through
+    MarkItDown (``converter``, or the worker's pooled one).
+    """
+    from markitdown import StreamInfo
+    from openpyxl import load_workbook
+
+    with open_source(source) as file:
+        workbook = load_workbook(file, data_only=True)  # Cached formula results, as MarkItDown reads them
+    for name in workbook.sheetnames:
+        if name not in sheet_names:
+            del workbook[name]
+    workbook.active = 0
+    buffer = io.BytesIO()
+    workbook.save(buffer)
+    buffer.seek(0)
+    result = (converter or get_converter()).convert_stream(buffer, stream_info=StreamInfo(extension=".xlsx"))
+    return result.text_content
+
 
 class XlsxLoader(BaseMarkitdownLoader):
     """Loader for XLSX files."""
 
-    def __init__(self, file_path: str, split_by_page: bool = False):
-        """Initialize with file path and split_by_page option."""
-        super().__init__(file_path)
+    def __init__(
+        self,
+        file_path: Source,
+        split_by_page: bool = False,
+        converter: Optional[Any] = None,
+        conversion_cache: Optional[ConversionCache] = None,
+        streaming: bool = False,
+        rows_per_document: Optional[int] = None,
+        header_rows: int = 1,
+        parallel_workers: Optional[int] = None,
+        use_processes: bool = True,
+        hooks: Optional[Sequence[LoaderHooks]] = None,
+        record_stats: bool = False,
+        stream_info: Optional[Any] = None,
+    ):
+        """Initialize with file path and split_by_page option.
+
+        With ``streaming=True`` the workbook is read row by row with openpyxl in read-only
+        mode instead of being converted by MarkItDown as a whole. One Document is yielded
+        per sheet, or per ``rows_per_document`` data rows with the first ``header_rows``
+        rows repeated at the top of every window, so memory stays bounded by the window
+        size rather than the workbook size. With ``header_rows=0`` the columns are
+        labelled A, B, C... instead.
+
+        ``parallel_workers`` converts groups of sheets on a process (or thread) pool and
+        reassembles them in workbook order; the result matches the serial conversion.
+        """
+        if header_rows < 0:
+            raise ValueError(f"header_rows must be >= 0, got {header_rows}")
+        super().__init__(
+            file_path, converter=converter, conversion_cache=conversion_cache, hooks=hooks,
+            record_stats=record_stats, stream_info=stream_info,
+        )
         self.split_by_page = split_by_page
+        self.streaming = streaming or rows_per_document is not None
+        self.rows_per_document = rows_per_document
+        self.header_rows = header_rows
+        self.parallel_workers = parallel_workers
+        self.use_processes = use_processes
 
-    def load(self) -> List[Document]:
-        """Load and convert XLSX file to Markdown.
-        If split_by_page is True, each sheet is a separate document.
+    @instrumented
+    def lazy_load(self) -> Iterator[Document]:
+        """Lazily load and convert XLSX file to Markdown.
+        If split_by_page is True, each sheet is yielded as a separate document.
         If split_by_page is False, all sheets are combined into a single document.
+        In streaming mode, documents are always yielded per sheet (or per row window).
         """
+        if self.streaming:
+            yield from self._stream_sheets()
+            return
+
         try:
-            from markitdown import MarkItDown
-            converter = MarkItDown()
-            result = converter.convert(self.file_path)
-            markdown_content = result.text_content
-            
+            with self._stage("read"):
+                data = self._read_bytes()
+            convert = self._convert_parallel if self.parallel_workers else None
+            markdown_content = self._convert_markdown(data, extension=".xlsx", convert=convert)
+
             # Create basic metadata
             metadata: Dict[str, Any] = {
                 "source": self.file_path,
                 "file_name": self._get_file_name(self.file_path),
-                "file_size": self._get_file_size(self.file_path),
+                "file_size": len(data),
                 "conversion_success": True,
             }
-            
-            # Extract additional metadata directly from the XLSX file using openpyxl
+
+            # Extract document properties straight from docProps/core.xml
             try:
-                from openpyxl import load_workbook
-                workbook = load_workbook(self.file_path, read_only=True, data_only=True)
-                
-                # Extract document properties if available
-                props = workbook.properties
-                if hasattr(props, 'creator') and props.creator:
-                    metadata["author"] = props.creator
-                if hasattr(props, 'title') and props.title:
-                    metadata["title"] = props.title
-                if hasattr(props, 'subject') and props.subject:
-                    metadata["subject"] = props.subject
-                if hasattr(props, 'description') and props.description:
-                    metadata["description"] = props.description
-                if hasattr(props, 'keywords') and props.keywords:
-                    metadata["keywords"] = props.keywords
-                if hasattr(props, 'category') and props.category:
-                    metadata["category"] = props.category
-            except ImportError:
-                pass
-            
-            if self.split_by_page:
-                documents = []
-                # Split Markdown content by sheet headers
-                sheet_contents = markdown_content.split("## ")
-                for sheet_content in sheet_contents[1:]:
-                    lines = sheet_content.splitlines()
-                    sheet_name = lines[0].strip()  # First line is the sheet name
-                    table_content = '\n'.join(lines[1:])  # Remaining lines are the table
-                    
-                    page_metadata = metadata.copy()
-                    page_metadata["page_number"] = sheet_name
-                    doc = Document(page_content=table_content, metadata=page_metadata)
-                    documents.append(doc)
-                return documents
-            else:
-                return [Document(page_content=markdown_content, metadata=metadata)]
+                with self._stage("metadata"):
+                    props = read_core_properties(data)
+                for attr in ["author", "title", "subject", "description", "keywords", "category"]:
+                    if props.get(attr):
+                        metadata[attr] = props[attr]
+            except Exception as e:
+                metadata["metadata_extraction_error"] = str(e)
+
         except Exception as e:
             # Handle conversion errors
             metadata = {
@@ -75,4 +122,151 @@ class XlsxLoader(BaseMarkitdownLoader):
                 "conversion_success": False,
                 "error": str(e),
             }
-            return [Document(page_content="", metadata=metadata)]
+            yield Document(page_content="", metadata=metadata)
+            return
+
+        if self.split_by_page:
+            yield from self._split_sheets(markdown_content, metadata)
+        else:
+            yield Document(page_content=markdown_content, metadata=metadata)
+
+    def _convert_parallel(self) -> str:
+        """Convert groups of sheets on a pool and join the sections in workbook order."""
+        from openpyxl import load_workbook
+
+        with self._open_source() as file:
+            workbook = load_workbook(file, read_only=True)
+            try:
+                sheet_names = workbook.sheetnames
+            finally:
+                workbook.close()
+
+        units = [sheet_names[unit.start:unit.stop] for unit in partition(len(sheet_names), self.parallel_workers, units_per_worker=1)]
+        self.logger.info(f"Converting {len(sheet_names)} sheets in {len(units)} parallel units")
+        converter, use_processes = self._parallel_converter(self.use_processes)
+        parts = map_in_order(
+            _convert_sheets, units, self._worker_source(use_processes), converter,
+            max_workers=self.parallel_workers, use_processes=use_processes,
+        )
+        return "\n\n".join(part for part in parts if part).strip()
+
+    def _split_sheets(self, markdown_content: str, metadata: Dict[str, Any]) -> Iterator[Document]:
+        """Yield one Document per "## <sheet name>" section of the converted workbook."""
+        shared = SharedMetadata(metadata)
+        previous = None
+        for header in re.finditer(r"^## (.*)$", markdown_content, flags=re.MULTILINE):
+            if previous is not None:
+                yield self._sheet_document(markdown_content, previous, header.start(), shared)
+            previous = header
+        if previous is not None:
+            yield self._sheet_document(markdown_content, previous, len(markdown_content), shared)
+
+    def _sheet_document(self, markdown_content: str, header: "re.Match", end: int, shared: SharedMetadata) -> Document:
+        sheet_name = header.group(1).strip()  # Header line is the sheet name
+        table_content = markdown_content[header.end() + 1:end]  # Remaining lines are the table
+        return shared.document(table_content, {"page_number": sheet_name})
+
+    def _stream_sheets(self) -> Iterator[Document]:
+        """Yield per-sheet (or per row window) Documents from a read-only openpyxl workbook."""
+        metadata: Dict[str, Any] = {
+            "source": self.file_path,
+            "file_name": self._get_file_name(self.file_path),
+            "conversion_success": True,
+        }
+        file = None
+        try:
+            from openpyxl import load_workbook
+            metadata["file_size"] = self._get_file_size()
+            file = self._open_source()
+            props = read_core_properties(file)
+            for attr in ["author", "title", "subject", "description", "keywords", "category"]:
+                if props.get(attr):
+                    metadata[attr] = props[attr]
+            file.seek(0)
+            workbook = load_workbook(file, read_only=True, data_only=True)
+        except Exception as e:
+            if file is not None:
+                file.close()
+            metadata.update({"conversion_success": False, "error": str(e)})
+            metadata.pop("file_size", None)
+            yield Document(page_content="", metadata=metadata)
+            return
+
+        shared = SharedMetadata(metadata)
+        try:
+            for worksheet in workbook.worksheets:
+                yield from self._stream_sheet(worksheet, shared)
+        finally:
+            workbook.close()
+            file.close()
+
+    def _stream_sheet(self, worksheet: Any, shared: SharedMetadata) -> Iterator[Document]:
+        rows = worksheet.iter_rows(values_only=True)
+        header_rows = [_trim_row(row) for row in itertools.islice(rows, self.header_rows)]
+        # The sheet's recorded dimensions, widened by any row that turns out to be wider
+        width = max([worksheet.max_column or 0] + [len(cells) for cells in header_rows])
+
+        window: List[tuple] = []
+        start_row = len(header_rows) + 1
+        row_number = start_row - 1
+        for row in rows:
+            row_number += 1
+            cells = _trim_row(row)
+            width = max(width, len(cells))
+            window.append(cells)
+            if self.rows_per_document and len(window) >= self.rows_per_document:
+                yield self._rows_document(worksheet.title, header_rows, window, width, start_row, row_number, shared)
+                window = []
+                start_row = row_number + 1
+        if window or (header_rows and start_row == len(header_rows) + 1):
+            yield self._rows_document(worksheet.title, header_rows, window, width, start_row, row_number, shared)
+
+    def _rows_document(
+        self,
+        sheet_name: str,
+        header_rows: List[tuple],
+        rows: List[tuple],
+        width: int,
+        start_row: int,
+        end_row: int,
+        shared: SharedMetadata,
+    ) -> Document:
+        if header_rows:
+            lines = [_markdown_row(cells, width) for cells in header_rows]
+        else:  # No header rows: label the columns A, B, C...
+            from openpyxl.utils import get_column_letter
+            lines = [_markdown_row(tuple(get_column_letter(index) for index in range(1, width + 1)), width)]
+        lines.insert(1, "| " + " | ".join(["---"] * width) + " |")
+        lines.extend(_markdown_row(cells, width) for cells in rows)
+
+        fields: Dict[str, Any] = {"page_number": sheet_name}
+        if self.rows_per_document:
+            fields["start_row"] = start_row
+            fields["end_row"] = end_row
+        return shared.document("\n".join(lines) + "\n", fields)
+
+    def load(self) -> List[Document]:
+        """Load and convert XLSX file to Markdown."""
+        return list(self.lazy_load())
+
+
+def _trim_row(row: tuple) -> tuple:
+    """Drop trailing empty cells, which read-only worksheets pad rows with."""
+    end = len(row)
+    while end and row[end - 1] is None:
+        end -= 1
+    return row[:end]
+
+
+def _format_cell(value: Any) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return str(value).replace("|", "\\|").replace("\n", " ")
+
+
+def _markdown_row(cells: tuple, width: int) -> str:
+    values = [_format_cell(value) for value in cells]
+    values.extend([""] * (width - len(values)))
+    return "| " + " | ".join(values) + " |"
@@ -1,4 +1,216 @@
-from langchain_markitdown.base_loader import BaseMarkitdownLoader
+import io
+import os
+import posixpath
+import zipfile
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Deque, Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple, Type
+
+from langchain_core.documents import Document
+
+from langchain_markitdown.base_loader import BaseMarkitdownLoader, Source
+from langchain_markitdown.instrumentation import LoaderHooks, instrumented
+from langchain_markitdown.parallel import default_workers
+
+
+class ZipLimitError(ValueError):
+    """Raised when an archive exceeds the loader's member-count or total-size limits."""
+
+
+class _Member(NamedTuple):
+    """One archive member, read into memory (or rejected with an error)."""
+    name: str  # Path inside the archive, nested archives joined with "/"
+    size: int
+    data: Optional[bytes]
+    error: Optional[str]
+
+
+def _load_member(
+    data: bytes, member_name: str, loader_cls: Type[BaseMarkitdownLoader], loader_kwargs: Dict[str, Any]
+) -> List[Document]:
+    """Load one member's bytes with its format's loader (runs inside pool workers)."""
+    from markitdown import StreamInfo
+
+    stream_info = StreamInfo(
+        extension=os.path.splitext(member_name)[1].lower() or None,
+        filename=posixpath.basename(member_name),
+    )
+    return list(loader_cls(data, stream_info=stream_info, **loader_kwargs).lazy_load())
+
 
 class ZipLoader(BaseMarkitdownLoader):
-    pass
\ No newline at end of file
+    """Loader for zip archives, yielding the Documents of each member in turn.
+
+    Members are read straight from the archive without extracting to disk and handed as
+    bytes to the loader for their extension (as in MarkitdownDirectoryLoader, with the same
+    ``loader_mapping`` and per-extension ``loader_kwargs`` overrides). They are loaded on a
+    thread pool (or a process pool with ``use_processes=True``) and yielded in archive
+    order, with at most ``max_workers * 2`` members held in memory at once. Nested
+    archives are expanded up to ``max_depth`` levels.
+
+    Limits guard against zip bombs: a member larger than ``max_member_bytes`` once
+    decompressed, or compressed more than ``max_compression_ratio`` times, yields an error
+    Document instead of being read. Exceeding ``max_members`` or ``max_total_bytes``
+    across the whole archive raises ZipLimitError.
+    """
+
+    def __init__(
+        self,
+        file_path: Source,
+        verbose: bool = False,
+        converter: Optional[Any] = None,
+        loader_mapping: Optional[Dict[str, Type[BaseMarkitdownLoader]]] = None,
+        loader_kwargs: Optional[Dict[str, Dict[str, Any]]] = None,
+        max_workers: Optional[int] = None,
+        use_processes: bool = False,
+        max_members: int = 10_000,
+        max_member_bytes: int = 256 * 1024 * 1024,
+        max_total_bytes: int = 4 * 1024 * 1024 * 1024,
+        max_compression_ratio: float = 200.0,
+        max_depth: int = 2,
+        hooks: Optional[Sequence[LoaderHooks]] = None,
+        record_stats: bool = False,
+        stream_info: Optional[Any] = None,
+    ):
+        super().__init__(
+            file_path, verbose=verbose, converter=converter, hooks=hooks, record_stats=record_stats,
+            stream_info=stream_info,
+        )
+        self.loader_mapping = loader_mapping or {}  # Merged over LOADER_BY_EXTENSION at load time
+        self.loader_kwargs = loader_kwargs or {}  # Per-extension (or loader class name) constructor kwargs
+        self.max_workers = max_workers or default_workers()
+        self.use_processes = use_processes
+        self.max_members = max_members
+        self.max_member_bytes = max_member_bytes
+        self.max_total_bytes = max_total_bytes
+        self.max_compression_ratio = max_compression_ratio
+        self.max_depth = max_depth
+        self._member_count = 0
+        self._total_bytes = 0
+
+    def _read_member(self, archive: zipfile.ZipFile, info: zipfile.ZipInfo) -> Tuple[Optional[bytes], Optional[str]]:
+        """Read a member's bytes within the limits, returning (data, None) or (None, error)."""
+        if info.file_size > self.max_member_bytes:
+            return None, f"Member exceeds max_member_bytes ({info.file_size} > {self.max_member_bytes})"
+        if info.compress_size and info.file_size / info.compress_size > self.max_compression_ratio:
+            return None, f"Member exceeds max_compression_ratio ({info.file_size / info.compress_size:.0f}x)"
+        if self._total_bytes + info.file_size > self.max_total_bytes:
+            raise ZipLimitError(f"Archive exceeds max_total_bytes ({self.max_total_bytes})")
+
+        try:
+            with archive.open(info) as member:
+                data = member.read(self.max_member_bytes + 1)  # Headers can lie about the size
+        except (RuntimeError, NotImplementedError, zipfile.BadZipFile, OSError) as e:
+            return None, str(e)  # Encrypted, unsupported compression or corrupt member
+        if len(data) > self.max_member_bytes:
+            return None, f"Member exceeds max_member_bytes (> {self.max_member_bytes})"
+        self._total_bytes += len(data)
+        if self._total_bytes > self.max_total_bytes:
+            raise ZipLimitError(f"Archive exceeds max_total_bytes ({self.max_total_bytes})")
+        return data, None
+
+    def _iter_members(self, archive: zipfile.ZipFile, prefix: str = "", depth: int = 0) -> Iterator[_Member]:
+        """Yield members in archive order, expanding nested archives up to max_depth."""
+        for info in archive.infolist():
+            if info.is_dir():
+                continue
+            self._member_count += 1
+            if self._member_count > self.max_members:
+                raise ZipLimitError(f"Archive exceeds max_members ({self.max_members})")
+
+            name = prefix + info.filename
+            with self._stage("read"):
+                data, error = self._read_member(archive, info)
+            if data is None or not info.filename.lower().endswith(".zip"):
+                yield _Member(name, info.file_size, data, error)
+            elif depth + 1 > self.max_depth:
+                yield _Member(name, info.file_size, None, f"Nested archive exceeds max_depth ({self.max_depth})")
+            else:
+                try:
+                    nested = zipfile.ZipFile(io.BytesIO(data))
+                except zipfile.BadZipFile as e:
+                    yield _Member(name, info.file_size, None, str(e))
+                    continue
+                with nested:
+                    yield from self._iter_members(nested, prefix=name + "/", depth=depth + 1)
+
+    def _member_metadata(self, member: _Member) -> Dict[str, Any]:
+        return {
+            "source": self.file_path,
+            "archive_path": self.file_path,
+            "member_name": member.name,
+            "file_name": posixpath.basename(member.name),
+            "file_size": member.size,
+        }
+
+    def _member_documents(self, member: _Member, future: Optional[Future]) -> List[Document]:
+        """The member's Documents, tagged with their archive location, or one error Document."""
+        error = member.error
+        if future is not None:
+            try:
+                with self._stage("convert"):
+                    documents = future.result()
+            except Exception as e:
+                error = str(e)
+            else:
+                for document in documents:
+                    document.metadata.update(self._member_metadata(member))
+                    document.metadata.setdefault("conversion_success", True)
+                return documents
+        metadata = self._member_metadata(member)
+        metadata.update({"conversion_success": False, "error": error})
+        return [Document(page_content="", metadata=metadata)]
+
+    def _resolve_loader(self, member_name: str) -> Tuple[Type[BaseMarkitdownLoader], Dict[str, Any]]:
+        """Pick the loader class and constructor kwargs for a member by its extension."""
+        from langchain_markitdown.directory_loader import LOADER_BY_EXTENSION  # Imports this module
+
+        extension = os.path.splitext(member_name)[1].lower()
+        loader_cls = {**LOADER_BY_EXTENSION, **self.loader_mapping}.get(extension, BaseMarkitdownLoader)
+        kwargs = self.loader_kwargs.get(extension)
+        if kwargs is None:
+            kwargs = self.loader_kwargs.get(loader_cls.__name__, {})
+        if self.converter is not None and not self.use_processes:
+            kwargs = {"converter": self.converter, **kwargs}
+        return loader_cls, kwargs
+
+    def _executor(self) -> Executor:
+        if self.use_processes:
+            return ProcessPoolExecutor(max_workers=self.max_workers)
+        return ThreadPoolExecutor(max_workers=self.max_workers)
+
+    def _submit(self, executor: Executor, member: _Member) -> Optional[Future]:
+        if member.data is None:
+            return None
+        loader_cls, loader_kwargs = self._resolve_loader(member.name)
+        return executor.submit(_load_member, member.data, member.name, loader_cls, loader_kwargs)
+
+    @instrumented
+    def lazy_load(self) -> Iterator[Document]:
+        """Yield each archive member's Documents, in archive order."""
+        self._member_count = 0
+        self._total_bytes = 0
+        try:
+            archive = zipfile.ZipFile(self._open_source())
+        except FileNotFoundError:
+            raise ValueError(f"Markitdown conversion failed for {self.file_path}: File not found")
+        except zipfile.BadZipFile as e:
+            raise ValueError(f"Markitdown conversion failed for {self.file_path}: {e}")
+
+        max_in_flight = self.max_workers * 2
+        pending: Deque[Tuple[_Member, Optional[Future]]] = deque()
+        with archive, self._executor() as executor:
+            try:
+                for member in self._iter_members(archive):
+                    pending.append((member, self._submit(executor, member)))
+                    while len(pending) >= max_in_flight:
+                        yield from self._member_documents(*pending.popleft())
+                while pending:
+                    yield from self._member_documents(*pending.popleft())
+            finally:
+                for _, future in pending:
+                    if future is not None:
+                        future.cancel()
+
+    def load(self) -> List[Document]:
+        return list(self.lazy_load())
@@ -72,3 +72,69 @@ def test_image_file(tmpdir_factory):
     img = Image.new('RGB', (100, 100), color = (73, 109, 137))
     img.save(fn)
     return str(fn)
+
+
+@pytest.fixture(scope="module")
+def test_pptx_with_images_file(tmpdir_factory):
+    """Creates a temporary PPTX file with one picture per slide."""
+    data_dir = tmpdir_factory.mktemp("data")
+    fn = data_dir.join("test_images.pptx")
+    try:
+        from pptx import Presentation
+        from pptx.util import Inches
+    except ImportError:
+        pytest.skip("pptx package not installed. Install with 'pip install python-pptx'")
+    prs = Presentation()
+    for index, color in enumerate([(255, 0, 0), (0, 255, 0), (0, 0, 255)]):
+        image_path = str(data_dir.join(f"image_{index}.png"))
+        Image.new('RGB', (64, 64), color=color).save(image_path)
+        slide = prs.slides.add_slide(prs.slide_layouts[5])
+        slide.shapes.title.text = f"Slide {index + 1}"
+        picture = slide.shapes.add_picture(image_path, Inches(1), Inches(1))
+        picture.name = f"Picture {index + 1}"
+    prs.save(fn)
+    return str(fn)
+
+
+@pytest.fixture
+def fake_caption_llm():
+    """A fake chat model that returns a fixed caption for every request."""
+    from langchain_core.language_models.fake_chat_models import FakeListChatModel
+    return FakeListChatModel(responses=["a fake caption"])
+
+
+def _write_pdf(path, page_texts):
+    """Write a minimal PDF with one line of Helvetica text per page."""
+    objects = ["<< /Type /Catalog /Pages 2 0 R >>", None, "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    kids = []
+    for text in page_texts:
+        stream = f"BT /F1 24 Tf 72 720 Td ({text}) Tj ET".encode("latin-1")
+        objects.append(f"<< /Length {len(stream)} >>\nstream\n{stream.decode('latin-1')}\nendstream")
+        content_id = len(objects)
+        objects.append(
+            "<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {content_id} 0 R >>"
+        )
+        kids.append(f"{len(objects)} 0 R")
+    objects[1] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {len(kids)} >>"
+
+    output = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(output))
+        output += f"{number} 0 obj\n{body}\nendobj\n".encode("latin-1")
+    xref = len(output)
+    output += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode("latin-1")
+    for offset in offsets:
+        output += f"{offset:010d} 00000 n \n".encode("latin-1")
+    output += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode("latin-1")
+    with open(path, "wb") as f:
+        f.write(bytes(output))
+
+
+@pytest.fixture(scope="module")
+def test_pdf_file(tmpdir_factory):
+    """Creates a temporary five-page PDF file for testing."""
+    fn = tmpdir_factory.mktemp("data").join("test.pdf")
+    _write_pdf(str(fn), [f"Page {number} text" for number in range(1, 6)])
+    return str(fn)
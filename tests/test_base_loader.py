@@ -1,3 +1,4 @@
+import io
 import pytest
 from langchain_markitdown import BaseMarkitdownLoader
 from unittest.mock import patch
@@ -20,4 +21,40 @@ def test_base_loader_invalid_file():
             loader = BaseMarkitdownLoader("invalid_file.xyz")
             loader.load()
         
-        assert "Markitdown conversion failed" in str(excinfo.value)
\ No newline at end of file
+        assert "Markitdown conversion failed" in str(excinfo.value)
+
+
+def test_base_loader_aload(test_text_file):
+    """Test the async loading path of BaseMarkitdownLoader."""
+    import asyncio
+    loader = BaseMarkitdownLoader(test_text_file, max_concurrency=1)
+    documents = asyncio.run(loader.aload())
+    assert len(documents) == 1
+    assert "This is a test file." in documents[0].page_content
+
+
+@pytest.mark.parametrize("wrap", [bytes, memoryview, io.BytesIO])
+def test_base_loader_in_memory_source(test_text_file, wrap):
+    """Test loading bytes, a memoryview or a binary stream without touching the filesystem."""
+    from markitdown import StreamInfo
+    with open(test_text_file, "rb") as file:
+        data = file.read()
+
+    with patch("builtins.open", side_effect=AssertionError("no file access")):
+        loader = BaseMarkitdownLoader(wrap(data), stream_info=StreamInfo(filename="notes.md"))
+        documents = loader.load()
+    assert "This is a test file." in documents[0].page_content
+    assert documents[0].metadata["source"] == "notes.md"
+    assert documents[0].metadata["file_name"] == "notes.md"
+    assert documents[0].metadata["file_size"] == len(data)
+
+
+def test_base_loader_chunker(test_text_file):
+    """Test that a chunker turns the converted markdown into header-aware chunks."""
+    from langchain_markitdown import MarkdownChunker
+    documents = BaseMarkitdownLoader(test_text_file, chunker=MarkdownChunker()).load()
+
+    assert [d.metadata.get("Header 2") for d in documents] == [None, None, "Header 2"]
+    assert documents[1].metadata["Header 1"] == "Header 1"
+    assert documents[1].page_content == "Some content."
+    assert all(d.metadata["source"] == test_text_file for d in documents)
@@ -0,0 +1,45 @@
+import json
+import pytest
+
+benchmarks_run = pytest.importorskip("benchmarks.run")
+from benchmarks.compare import compare
+
+
+def test_percentile_nearest_rank():
+    """Test the nearest-rank percentile used for latency reporting."""
+    values = [0.5, 0.1, 0.4, 0.2, 0.3]
+    assert benchmarks_run.percentile(values, 0.5) == 0.3
+    assert benchmarks_run.percentile(values, 0.99) == 0.5
+
+
+def test_run_case_reports_stages(tmp_path):
+    """Test a single small benchmark case end to end, including the fake captioning LLM."""
+    result = benchmarks_run.run_case("pptx", "small", repeat=1, corpus_dir=str(tmp_path), caption_latency=0.0)
+    assert result["documents"] == 5
+    assert result["llm_calls_per_load"] == 2
+    assert {"convert", "metadata", "caption", "split", "other"} <= set(result["stages_s"])
+    assert result["latency_s"]["p50"] > 0
+
+
+def test_run_case_reports_parallel_speedup(tmp_path):
+    """Test that the parallel PPTX case reuses the PPTX corpus and reports its speedup over a serial load."""
+    result = benchmarks_run.run_case("pptx_parallel", "small", repeat=1, corpus_dir=str(tmp_path), caption_latency=0.0)
+    assert result["documents"] == 5
+    assert result["parameters"] == benchmarks_run.PARAMETERS["pptx"]["small"]
+    assert result["speedup"] == result["serial_latency_s"]["p50"] / result["latency_s"]["p50"]
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["pptx-small.pptx"]
+
+
+def test_compare_flags_regressions(tmp_path, capsys):
+    """Test that a slower candidate run is reported as a regression."""
+    def report(p50):
+        return {"results": [{
+            "format": "text", "scale": "small", "latency_s": {"p50": p50},
+            "peak_rss_bytes": 100, "stages_s": {"convert": p50},
+        }]}
+
+    baseline, candidate = tmp_path / "a.json", tmp_path / "b.json"
+    baseline.write_text(json.dumps(report(1.0)))
+    candidate.write_text(json.dumps(report(1.5)))
+    assert compare(str(baseline), str(candidate), threshold=0.1) == ["text:small: p50 latency +50.0%"]
+    assert compare(str(baseline), str(baseline), threshold=0.1) == []
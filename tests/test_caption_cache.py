@@ -0,0 +1,68 @@
+import io
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+from langchain_markitdown import InMemoryCaptionCache, SQLiteCaptionCache, PptxLoader
+from langchain_markitdown.caption_cache import make_caption_key
+from langchain_markitdown.utils import get_image_caption
+
+
+class _StreamInfo:
+    mimetype = "image/png"
+    extension = ".png"
+
+
+def test_caption_key_depends_on_image_prompt_and_model():
+    """Test that the cache key covers image digest, prompt and model identity."""
+    llm = FakeListChatModel(responses=["x"])
+    key = make_caption_key(b"image", "prompt", llm)
+    assert key == make_caption_key(b"image", "prompt", llm)
+    assert key != make_caption_key(b"other", "prompt", llm)
+    assert key != make_caption_key(b"image", "other prompt", llm)
+    assert key != make_caption_key(b"image", "prompt", None)
+
+
+def test_in_memory_cache_lru_eviction():
+    """Test that the in-memory cache evicts the least recently used entry."""
+    cache = InMemoryCaptionCache(max_entries=2)
+    cache.set("a", "A")
+    cache.set("b", "B")
+    assert cache.lookup("a") == "A"
+    cache.set("c", "C")
+    assert cache.lookup("b") is None
+    assert cache.stats == {"hits": 1, "misses": 1, "size": 2}
+
+
+def test_sqlite_cache_persists_and_evicts(tmp_path):
+    """Test that the SQLite cache persists across instances and caps its size."""
+    path = str(tmp_path / "captions.sqlite")
+    cache = SQLiteCaptionCache(path, max_entries=2)
+    cache.set("a", "A")
+    cache.set("b", "B")
+    cache.set("c", "C")
+    assert len(cache) == 2
+    cache.close()
+
+    reopened = SQLiteCaptionCache(path, max_entries=2)
+    assert reopened.lookup("c") == "C"
+    assert reopened.lookup("a") is None
+    assert reopened.stats["hits"] == 1
+
+
+def test_get_image_caption_uses_cache():
+    """Test that identical images only reach the LLM once."""
+    llm = FakeListChatModel(responses=["first", "second"])
+    cache = InMemoryCaptionCache()
+    captions = [
+        get_image_caption(llm, io.BytesIO(b"same image"), _StreamInfo(), cache=cache)
+        for _ in range(3)
+    ]
+    assert captions == ["first", "first", "first"]
+    assert cache.stats == {"hits": 2, "misses": 1, "size": 1}
+
+
+def test_pptx_loader_consults_caption_cache(test_pptx_with_images_file, fake_caption_llm):
+    """Test that a second load of the same deck is served from the cache."""
+    cache = InMemoryCaptionCache()
+    PptxLoader(test_pptx_with_images_file, llm=fake_caption_llm, caption_cache=cache).load()
+    documents = PptxLoader(test_pptx_with_images_file, llm=fake_caption_llm, caption_cache=cache).load()
+    assert documents[0].page_content.count("![a fake caption]") == 3
+    assert cache.stats == {"hits": 3, "misses": 3, "size": 3}
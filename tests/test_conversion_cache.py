@@ -0,0 +1,95 @@
+import os
+from unittest.mock import patch
+from langchain_markitdown import ConversionCache, DocxLoader, PlainTextLoader, PptxLoader, get_converter
+
+
+def test_conversion_cache_roundtrip_compressed(tmp_path):
+    """Test that entries round-trip and are stored compressed."""
+    cache = ConversionCache(str(tmp_path), compress=True)
+    key = cache.make_key("digest", "DocxLoader", {"option": 1})
+    assert cache.get(key) is None
+    cache.set(key, "# Title\n" * 1000)
+    assert cache.get(key) == "# Title\n" * 1000
+    assert cache.size_bytes < len("# Title\n" * 1000)
+    assert cache.stats["hits"] == 1 and cache.stats["misses"] == 1
+
+
+def test_conversion_cache_key_covers_loader_and_options():
+    """Test that the key changes with loader class and options."""
+    key = ConversionCache.make_key("digest", "DocxLoader")
+    assert key != ConversionCache.make_key("other", "DocxLoader")
+    assert key != ConversionCache.make_key("digest", "PptxLoader")
+    assert key != ConversionCache.make_key("digest", "DocxLoader", {"option": 1})
+
+
+def test_conversion_cache_evicts_least_recently_used(tmp_path):
+    """Test that the cache stays under max_bytes by evicting the oldest entries."""
+    cache = ConversionCache(str(tmp_path), max_bytes=2500, compress=False)
+    for index, key in enumerate(["a" * 64, "b" * 64, "c" * 64]):
+        cache.set(key, "x" * 1000)
+        os.utime(cache._path(key), ns=(index * 10**9, index * 10**9))
+    assert cache.get("a" * 64) is None
+    assert cache.get("c" * 64) == "x" * 1000
+    assert cache.size_bytes <= 2500
+
+
+def test_loaders_reuse_cached_markdown(tmp_path, test_docx_file, test_pptx_file, test_text_file):
+    """Test that a second load with a different split setting skips conversion."""
+    cache = ConversionCache(str(tmp_path))
+    converter = get_converter()
+    for loader_cls, file_path in [(DocxLoader, test_docx_file), (PptxLoader, test_pptx_file)]:
+        first = loader_cls(file_path, conversion_cache=cache).load()
+        with patch.object(converter, "convert_stream", wraps=converter.convert_stream) as convert_stream:
+            second = loader_cls(file_path, split_by_page=True, conversion_cache=cache).load()
+        convert_stream.assert_not_called()
+        assert "".join(d.page_content for d in second).strip() in first[0].page_content
+
+    first = PlainTextLoader(test_text_file, conversion_cache=cache).load()
+    second = PlainTextLoader(test_text_file, conversion_cache=cache).load()
+    assert first[0].page_content == second[0].page_content
+    assert cache.hits == 3
+
+
+def test_conversion_cache_evicts_to_low_water_mark(tmp_path):
+    """Test that eviction frees headroom, so the next writes do not rescan the directory."""
+    cache = ConversionCache(str(tmp_path), max_bytes=10_000, compress=False)
+    for index in range(10):
+        cache.set(f"{index:064d}", "x" * 1000)
+    cache.set("f" * 64, "x" * 1000)
+    assert cache.size_bytes <= 9000
+
+    with patch.object(cache, "_evict", wraps=cache._evict) as evict:
+        cache.set("e" * 64, "x" * 500)
+    evict.assert_not_called()
+
+
+def test_conversion_cache_treats_damaged_entries_as_misses(tmp_path):
+    """Test that a corrupt entry is deleted and reported as a miss instead of failing the load."""
+    cache = ConversionCache(str(tmp_path), compress=True)
+    key = "d" * 64
+    cache.set(key, "# Title")
+    with open(cache._path(key), "wb") as file:
+        file.write(b"not zlib data")
+
+    assert cache.get(key) is None
+    assert not os.path.exists(cache._path(key))
+    assert cache.misses == 1
+
+
+def test_conversion_cache_key_covers_converter_config(tmp_path, test_text_file):
+    """Test that differently configured converters do not share entries."""
+    class FakeConverter:
+        def convert_stream(self, stream, stream_info=None):
+            return type("Result", (), {"text_content": "converted by a fake"})()
+
+    cache = ConversionCache(str(tmp_path))
+    pooled = PlainTextLoader(test_text_file, conversion_cache=cache).load()
+    injected = PlainTextLoader(test_text_file, converter=FakeConverter(), conversion_cache=cache).load()
+    assert injected[0].page_content == "converted by a fake"
+    assert pooled[0].page_content != injected[0].page_content
+
+    configured = get_converter(llm_model="captioner")
+    assert PlainTextLoader(test_text_file, converter=configured, conversion_cache=cache).load() == pooled
+    assert cache.hits == 0 and cache.misses == 3
+    assert PlainTextLoader(test_text_file, converter=configured, conversion_cache=cache).load() == pooled
+    assert cache.hits == 1
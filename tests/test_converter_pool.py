@@ -0,0 +1,37 @@
+import threading
+from unittest.mock import MagicMock
+from langchain_markitdown import PlainTextLoader, get_converter, clear_converters
+
+
+def test_get_converter_reuses_instance():
+    """Test that the same configuration returns the same pooled converter."""
+    assert get_converter() is get_converter()
+    assert get_converter() is not get_converter(enable_plugins=True)
+
+
+def test_get_converter_keys_unhashable_config_by_identity():
+    """Test that unhashable config values such as clients are keyed by identity."""
+    client = {"name": "fake-client"}
+    assert get_converter(llm_client=client) is get_converter(llm_client=client)
+    assert get_converter(llm_client=client) is not get_converter(llm_client={"name": "fake-client"})
+
+
+def test_get_converter_is_thread_safe():
+    """Test that concurrent callers share a single instance."""
+    clear_converters()
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(get_converter())) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len({id(c) for c in results}) == 1
+
+
+def test_loader_uses_injected_converter(test_text_file):
+    """Test that loaders use a converter passed to the constructor."""
+    converter = MagicMock()
+    converter.convert_stream.return_value.text_content = "injected"
+    documents = PlainTextLoader(test_text_file, converter=converter).load()
+    assert documents[0].page_content == "injected"
+    converter.convert_stream.assert_called_once()
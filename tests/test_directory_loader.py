@@ -0,0 +1,120 @@
+import shutil
+import pytest
+from langchain_markitdown import MarkitdownDirectoryLoader
+from langchain_markitdown.directory_loader import sniff_extension
+
+
+@pytest.fixture
+def mixed_directory(tmp_path, test_docx_file, test_xlsx_file, test_text_file):
+    """A directory with office files, a text file, a corrupt deck and a nested folder."""
+    shutil.copy(test_docx_file, tmp_path / "report.docx")
+    shutil.copy(test_xlsx_file, tmp_path / "numbers.xlsx")
+    (tmp_path / "nested").mkdir()
+    shutil.copy(test_text_file, tmp_path / "nested" / "notes.txt")
+    (tmp_path / "broken.pptx").write_bytes(b"PK\x03\x04\x00\x01\x02\xff\xfe truncated")
+    return tmp_path
+
+
+def _by_name(documents):
+    return {d.metadata["file_name"]: d for d in documents}
+
+
+@pytest.mark.parametrize("use_processes", [False, True])
+def test_directory_loader_dispatches_and_isolates_errors(mixed_directory, use_processes):
+    """Test that each file is routed to its loader and a corrupt file becomes an error Document."""
+    loader = MarkitdownDirectoryLoader(str(mixed_directory), max_workers=2, use_processes=use_processes)
+    documents = _by_name(loader.lazy_load())
+
+    assert set(documents) == {"report.docx", "numbers.xlsx", "notes.txt", "broken.pptx"}
+    assert documents["report.docx"].metadata["conversion_success"] is True
+    assert "This is a test file." in documents["notes.txt"].page_content
+    assert documents["broken.pptx"].metadata["conversion_success"] is False
+    assert documents["broken.pptx"].metadata["error"]
+
+
+def test_directory_loader_glob_and_loader_kwargs(mixed_directory):
+    """Test glob inputs and per-extension loader options."""
+    loader = MarkitdownDirectoryLoader(
+        [str(mixed_directory / "*.xlsx"), str(mixed_directory / "nested" / "notes.txt")],
+        loader_kwargs={".xlsx": {"split_by_page": True}},
+    )
+    documents = loader.load()
+
+    assert {d.metadata["file_name"] for d in documents} == {"numbers.xlsx", "notes.txt"}
+    assert any("page_number" in d.metadata for d in documents)
+
+
+def test_sniff_extension_for_unnamed_office_file(tmp_path, test_docx_file):
+    """Test that OOXML files without an extension are sniffed by content."""
+    target = tmp_path / "no_extension"
+    shutil.copy(test_docx_file, target)
+    assert sniff_extension(str(target)) == ".docx"
+
+
+def test_directory_loader_manifest_skips_unchanged_files(mixed_directory, tmp_path_factory):
+    """Test incremental re-ingestion: unchanged files are skipped, changes and deletions reported."""
+    import os
+    from langchain_markitdown import FileManifest
+
+    (mixed_directory / "broken.pptx").unlink()
+    manifest = FileManifest(str(tmp_path_factory.mktemp("manifest") / "manifest.sqlite"))
+
+    first = MarkitdownDirectoryLoader(str(mixed_directory), manifest=manifest)
+    documents = _by_name(first.load())
+    assert set(documents) == {"report.docx", "numbers.xlsx", "notes.txt"}
+    assert all(d.id for d in documents.values())
+    assert len(manifest) == 3
+
+    notes = mixed_directory / "nested" / "notes.txt"
+    notes.write_text("Changed content.", encoding="utf-8")
+    # Touch without modifying content: re-hashed, but not reconverted
+    report = mixed_directory / "report.docx"
+    os.utime(report, ns=(report.stat().st_atime_ns, report.stat().st_mtime_ns + 10**9))
+    (mixed_directory / "numbers.xlsx").unlink()
+
+    second = MarkitdownDirectoryLoader(str(mixed_directory), manifest=manifest)
+    changed = _by_name(second.load())
+
+    assert set(changed) == {"notes.txt"}
+    assert "Changed content." in changed["notes.txt"].page_content
+    assert sorted(os.path.basename(p) for p in second.skipped) == ["report.docx"]
+    assert [os.path.basename(p) for p in second.deleted] == ["numbers.xlsx"]
+    assert documents["notes.txt"].id in second.stale_document_ids
+    assert documents["numbers.xlsx"].id in second.stale_document_ids
+
+    third = MarkitdownDirectoryLoader(str(mixed_directory), manifest=manifest)
+    assert third.load() == []
+    assert len(third.skipped) == 2
+
+
+def test_directory_loaders_share_one_manifest(tmp_path, monkeypatch):
+    """Test that a run only reports deletions within its own directories and glob."""
+    import os
+    from langchain_markitdown import FileManifest
+
+    for name in ("a", "b"):
+        (tmp_path / name).mkdir()
+        (tmp_path / name / "1.txt").write_text(f"File in {name}.", encoding="utf-8")
+    (tmp_path / "a" / "2.md").write_text("Markdown in a.", encoding="utf-8")
+    manifest = FileManifest(str(tmp_path / "manifest.sqlite"))
+
+    assert len(MarkitdownDirectoryLoader(str(tmp_path / "a"), manifest=manifest).load()) == 2
+    other = MarkitdownDirectoryLoader(str(tmp_path / "b"), manifest=manifest)
+    assert len(other.load()) == 1
+    assert other.deleted == {} and other.stale_document_ids == []
+    assert len(manifest) == 3
+
+    # A narrower glob over the same directory leaves the other files' entries alone
+    only_text = MarkitdownDirectoryLoader(str(tmp_path / "a"), glob="*.txt", manifest=manifest)
+    assert only_text.load() == [] and only_text.deleted == {}
+
+    # Relative paths from another cwd resolve to the same entries
+    monkeypatch.chdir(tmp_path)
+    rerun = MarkitdownDirectoryLoader("a", manifest=manifest)
+    assert rerun.load() == [] and len(rerun.skipped) == 2
+
+    (tmp_path / "a" / "1.txt").unlink()
+    rerun = MarkitdownDirectoryLoader("a", manifest=manifest)
+    assert rerun.load() == []
+    assert list(rerun.deleted) == [os.path.join(str(tmp_path), "a", "1.txt")]
+    assert len(manifest) == 2
@@ -30,4 +30,60 @@ def test_docx_loader_with_split_by_page(test_docx_file):
     non_split_loader = DocxLoader(test_docx_file, split_by_page=False)
     non_split_docs = non_split_loader.load()
     # This just verifies split_by_page has some effect, even if not adding page_number
-    assert len(documents) >= len(non_split_docs)
\ No newline at end of file
+    assert len(documents) >= len(non_split_docs)
+
+
+def test_docx_loader_reads_core_properties_without_python_docx():
+    """Test that core properties come from docProps/core.xml without a python-docx parse."""
+    from unittest.mock import patch
+    with patch("docx.Document") as docx_document:
+        documents = DocxLoader("test_data/test_docx.docx").load()
+    docx_document.assert_not_called()
+
+    metadata = documents[0].metadata
+    assert metadata["author"] == "Nathan Sasto"
+    assert metadata["last_modified_by"] == "Nathan Sasto"
+    assert metadata["revision"] == 2
+    assert metadata["created"] == "2025-04-08 13:25:00+00:00"
+    assert "title" not in metadata  # Empty properties are skipped
+
+
+def test_docx_loader_from_stream(test_docx_file):
+    """Test loading a DOCX from a seekable stream, starting at its current position."""
+    import io
+    from markitdown import StreamInfo
+    with open(test_docx_file, "rb") as file:
+        data = file.read()
+    stream = io.BytesIO(b"prefix" + data)
+    stream.seek(len(b"prefix"))
+
+    documents = DocxLoader(stream, stream_info=StreamInfo(extension=".docx")).load()
+    assert "This is a test document." in documents[0].page_content
+    assert documents[0].metadata["source"] == "<stream>"
+    assert documents[0].metadata["file_size"] == len(data)
+
+
+def test_docx_loader_splits_by_section(tmp_path):
+    """Test that split_by_page yields one Document per header section, not per line."""
+    from docx import Document as DocxDocument
+    from langchain_markitdown import MarkdownChunker
+    doc = DocxDocument()
+    doc.add_heading("Overview", level=1)
+    for index in range(3):
+        doc.add_paragraph(f"Overview paragraph {index}.")
+    doc.add_heading("Details", level=2)
+    for index in range(30):
+        doc.add_paragraph(f"Details paragraph {index} with some filler text.")
+    fn = str(tmp_path / "sections.docx")
+    doc.save(fn)
+
+    sections = DocxLoader(fn, split_by_page=True).load()
+    assert [d.metadata.get("Header 2") for d in sections] == [None, "Details"]
+    assert sections[0].metadata["Header 1"] == "Overview"
+    assert "Overview paragraph 2." in sections[0].page_content
+    assert sections[1].metadata["file_name"] == "sections.docx"
+
+    chunks = DocxLoader(fn, split_by_page=True, chunker=MarkdownChunker(chunk_size=400)).load()
+    assert len(chunks) > 2
+    assert all(len(d.page_content) <= 400 for d in chunks)
+    assert [d.metadata["chunk_index"] for d in chunks] == list(range(len(chunks)))
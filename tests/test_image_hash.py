@@ -0,0 +1,39 @@
+import io
+from langchain_markitdown.image_hash import group_near_duplicates, hamming_distance, image_fingerprint
+
+
+def _logo(size, image_format="PNG", color=(200, 30, 30)):
+    from PIL import Image, ImageDraw
+    image = Image.new("RGB", (200, 200), (255, 255, 255))
+    draw = ImageDraw.Draw(image)
+    draw.ellipse((20, 20, 120, 120), fill=color)
+    draw.rectangle((100, 110, 190, 180), fill=(20, 20, 160))
+    buffer = io.BytesIO()
+    image.resize((size, size)).save(buffer, image_format)
+    return buffer.getvalue()
+
+
+def test_fingerprint_survives_resize_and_reencoding():
+    """Test that the same artwork at another size and format is a near duplicate."""
+    a = image_fingerprint(_logo(200))
+    b = image_fingerprint(_logo(64, "JPEG"))
+    assert hamming_distance(a.dhash, b.dhash) <= 5
+
+
+def test_group_near_duplicates_keeps_distinct_images_apart():
+    """Test grouping, including flat images that only differ in colour."""
+    from PIL import Image
+
+    def flat(color):
+        buffer = io.BytesIO()
+        Image.new("RGB", (32, 32), color).save(buffer, "PNG")
+        return buffer.getvalue()
+
+    fingerprints = [
+        image_fingerprint(_logo(200)),
+        image_fingerprint(flat((255, 0, 0))),
+        image_fingerprint(_logo(90, "JPEG")),
+        image_fingerprint(flat((0, 0, 255))),
+        None,
+    ]
+    assert group_near_duplicates(fingerprints) == [[0, 2], [1], [3], [4]]
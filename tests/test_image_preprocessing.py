@@ -0,0 +1,52 @@
+import io
+import pytest
+from langchain_markitdown import ImagePreprocessor
+from langchain_markitdown.utils import get_image_caption
+
+
+def _image_bytes(size, image_format="PNG", mode="RGB"):
+    from PIL import Image
+    buffer = io.BytesIO()
+    Image.effect_noise(size, 64).convert(mode).save(buffer, image_format)
+    return buffer.getvalue()
+
+
+def test_preprocessor_downscales_large_images():
+    """Test that oversized images are shrunk to max_edge and re-encoded."""
+    from PIL import Image
+    data = _image_bytes((3000, 1500))
+
+    prepared = ImagePreprocessor(max_edge=512)(data, "image/png")
+    assert prepared.mimetype == "image/jpeg"
+    assert len(prepared.data) < len(data)
+    assert Image.open(io.BytesIO(prepared.data)).size == (512, 256)
+
+
+def test_preprocessor_passes_compact_images_through():
+    """Test that a small JPEG is returned as the same object, without a copy."""
+    data = _image_bytes((200, 100), "JPEG")
+    prepared = ImagePreprocessor(max_edge=512)(data, "image/jpeg")
+    assert prepared.data is data
+    assert prepared.mimetype == "image/jpeg"
+
+
+def test_preprocessor_flattens_transparency_for_jpeg():
+    """Test that RGBA images are composited before JPEG encoding."""
+    data = _image_bytes((2000, 2000), mode="RGBA")
+    prepared = ImagePreprocessor(max_edge=256)(data, "image/png")
+    assert prepared.mimetype == "image/jpeg"
+
+
+@pytest.mark.parametrize("kwargs", [{"min_edge": 32}, {"min_bytes": 10_000}])
+def test_preprocessor_skips_decorative_images(kwargs):
+    """Test that tiny images are rejected."""
+    data = _image_bytes((400, 8))
+    assert ImagePreprocessor(**kwargs)(data, "image/png") is None
+
+
+def test_get_image_caption_skips_without_llm_call(fake_caption_llm):
+    """Test that skipped images never reach the model."""
+    data = _image_bytes((4, 4))
+    stream_info = type("StreamInfo", (object,), {"mimetype": "image/png", "extension": ".png"})()
+    caption = get_image_caption(fake_caption_llm, io.BytesIO(data), stream_info, preprocessor=ImagePreprocessor())
+    assert caption is None
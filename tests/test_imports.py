@@ -0,0 +1,69 @@
+import json
+import os
+import subprocess
+import sys
+import pytest
+
+HEAVY_MODULES = ["langchain_core", "langchain_text_splitters", "markitdown", "pandas", "PIL", "pptx"]
+
+
+def _modules_after(code):
+    """Run ``code`` in a fresh interpreter and return the modules it ended up importing."""
+    script = f"import sys\n{code}\nimport json\nprint(json.dumps(sorted(sys.modules)))"
+    env = dict(os.environ)
+    src = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [src, env.get("PYTHONPATH")]))
+    output = subprocess.run([sys.executable, "-c", script], env=env, check=True, capture_output=True, text=True).stdout
+    return set(json.loads(output.splitlines()[-1]))
+
+
+def _heavy(modules):
+    return sorted(m for m in modules if m.split(".")[0] in HEAVY_MODULES)
+
+
+def test_package_import_is_lazy():
+    """Test that importing the package loads no loader module or third-party dependency."""
+    modules = _modules_after("import langchain_markitdown")
+    assert _heavy(modules) == []
+    assert [m for m in modules if m.startswith("langchain_markitdown.")] == []
+
+
+@pytest.mark.parametrize("code", [
+    "from langchain_markitdown import ConversionCache, FileManifest, InMemoryCaptionCache, ImagePreprocessor",
+    "from langchain_markitdown.utils import get_image_format",
+])
+def test_utilities_do_not_import_langchain(code):
+    """Test that caches and image helpers stay free of LangChain and converter imports."""
+    assert _heavy(_modules_after(code)) == []
+
+
+@pytest.mark.parametrize("name", ["PlainTextLoader", "PptxLoader"])
+def test_loader_import_skips_chat_model_machinery(name):
+    """Test that importing a loader leaves LangChain's runnables, messages and models unloaded."""
+    modules = _modules_after(f"from langchain_markitdown import {name}")
+    assert "langchain_core.messages" not in modules
+    assert "langchain_core.language_models" not in modules
+    assert "langchain_core.runnables" not in modules
+    assert "asyncio" not in modules
+
+
+@pytest.mark.parametrize("order", [
+    "from langchain_markitdown import PlainTextLoader\nfrom langchain_core.document_loaders import BaseLoader",
+    "from langchain_core.document_loaders import BaseLoader\nfrom langchain_markitdown import PlainTextLoader",
+])
+def test_loaders_are_langchain_base_loaders(order):
+    """Test that loaders count as LangChain BaseLoaders whichever module is imported first."""
+    code = f"{order}\nassert issubclass(PlainTextLoader, BaseLoader)\nassert isinstance(PlainTextLoader('x.txt'), BaseLoader)"
+    _modules_after(code)
+
+
+def test_lazy_attributes_resolve_and_cache():
+    """Test that public names resolve on first access and unknown names still raise."""
+    import langchain_markitdown
+    from langchain_markitdown.pptx_loader import PptxLoader
+
+    assert langchain_markitdown.PptxLoader is PptxLoader
+    assert "PptxLoader" in vars(langchain_markitdown)
+    assert set(langchain_markitdown.__all__) <= set(dir(langchain_markitdown))
+    with pytest.raises(AttributeError):
+        langchain_markitdown.NoSuchLoader
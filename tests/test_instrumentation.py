@@ -0,0 +1,102 @@
+import asyncio
+import pytest
+from langchain_markitdown import (
+    ConversionCache, DocxLoader, InMemoryCaptionCache, LoaderHooks, PdfLoader, PlainTextLoader, PptxLoader,
+    register_hooks, unregister_hooks,
+)
+
+
+class RecordingHooks(LoaderHooks):
+    def __init__(self):
+        self.events = []
+        self.finished = []
+
+    def on_load_start(self, stats):
+        self.events.append(("start", stats.source))
+
+    def on_stage_end(self, stats, stage, seconds):
+        self.events.append(("stage", stage))
+
+    def on_load_end(self, stats):
+        self.finished.append(stats)
+
+
+def test_hooks_receive_stages_and_counters(test_docx_file):
+    """Test that a load reports read/convert/metadata/split timings and byte/char counts."""
+    hooks = RecordingHooks()
+    documents = DocxLoader(test_docx_file, split_by_page=True, hooks=[hooks]).load()
+
+    assert hooks.events[0] == ("start", test_docx_file)
+    (stats,) = hooks.finished
+    assert {"read", "convert", "metadata", "split"} <= set(stats.stages)
+    assert stats.counters["documents"] == len(documents)
+    assert stats.counters["chars_out"] == sum(len(d.page_content) for d in documents)
+    assert stats.counters["bytes_in"] == documents[0].metadata["file_size"]
+    assert stats.total_seconds >= sum(stats.stages.values()) * 0.99
+    assert "load_stats" not in documents[0].metadata
+
+
+def test_record_stats_in_metadata_counts_llm_calls(test_pptx_with_images_file, fake_caption_llm):
+    """Test that captioning calls and cache hits are recorded in metadata."""
+    cache = InMemoryCaptionCache()
+    first = PptxLoader(test_pptx_with_images_file, llm=fake_caption_llm, caption_cache=cache, record_stats=True).load()
+    second = PptxLoader(test_pptx_with_images_file, llm=fake_caption_llm, caption_cache=cache, record_stats=True).load()
+
+    assert first[0].metadata["load_stats"]["llm_calls"] == 3
+    assert "caption" in first[0].metadata["load_stats"]["stages_s"]
+    assert second[0].metadata["load_stats"]["caption_cache_hits"] == 3
+    assert "llm_calls" not in second[0].metadata["load_stats"]
+
+
+def test_split_documents_share_final_stats(test_pdf_file):
+    """Test that every page Document sees the final totals once the load completes."""
+    documents = PdfLoader(test_pdf_file, split_by_page=True, record_stats=True).load()
+    assert documents[0].metadata["load_stats"] is documents[-1].metadata["load_stats"]
+    assert documents[0].metadata["load_stats"]["documents"] == 5
+    assert documents[0].metadata["load_stats"]["stages_s"]["convert"] > 0
+
+
+def test_conversion_cache_hits_are_counted(test_text_file, tmp_path):
+    """Test that conversion cache hits show up in the stats."""
+    cache = ConversionCache(str(tmp_path / "cache"))
+    hooks = RecordingHooks()
+    for _ in range(2):
+        PlainTextLoader(test_text_file, conversion_cache=cache, hooks=[hooks]).load()
+    assert "conversion_cache_hits" not in hooks.finished[0].counters
+    assert hooks.finished[1].counters["conversion_cache_hits"] == 1
+
+
+def test_global_hooks_and_failing_hooks(test_text_file):
+    """Test globally registered hooks, and that a failing hook never breaks a load."""
+    class BrokenHooks(LoaderHooks):
+        def on_stage_end(self, stats, stage, seconds):
+            raise RuntimeError("boom")
+
+    hooks = RecordingHooks()
+    register_hooks(hooks)
+    try:
+        documents = PlainTextLoader(test_text_file, hooks=[BrokenHooks()]).load()
+    finally:
+        unregister_hooks(hooks)
+    assert documents[0].page_content
+    assert len(hooks.finished) == 1
+    PlainTextLoader(test_text_file).load()
+    assert len(hooks.finished) == 1
+
+
+def test_async_load_is_instrumented(test_pptx_with_images_file, fake_caption_llm):
+    """Test that PptxLoader.alazy_load reports through the same hooks."""
+    hooks = RecordingHooks()
+    loader = PptxLoader(test_pptx_with_images_file, llm=fake_caption_llm, hooks=[hooks])
+    documents = asyncio.run(loader.aload())
+    (stats,) = hooks.finished
+    assert stats.counters["llm_calls"] == 3
+    assert stats.counters["documents"] == len(documents)
+
+
+def test_errors_are_recorded(tmp_path):
+    """Test that a failed load still emits on_load_end with the error."""
+    hooks = RecordingHooks()
+    with pytest.raises(ValueError):
+        PlainTextLoader(str(tmp_path / "missing.txt"), hooks=[hooks]).load()
+    assert "missing.txt" in hooks.finished[0].error
@@ -0,0 +1,89 @@
+import pytest
+from langchain_markitdown import MarkdownChunker
+
+MARKDOWN = """Preamble text.
+
+# Intro
+
+Intro paragraph.
+
+## Scope
+
+Scope paragraph.
+
+```python
+# not a heading
+```
+
+#### Minor heading
+
+Still in scope.
+
+# Results ##
+
+Results paragraph.
+"""
+
+
+def test_chunker_groups_content_under_heading_path():
+    """Test sections, heading paths, code fences and unconfigured heading levels."""
+    chunks = list(MarkdownChunker().iter_chunks(MARKDOWN))
+
+    assert [chunk.headers for chunk in chunks] == [
+        {},
+        {"Header 1": "Intro"},
+        {"Header 1": "Intro", "Header 2": "Scope"},
+        {"Header 1": "Results"},
+    ]
+    assert chunks[0].content == "Preamble text."
+    assert "# not a heading" in chunks[2].content
+    assert "#### Minor heading" in chunks[2].content
+    assert chunks[3].content == "Results paragraph."
+
+
+def test_chunker_matches_header_splitter_sections():
+    """Test that sections agree with MarkdownHeaderTextSplitter on plain markdown."""
+    MarkdownHeaderTextSplitter = pytest.importorskip("langchain_text_splitters").MarkdownHeaderTextSplitter
+    text = "# A\n\nalpha\n\n## B\n\nbeta\n\n### C\n\ngamma\n\n# D\n\ndelta"
+    headers = [("#", "Header 1"), ("##", "Header 2"), ("###", "Header 3")]
+
+    expected = MarkdownHeaderTextSplitter(headers).split_text(text)
+    actual = MarkdownChunker(headers).split_text(text)
+    assert [d.metadata for d in actual] == [d.metadata for d in expected]
+    assert [d.page_content for d in actual] == [d.page_content for d in expected]
+
+
+def test_chunker_bounds_chunk_size_with_overlap():
+    """Test that long sections are cut within the budget and consecutive pieces overlap."""
+    paragraphs = [f"Paragraph {index} " + "word " * 20 for index in range(10)]
+    text = "# Long\n\n" + "\n\n".join(paragraphs)
+    chunks = list(MarkdownChunker(chunk_size=300, chunk_overlap=60).iter_chunks(text))
+
+    assert len(chunks) > 1
+    assert all(len(chunk.content) <= 300 for chunk in chunks)
+    assert all(chunk.headers == {"Header 1": "Long"} for chunk in chunks)
+    for previous, current in zip(chunks, chunks[1:]):
+        assert current.content[:20] in previous.content  # Starts with the previous piece's tail
+    assert "Paragraph 9" in chunks[-1].content
+
+
+def test_chunker_custom_length_function_and_hard_cut():
+    """Test a token-style length function and words longer than the budget."""
+    chunker = MarkdownChunker(chunk_size=5, length_function=lambda text: len(text.split()))
+    chunks = [chunk.content for chunk in chunker.iter_chunks("one two three four five six seven eight")]
+    assert chunks == ["one two three four five", "six seven eight"]
+
+    hard = [chunk.content for chunk in MarkdownChunker(chunk_size=4).iter_chunks("abcdefghij")]
+    assert hard == ["abcd", "efgh", "ij"]
+
+
+def test_chunker_keeps_headers_when_asked():
+    chunks = list(MarkdownChunker(strip_headers=False).iter_chunks("# Title\n\nBody"))
+    assert chunks[0].content == "# Title\n\nBody"
+
+
+def test_chunker_rejects_invalid_budget():
+    with pytest.raises(ValueError):
+        MarkdownChunker(chunk_size=0)
+    with pytest.raises(ValueError):
+        MarkdownChunker(chunk_size=10, chunk_overlap=10)
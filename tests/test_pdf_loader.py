@@ -0,0 +1,147 @@
+import pytest
+from langchain_markitdown import PdfLoader
+from langchain_core.documents import Document
+
+
+def test_pdf_loader(test_pdf_file):
+    """Test loading a whole PDF file as one document."""
+    documents = PdfLoader(test_pdf_file).load()
+
+    assert len(documents) == 1
+    assert isinstance(documents[0], Document)
+    assert "Page 1 text" in documents[0].page_content
+    assert "Page 5 text" in documents[0].page_content
+
+
+def test_pdf_loader_split_by_page(test_pdf_file):
+    """Test that split_by_page yields one document per page with page_number metadata."""
+    documents = PdfLoader(test_pdf_file, split_by_page=True).load()
+
+    assert [d.metadata["page_number"] for d in documents] == [1, 2, 3, 4, 5]
+    assert all(d.metadata["content_type"] == "pdf_page" for d in documents)
+    assert "Page 3 text" in documents[2].page_content
+    assert "Page 2 text" not in documents[2].page_content
+
+
+def test_pdf_loader_page_range(test_pdf_file):
+    """Test selecting pages with a range tuple and with an iterable."""
+    documents = PdfLoader(test_pdf_file, split_by_page=True, page_range=(2, 3)).load()
+    assert [d.metadata["page_number"] for d in documents] == [2, 3]
+
+    combined = PdfLoader(test_pdf_file, page_range=[1, 4]).load()
+    assert len(combined) == 1
+    assert combined[0].metadata["page_numbers"] == [1, 4]
+    assert "Page 4 text" in combined[0].page_content
+    assert "Page 2 text" not in combined[0].page_content
+
+
+def test_pdf_loader_invalid_page_range(test_pdf_file):
+    """Test that an invalid, empty or out-of-document page range is rejected."""
+    with pytest.raises(ValueError):
+        PdfLoader(test_pdf_file, page_range=(3, 1))
+    with pytest.raises(ValueError):
+        PdfLoader(test_pdf_file, page_range=[])
+    for kwargs in ({}, {"split_by_page": True}, {"parallel_workers": 2, "use_processes": False}):
+        with pytest.raises(ValueError, match="selects no pages"):
+            PdfLoader(test_pdf_file, page_range=(6, 9), **kwargs).load()
+
+    # Pages past the end are ignored when others match
+    assert PdfLoader(test_pdf_file, page_range=(4, 9)).load()[0].metadata["page_numbers"] == [4, 5]
+
+
+def test_pdf_loader_success_keys(test_pdf_file):
+    """Test that every path reports conversion_success and the whole-file path keeps success."""
+    whole = PdfLoader(test_pdf_file).load()[0].metadata
+    assert whole["success"] is True
+    assert whole["conversion_success"] is True
+    for kwargs in ({"split_by_page": True}, {"page_range": (1, 2)}):
+        metadata = PdfLoader(test_pdf_file, **kwargs).load()[0].metadata
+        assert metadata["conversion_success"] is True
+
+
+def test_pdf_loader_caches_pages_per_selection(test_pdf_file, tmp_path):
+    """Test that extracted pages are cached, keyed by the page selection."""
+    from unittest.mock import patch
+    from langchain_markitdown import ConversionCache
+
+    cache = ConversionCache(str(tmp_path / "cache"))
+    first = PdfLoader(test_pdf_file, split_by_page=True, conversion_cache=cache).load()
+    ranged = PdfLoader(test_pdf_file, page_range=(2, 3), conversion_cache=cache).load()
+    assert cache.stats["hits"] == 0
+
+    with patch("langchain_markitdown.pdf_loader.iter_pdf_pages", side_effect=AssertionError("extracted")):
+        second = PdfLoader(test_pdf_file, split_by_page=True, conversion_cache=cache).load()
+        ranged_again = PdfLoader(test_pdf_file, page_range=(2, 3), conversion_cache=cache).load()
+    assert cache.stats["hits"] == 2
+    assert [(d.page_content, d.metadata) for d in second] == [(d.page_content, d.metadata) for d in first]
+    assert ranged_again[0].page_content == ranged[0].page_content
+    assert ranged_again[0].metadata["page_numbers"] == [2, 3]
+
+
+@pytest.mark.parametrize("use_processes", [False, True])
+def test_pdf_loader_parallel_pages_in_order(test_pdf_file, use_processes):
+    """Test that parallel page extraction reassembles pages in order."""
+    serial = PdfLoader(test_pdf_file, split_by_page=True).load()
+    parallel = PdfLoader(test_pdf_file, split_by_page=True, parallel_workers=2, use_processes=use_processes).load()
+
+    assert [d.page_content for d in parallel] == [d.page_content for d in serial]
+    assert [d.metadata["page_number"] for d in parallel] == [1, 2, 3, 4, 5]
+
+    ranged = PdfLoader(test_pdf_file, page_range=(2, 4), parallel_workers=2, use_processes=use_processes).load()
+    assert ranged[0].metadata["page_numbers"] == [2, 3, 4]
+
+
+@pytest.mark.parametrize("use_processes", [False, True])
+def test_pdf_loader_parallel_whole_file_matches_serial(test_pdf_file, use_processes):
+    """Test that a parallel whole-file load produces the serial Document."""
+    serial = PdfLoader(test_pdf_file).load()
+    parallel = PdfLoader(test_pdf_file, parallel_workers=2, use_processes=use_processes).load()
+
+    assert parallel[0].page_content == serial[0].page_content
+    assert parallel[0].metadata == serial[0].metadata
+
+
+def test_pdf_loader_parallel_uses_injected_converter_and_cache(test_pdf_file, tmp_path):
+    """Test that parallel whole-file loads share cache entries and honour an injected converter."""
+    from unittest.mock import patch
+    from langchain_markitdown import ConversionCache, get_converter
+
+    class RecordingConverter:
+        def __init__(self):
+            self.calls = 0
+
+        def convert_stream(self, stream, stream_info=None):
+            self.calls += 1
+            return get_converter().convert_stream(stream, stream_info=stream_info)
+
+    cache = ConversionCache(str(tmp_path / "cache"))
+    first = PdfLoader(test_pdf_file, parallel_workers=2, use_processes=False, conversion_cache=cache).load()
+    with patch("langchain_markitdown.pdf_loader.map_in_order", side_effect=AssertionError("fanned out")):
+        cached_serial = PdfLoader(test_pdf_file, conversion_cache=cache).load()
+        second = PdfLoader(test_pdf_file, parallel_workers=2, conversion_cache=cache).load()
+        converter = RecordingConverter()
+        injected = PdfLoader(test_pdf_file, parallel_workers=2, converter=converter).load()
+
+    assert cache.stats["hits"] == 2
+    assert cached_serial[0].page_content == second[0].page_content == first[0].page_content
+    assert converter.calls == 1  # Pages can't be handed to it, so it converts the whole file
+    assert injected[0].page_content == first[0].page_content
+
+
+def test_pdf_loader_from_bytes(test_pdf_file):
+    """Test that bytes input matches path input, including parallel page extraction."""
+    from markitdown import StreamInfo
+    with open(test_pdf_file, "rb") as file:
+        data = file.read()
+    serial = PdfLoader(test_pdf_file, split_by_page=True).load()
+    stream_info = StreamInfo(filename="report.pdf")
+
+    from_bytes = PdfLoader(data, split_by_page=True, stream_info=stream_info).load()
+    parallel = PdfLoader(data, split_by_page=True, parallel_workers=2, stream_info=stream_info).load()
+    whole = PdfLoader(memoryview(data), stream_info=stream_info).load()
+
+    assert [d.page_content for d in from_bytes] == [d.page_content for d in serial]
+    assert [d.page_content for d in parallel] == [d.page_content for d in serial]
+    assert from_bytes[0].metadata["file_name"] == "report.pdf"
+    assert from_bytes[0].metadata["file_size"] == len(data)
+    assert whole[0].metadata["conversion_success"] is True
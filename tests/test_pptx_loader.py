@@ -12,6 +12,16 @@ def test_pptx_loader(test_pptx_file):
     assert isinstance(documents[0], Document)
     assert "test.pptx" in documents[0].metadata["source"]
 
+def test_pptx_loader_dates_match_python_pptx(test_pptx_file):
+    """Test that created/modified keep python-pptx's naive timestamp format."""
+    from pptx import Presentation
+    core_properties = Presentation(test_pptx_file).core_properties
+    metadata = PptxLoader(test_pptx_file).load()[0].metadata
+    assert metadata["created"] == str(core_properties.created)
+    assert metadata["modified"] == str(core_properties.modified)
+    assert "+00:00" not in metadata["created"]
+
+
 def test_pptx_loader_with_split_by_page(test_pptx_file):
     """Test loading a PPTX file with split_by_page=True."""
     loader = PptxLoader(test_pptx_file, split_by_page=True)
@@ -21,4 +31,326 @@ def test_pptx_loader_with_split_by_page(test_pptx_file):
     assert len(documents) > 0
     assert isinstance(documents[0], Document)
     assert "test.pptx" in documents[0].metadata["source"]
-    assert "page_number" in documents[0].metadata
\ No newline at end of file
+    assert "page_number" in documents[0].metadata
+
+def test_pptx_loader_lazy_load_is_generator(test_pptx_file):
+    """Test that lazy_load yields slides incrementally."""
+    import types
+    loader = PptxLoader(test_pptx_file, split_by_page=True)
+    iterator = loader.lazy_load()
+    assert isinstance(iterator, types.GeneratorType)
+    first = next(iterator)
+    assert first.metadata["page_number"] == 1
+    assert first.metadata["content_type"] == "presentation_slide"
+
+
+def test_pptx_loader_captions_images(test_pptx_with_images_file, fake_caption_llm):
+    """Test that images are captioned with the provided LLM."""
+    loader = PptxLoader(test_pptx_with_images_file, llm=fake_caption_llm)
+    documents = loader.load()
+
+    assert documents[0].page_content.count("![a fake caption]") == 3
+
+
+def test_pptx_loader_aload_captions_images(test_pptx_with_images_file, fake_caption_llm):
+    """Test the async path captions images and splits slides."""
+    import asyncio
+    loader = PptxLoader(test_pptx_with_images_file, split_by_page=True, llm=fake_caption_llm, max_concurrency=2)
+    documents = asyncio.run(loader.aload())
+
+    assert [d.metadata["page_number"] for d in documents] == [1, 2, 3]
+    assert all("![a fake caption]" in d.page_content for d in documents)
+
+
+class _ColorCaptionLLM:
+    """Duck-typed chat model that captions an image with its colour, slowest first."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.calls = 0
+
+    def _caption(self, messages):
+        import base64
+        import io
+        from PIL import Image
+        self.calls += 1
+        data_uri = messages[0].content[1]["image_url"]["url"]
+        pixel = Image.open(io.BytesIO(base64.b64decode(data_uri.split(",", 1)[1]))).convert("RGB").getpixel((0, 0))
+        names = {(255, 0, 0): "red", (0, 255, 0): "green", (0, 0, 255): "blue"}
+        return names[pixel]
+
+    def invoke(self, messages):
+        import time
+        from langchain_core.messages import AIMessage
+        caption = self._caption(messages)
+        time.sleep(self.delay if caption == "red" else 0)
+        return AIMessage(content=caption)
+
+    async def ainvoke(self, messages):
+        import asyncio
+        from langchain_core.messages import AIMessage
+        caption = self._caption(messages)
+        await asyncio.sleep(self.delay if caption == "red" else 0)
+        return AIMessage(content=caption)
+
+
+def test_pptx_loader_concurrent_captions_map_to_shapes(test_pptx_with_images_file):
+    """Test that concurrently generated captions land on the right slides."""
+    import asyncio
+    llm = _ColorCaptionLLM(delay=0.2)
+    loader = PptxLoader(test_pptx_with_images_file, split_by_page=True, llm=llm, caption_max_concurrency=3)
+
+    for documents in (loader.load(), asyncio.run(loader.aload())):
+        assert "![red]" in documents[0].page_content
+        assert "![green]" in documents[1].page_content
+        assert "![blue]" in documents[2].page_content
+
+
+def test_pptx_loader_caption_timeout(test_pptx_with_images_file):
+    """Test that captions exceeding caption_timeout are skipped."""
+    import asyncio
+    llm = _ColorCaptionLLM(delay=1.0)
+    loader = PptxLoader(test_pptx_with_images_file, split_by_page=True, llm=llm, caption_timeout=0.3)
+
+    for documents in (loader.load(), asyncio.run(loader.aload())):
+        assert "![red]" not in documents[0].page_content
+        assert "![green]" in documents[1].page_content
+
+
+class _SlowCaptionLLM(_ColorCaptionLLM):
+    """Every caption takes ``delay`` seconds, except those listed in ``fast``."""
+
+    def __init__(self, delay, fast=()):
+        super().__init__(delay)
+        self.fast = fast
+
+    def invoke(self, messages):
+        import time
+        from langchain_core.messages import AIMessage
+        caption = self._caption(messages)
+        time.sleep(0 if caption in self.fast else self.delay)
+        return AIMessage(content=caption)
+
+
+def test_pptx_loader_caption_timeout_is_per_request(test_pptx_with_images_file):
+    """Test that the timeout runs from each request's start, not from when its result is awaited."""
+    import time
+    llm = _SlowCaptionLLM(delay=2.0)
+    loader = PptxLoader(test_pptx_with_images_file, llm=llm, caption_timeout=0.3, caption_max_concurrency=3)
+
+    start = time.monotonic()
+    documents = loader.load()
+    assert time.monotonic() - start < 0.9  # Waiting on each future in turn took 3 x 0.3s
+    assert "![red]" not in documents[0].page_content and "![blue]" not in documents[0].page_content
+
+
+def test_pptx_loader_caption_queue_waits_for_a_stuck_worker(test_pptx_with_images_file):
+    """Test that queued requests get a worker back from a timed-out call, within one more timeout."""
+    llm = _SlowCaptionLLM(delay=0.45, fast=("green", "blue"))
+    loader = PptxLoader(
+        test_pptx_with_images_file, split_by_page=True, llm=llm, caption_timeout=0.3, caption_max_concurrency=1
+    )
+    documents = loader.load()
+    assert "![red]" not in documents[0].page_content
+    assert "![green]" in documents[1].page_content and "![blue]" in documents[2].page_content
+
+    llm = _SlowCaptionLLM(delay=1.5, fast=("green", "blue"))
+    loader = PptxLoader(
+        test_pptx_with_images_file, split_by_page=True, llm=llm, caption_timeout=0.3, caption_max_concurrency=1
+    )
+    documents = loader.load()
+    assert "![green]" not in documents[1].page_content  # Skipped: the only worker stayed stuck
+
+
+def test_pptx_loader_parses_presentation_once(test_pptx_with_images_file, fake_caption_llm):
+    """Test that metadata, captioning and conversion share a single file read and parse."""
+    import builtins
+    from unittest.mock import patch
+    import pptx
+
+    opened = []
+    real_open = builtins.open
+
+    def tracking_open(file, *args, **kwargs):
+        if file == test_pptx_with_images_file:
+            opened.append(file)
+        return real_open(file, *args, **kwargs)
+
+    with patch("pptx.Presentation", wraps=pptx.Presentation) as presentation, \
+            patch("builtins.open", side_effect=tracking_open):
+        documents = PptxLoader(test_pptx_with_images_file, llm=fake_caption_llm).load()
+
+    # One parse for metadata and images, one inside MarkItDown's converter
+    assert presentation.call_count == 2
+    assert len(opened) == 1
+    metadata = documents[0].metadata
+    assert metadata["slide_count"] == 3
+    assert metadata["image_count"] == 3
+    assert metadata["file_size"] > 0
+
+
+def test_pptx_loader_apply_captions_single_scan():
+    """Test that captions are applied per slide in one pass."""
+    markdown = (
+        "<!-- Slide number: 1 -->\n![old](Picture2.jpg) ![other](Logo.jpg)\n\n"
+        "<!-- Slide number: 2 -->\n![old](Picture2.jpg)\n"
+    )
+    loader = PptxLoader.__new__(PptxLoader)
+    result = loader._apply_captions(markdown, {(1, "Picture2"): "first \\d", (2, "Picture2"): "second"})
+
+    assert result == (
+        "<!-- Slide number: 1 -->\n![first \\d](Picture2.jpg) ![other](Logo.jpg)\n\n"
+        "<!-- Slide number: 2 -->\n![second](Picture2.jpg)\n"
+    )
+
+    # Every captured name is a dict lookup: many captions, a picture named like another's prefix
+    captions = {(1, f"Picture{index}"): f"caption {index}" for index in range(500)}
+    markdown = "<!-- Slide number: 1 -->\n" + " ".join(f"![](Picture{index}.jpg)" for index in range(501))
+    result = loader._apply_captions(markdown, captions)
+    assert result.count("![caption ") == 500
+    assert "![caption 49](Picture49.jpg) " in result and result.endswith("![](Picture500.jpg)")
+
+
+def test_pptx_loader_captions_same_named_shapes_per_slide(tmp_path):
+    """Test that pictures sharing a shape name on different slides keep their own captions."""
+    from PIL import Image
+    from pptx import Presentation
+    from pptx.util import Inches
+
+    prs = Presentation()
+    for color in [(255, 0, 0), (0, 0, 255)]:
+        image_path = str(tmp_path / f"{color}.png")
+        Image.new('RGB', (32, 32), color=color).save(image_path)
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        slide.shapes.add_picture(image_path, Inches(1), Inches(1))
+    fn = str(tmp_path / "same_names.pptx")
+    prs.save(fn)
+
+    documents = PptxLoader(fn, split_by_page=True, llm=_ColorCaptionLLM()).load()
+    assert "![red]" in documents[0].page_content
+    assert "![blue]" in documents[1].page_content
+
+
+@pytest.mark.parametrize("use_processes", [False, True])
+def test_pptx_loader_parallel_slides_match_serial(tmp_path, use_processes):
+    """Test that slide ranges converted on a pool reassemble into the serial markdown."""
+    from pptx import Presentation
+
+    prs = Presentation()
+    for index in range(1, 7):
+        slide = prs.slides.add_slide(prs.slide_layouts[5])
+        slide.shapes.title.text = f"Slide title {index}"
+    fn = str(tmp_path / "deck.pptx")
+    prs.save(fn)
+
+    serial = PptxLoader(fn).load()
+    parallel = PptxLoader(fn, parallel_workers=2, use_processes=use_processes).load()
+    assert parallel[0].page_content == serial[0].page_content
+
+    slides = PptxLoader(fn, split_by_page=True, parallel_workers=3, use_processes=use_processes).load()
+    assert [d.metadata["page_number"] for d in slides] == [1, 2, 3, 4, 5, 6]
+    assert "Slide title 6" in slides[5].page_content
+
+    with open(fn, "rb") as file:
+        data = file.read()
+    from_bytes = PptxLoader(data, parallel_workers=2, use_processes=use_processes).load()
+    assert from_bytes[0].page_content == serial[0].page_content
+    assert from_bytes[0].metadata["slide_count"] == 6
+
+
+def test_pptx_loader_parallel_uses_injected_converter_and_cache(tmp_path):
+    """Test that slide ranges go through an injected converter, and a cached deck is not fanned out."""
+    from unittest.mock import MagicMock, patch
+    from pptx import Presentation
+    from langchain_markitdown import ConversionCache, get_converter
+
+    prs = Presentation()
+    for index in range(1, 5):
+        prs.slides.add_slide(prs.slide_layouts[5]).shapes.title.text = f"Slide title {index}"
+    fn = str(tmp_path / "deck.pptx")
+    prs.save(fn)
+
+    converter = MagicMock(wraps=get_converter())
+    cache = ConversionCache(str(tmp_path / "cache"))
+    first = PptxLoader(fn, parallel_workers=2, converter=converter, conversion_cache=cache).load()
+    assert converter.convert_stream.call_count == 2  # One slide range per worker, on threads
+    assert first[0].page_content == PptxLoader(fn).load()[0].page_content
+
+    with patch("langchain_markitdown.pptx_loader.map_in_order", side_effect=AssertionError("fanned out")):
+        second = PptxLoader(fn, parallel_workers=2, converter=converter, conversion_cache=cache).load()
+    assert second[0].page_content == first[0].page_content
+    assert converter.convert_stream.call_count == 2
+
+
+def test_pptx_loader_image_preprocessor_skips_small_pictures(test_pptx_with_images_file):
+    """Test that pictures below the preprocessor's min_edge are not sent for captioning."""
+    from langchain_markitdown import ImagePreprocessor
+    llm = _ColorCaptionLLM()
+    documents = PptxLoader(
+        test_pptx_with_images_file, llm=llm, image_preprocessor=ImagePreprocessor(min_edge=128)
+    ).load()
+    assert llm.calls == 0
+    assert "![red]" not in documents[0].page_content
+
+
+def test_pptx_loader_dedupes_near_identical_images(tmp_path):
+    """Test that a logo repeated at different sizes is captioned once and the caption reused."""
+    from PIL import Image, ImageDraw
+    from pptx import Presentation
+    from pptx.util import Inches
+
+    class CountingLLM:
+        def __init__(self):
+            self.calls = 0
+
+        def invoke(self, messages):
+            from langchain_core.messages import AIMessage
+            self.calls += 1
+            return AIMessage(content=f"caption {self.calls}")
+
+    logo = Image.new("RGB", (200, 200), (255, 255, 255))
+    ImageDraw.Draw(logo).ellipse((20, 20, 150, 150), fill=(200, 30, 30))
+    prs = Presentation()
+    for index, (size, image_format) in enumerate([(200, "PNG"), (120, "JPEG"), (60, "PNG")]):
+        image_path = str(tmp_path / f"logo{index}.{image_format.lower()}")
+        logo.resize((size, size)).save(image_path, image_format)
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        slide.shapes.add_picture(image_path, Inches(1), Inches(1))
+    fn = str(tmp_path / "logos.pptx")
+    prs.save(fn)
+
+    llm = CountingLLM()
+    documents = PptxLoader(fn, split_by_page=True, llm=llm, dedupe_images=True).load()
+    assert llm.calls == 1
+    assert all("![caption 1]" in d.page_content for d in documents)
+    assert documents[0].metadata["caption_call_count"] == 1
+
+    without_dedupe = PptxLoader(fn, llm=CountingLLM()).load()
+    assert without_dedupe[0].metadata["caption_call_count"] == 3
+
+
+def test_pptx_loader_caption_call_count_excludes_cache_hits(test_pptx_with_images_file):
+    """Test that caption_call_count reports the LLM calls made, not the images considered."""
+    import asyncio
+    from langchain_markitdown import InMemoryCaptionCache
+    cache = InMemoryCaptionCache()
+    llm = _ColorCaptionLLM(delay=0)
+
+    first = PptxLoader(test_pptx_with_images_file, llm=llm, caption_cache=cache).load()
+    assert first[0].metadata["caption_call_count"] == 3
+    second = PptxLoader(test_pptx_with_images_file, llm=llm, caption_cache=cache, record_stats=True).load()
+    assert second[0].metadata["caption_call_count"] == 0
+    third = asyncio.run(PptxLoader(test_pptx_with_images_file, llm=llm, caption_cache=cache).aload())
+    assert third[0].metadata["caption_call_count"] == 0
+    assert llm.calls == 3
+
+
+def test_pptx_loader_chunker_keeps_slide_metadata(test_pptx_file):
+    """Test that slides are chunked individually and keep their slide metadata."""
+    from langchain_markitdown import MarkdownChunker
+    documents = PptxLoader(test_pptx_file, split_by_page=True, chunker=MarkdownChunker()).load()
+
+    assert documents
+    assert all(d.metadata["page_number"] == 1 for d in documents)
+    assert all(d.metadata["content_type"] == "presentation_slide" for d in documents)
+    assert "Test Presentation" in documents[0].page_content  # A title-only slide is kept whole
@@ -0,0 +1,157 @@
+import json
+import sys
+import tracemalloc
+import pytest
+from langchain_core.documents import Document
+from langchain_markitdown import XlsxLoader
+from langchain_markitdown import shared_metadata
+from langchain_markitdown.shared_metadata import SharedMetadata, _holder
+
+FILE_METADATA = {
+    "source": "/data/report.pptx", "file_name": "report.pptx", "file_size": 123456,
+    "conversion_success": True, "author": "Jane Doe", "title": "Quarterly report",
+    "subject": "Finance", "keywords": "q3, revenue", "created": "2024-01-01 00:00:00+00:00",
+    "modified": "2024-02-01 00:00:00+00:00", "slide_count": 40, "image_count": 12,
+}
+key_sharing_only = pytest.mark.skipif(not shared_metadata._KEY_SHARING, reason="key-sharing dicts save memory on CPython 3.11+")
+
+
+def test_chunk_metadata_is_an_independent_plain_dict():
+    """Test that chunk metadata behaves and serializes exactly like a copied dict."""
+    shared = SharedMetadata(FILE_METADATA)
+    first = shared.document("one", {"page_number": 1})
+    second = shared.document("two", {"page_number": 2})
+
+    assert type(first.metadata) is dict
+    assert first.metadata == {**FILE_METADATA, "page_number": 1}
+    first.metadata["author"] = "Someone else"
+    del first.metadata["title"]
+    assert second.metadata["author"] == FILE_METADATA["author"] == "Jane Doe"
+    assert "title" in second.metadata
+
+    assert second.model_dump()["metadata"] == {**FILE_METADATA, "page_number": 2}
+    assert json.loads(second.model_dump_json())["metadata"]["keywords"] == "q3, revenue"
+    assert Document(**second.model_dump()) == second
+    with pytest.raises(TypeError):
+        shared.document(b"bytes")
+
+
+def _per_chunk_bytes(build, count=2000):
+    """Traced memory per metadata dict built by ``build(index)``, holder classes included."""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        built = [build(index) for index in range(count)]
+        return built, (tracemalloc.get_traced_memory()[0] - before) / count
+    finally:
+        tracemalloc.stop()
+
+
+@key_sharing_only
+@pytest.mark.parametrize("key_count, ratio", [(12, 0.7), (24, 0.7), (31, 1.05), (60, 1.05)])
+def test_per_chunk_metadata_overhead_against_a_copy(key_count, ratio):
+    """Test per-chunk memory against copying the file-level dict, below and above the key-sharing limit."""
+    _holder.cache_clear()
+    metadata = {f"field_{index}": index for index in range(key_count)}
+    fields = lambda index: {"page_number": index, "content_type": "presentation_slide"}
+    shared = SharedMetadata(metadata)
+
+    lean, lean_bytes = _per_chunk_bytes(lambda index: shared.for_chunk(fields(index)))
+    copied, copy_bytes = _per_chunk_bytes(lambda index: {**metadata, **fields(index)})
+
+    assert lean == copied
+    assert lean_bytes < ratio * copy_bytes
+
+
+@key_sharing_only
+def test_chunked_slides_share_one_key_table(tmp_path, monkeypatch):
+    """Test the per-slide chunker path: one holder for the whole deck, and leaner than copies."""
+    from pptx import Presentation
+    from langchain_markitdown import MarkdownChunker, PptxLoader
+
+    fn = tmp_path / "deck.pptx"
+    prs = Presentation()
+    for index in range(40):
+        slide = prs.slides.add_slide(prs.slide_layouts[1])
+        slide.shapes.title.text = f"Slide {index}"
+        slide.placeholders[1].text = " ".join(f"word{word}" for word in range(60))
+    prs.core_properties.author = "Jane Doe"
+    prs.save(fn)
+
+    _holder.cache_clear()
+    loader = PptxLoader(str(fn), split_by_page=True, chunker=MarkdownChunker(chunk_size=120))
+    documents = loader.load()
+    assert len(documents) > 80
+    assert {d.metadata["page_number"] for d in documents} == set(range(1, 41))
+    assert all(d.metadata["author"] == "Jane Doe" and "chunk_index" in d.metadata for d in documents)
+    assert _holder.cache_info().currsize == 1
+
+    # Chunking many slides from one SharedMetadata, against the same path with plain copies
+    metadata = {key: value for key, value in documents[0].metadata.items() if key not in ("page_number", "chunk_index")}
+    slide = documents[0].page_content
+
+    def chunk_slides(shared):
+        return lambda index: list(loader._chunk_documents(slide, metadata, shared=shared, fields={"page_number": index}))
+
+    _, lean_bytes = _per_chunk_bytes(chunk_slides(SharedMetadata(metadata)))
+    monkeypatch.setattr(shared_metadata, "_KEY_SHARING", False)
+    _, copy_bytes = _per_chunk_bytes(chunk_slides(SharedMetadata(metadata)))
+    assert lean_bytes < copy_bytes
+
+
+def _is_shared(metadata):
+    return sys.getsizeof(metadata) < sys.getsizeof(dict(metadata.items()))
+
+
+def test_unshared_chunks_fall_back_to_copies(monkeypatch):
+    """Test that chunks get plain copies when sharing is off or a chunk's dict did not stay shared."""
+    metadata = {f"field_{index}": index for index in range(60)}
+    shared = SharedMetadata(metadata)
+    chunks = [shared.for_chunk({"page_number": index}) for index in range(3)]
+    assert chunks[1] == {**metadata, "page_number": 1}
+    assert not any(_is_shared(chunk) for chunk in chunks)
+
+    monkeypatch.setattr(shared_metadata, "_KEY_SHARING", False)
+    assert not _is_shared(SharedMetadata(FILE_METADATA).for_chunk({"page_number": 1}))
+
+
+@key_sharing_only
+def test_zip_member_slides_stay_shared(tmp_path):
+    """Test that adding the archive location to split member Documents keeps their dicts shared."""
+    import zipfile
+    from pptx import Presentation
+    from langchain_markitdown import ZipLoader
+
+    prs = Presentation()
+    for index in range(6):
+        prs.slides.add_slide(prs.slide_layouts[5]).shapes.title.text = f"Slide {index}"
+    deck = tmp_path / "deck.pptx"
+    prs.save(deck)
+    archive = tmp_path / "decks.zip"
+    with zipfile.ZipFile(archive, "w") as zf:
+        zf.write(deck, "a/deck.pptx")
+        zf.write(deck, "b/deck.pptx")
+
+    documents = ZipLoader(str(archive), loader_kwargs={".pptx": {"split_by_page": True}}).load()
+    assert len(documents) == 12
+    assert {d.metadata["member_name"] for d in documents} == {"a/deck.pptx", "b/deck.pptx"}
+    assert all(_is_shared(d.metadata) for d in documents)
+
+
+def test_xlsx_sheets_get_independent_file_metadata(tmp_path):
+    """Test that split sheets each carry the file-level metadata in their own dict."""
+    import openpyxl
+    fn = tmp_path / "sheets.xlsx"
+    wb = openpyxl.Workbook()
+    for index in range(4):
+        ws = wb.active if index == 0 else wb.create_sheet(f"Sheet{index}")
+        ws.append(["value", index])
+    wb.properties.creator = "Jane Doe"
+    wb.save(fn)
+
+    for documents in (XlsxLoader(str(fn), split_by_page=True).load(), XlsxLoader(str(fn), streaming=True).load()):
+        assert len(documents) == 4
+        assert [d.metadata["page_number"] for d in documents] == ["Sheet", "Sheet1", "Sheet2", "Sheet3"]
+        assert all(type(d.metadata) is dict and d.metadata["author"] == "Jane Doe" for d in documents)
+        documents[0].metadata["author"] = "Someone else"
+        assert documents[1].metadata["author"] == "Jane Doe"
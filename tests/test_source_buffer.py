@@ -0,0 +1,66 @@
+import io
+import mmap
+import pytest
+from unittest.mock import patch
+from langchain_markitdown import DocxLoader, PdfLoader, PptxLoader, XlsxLoader
+from langchain_markitdown.source_buffer import SourceBuffer, ViewReader
+
+
+def test_view_reader_matches_bytes_io():
+    """Test that reads and seeks behave like io.BytesIO over the same bytes."""
+    data = bytes(range(256)) * 4
+    reader, expected = ViewReader(memoryview(data)), io.BytesIO(data)
+    for offset, whence, size in [(0, 0, 10), (5, 1, 100), (-20, 2, 50), (-5000, 2, 3), (2000, 0, 10), (0, 0, -1)]:
+        assert reader.seek(offset, whence) == expected.seek(offset, whence)
+        assert reader.read(size) == expected.read(size)
+        assert reader.tell() == expected.tell()
+
+    buffer = bytearray(8)
+    reader.seek(1020)
+    assert reader.readinto(buffer) == 4
+    assert bytes(buffer[:4]) == data[1020:]
+    with pytest.raises(ValueError):
+        reader.seek(-1)
+
+
+def test_source_buffer_maps_large_files(tmp_path):
+    """Test that files above the threshold are memory-mapped and closed on release."""
+    path = tmp_path / "data.bin"
+    path.write_bytes(b"x" * 4096)
+
+    small = SourceBuffer.from_path(str(path))
+    assert isinstance(small._data, bytes) and small.size == 4096
+    small.close()
+
+    mapped = SourceBuffer.from_path(str(path), mmap_threshold=1024)
+    assert isinstance(mapped._data, mmap.mmap)
+    assert mapped.reader().read(3) == b"xxx"
+    mapped.close()
+    assert mapped._data.closed
+
+
+@pytest.mark.parametrize("loader_cls, fixture", [
+    (DocxLoader, "test_docx_file"),
+    (PptxLoader, "test_pptx_file"),
+    (XlsxLoader, "test_xlsx_file"),
+    (PdfLoader, "test_pdf_file"),
+])
+def test_loaders_read_the_file_once(request, loader_cls, fixture):
+    """Test that a load opens its input exactly once and never stats it separately."""
+    file_path = request.getfixturevalue(fixture)
+    opened = []
+    real_open = open
+
+    def tracking_open(file, *args, **kwargs):
+        if file == file_path:
+            opened.append(file)
+        return real_open(file, *args, **kwargs)
+
+    loader = loader_cls(file_path, split_by_page=True, record_stats=True)
+    with patch("builtins.open", side_effect=tracking_open), \
+            patch("os.path.getsize", side_effect=AssertionError("stat")):
+        documents = loader.load()
+
+    assert len(opened) == 1
+    assert documents[0].metadata["load_stats"]["bytes_in"] > 0
+    assert loader._source_buffer is None  # Released when the load finished
@@ -0,0 +1,94 @@
+import io
+import struct
+import pytest
+import asyncio
+import logging
+from langchain_markitdown.utils import aget_image_caption, get_image_caption, get_image_format, langchain_caption_adapter
+
+
+def _pil_bytes(image_format):
+    from PIL import Image
+    buffer = io.BytesIO()
+    Image.new("RGB", (8, 8), color=(10, 20, 30)).save(buffer, image_format)
+    return buffer.getvalue()
+
+
+@pytest.mark.parametrize("image_format, expected", [
+    ("PNG", ("image/png", ".png")),
+    ("JPEG", ("image/jpeg", ".jpg")),
+    ("GIF", ("image/gif", ".gif")),
+    ("WEBP", ("image/webp", ".webp")),
+    ("BMP", ("image/bmp", ".bmp")),
+    ("TIFF", ("image/tiff", ".tiff")),
+])
+def test_get_image_format_sniffs_raster_signatures(image_format, expected):
+    """Test that common raster formats are identified from their header bytes."""
+    assert get_image_format(_pil_bytes(image_format)) == expected
+
+
+def test_get_image_format_sniffs_vector_signatures():
+    """Test EMF, WMF and SVG detection, which PIL does not help with."""
+    emf = struct.pack("<II", 1, 108) + b"\x00" * 32 + b" EMF" + b"\x00" * 64
+    assert get_image_format(emf) == ("image/x-emf", ".emf")
+    assert get_image_format(b"\xd7\xcd\xc6\x9a" + b"\x00" * 40) == ("image/x-wmf", ".wmf")
+    assert get_image_format(b'\xef\xbb\xbf<?xml version="1.0"?>\n<svg xmlns="http://www.w3.org/2000/svg"/>') == ("image/svg+xml", ".svg")
+    assert get_image_format(b"not an image") == ("application/octet-stream", ".bin")
+
+
+def test_get_image_format_reads_header_only(monkeypatch):
+    """Test that a recognised signature never falls back to a PIL decode."""
+    import PIL.Image
+
+    def fail(*args, **kwargs):
+        raise AssertionError("PIL should not be used for known signatures")
+
+    monkeypatch.setattr(PIL.Image, "open", fail)
+    data = _pil_bytes("PNG") + b"\x00" * (1 << 20)
+    assert get_image_format(memoryview(data)) == ("image/png", ".png")
+
+
+def test_get_image_format_pil_fallback_reads_view_in_place(monkeypatch):
+    """Test that unrecognised blobs are handed to PIL as a reader over the view, not a copy."""
+    import PIL.Image
+    real_open = PIL.Image.open
+    opened = []
+
+    def recording_open(file, *args, **kwargs):
+        opened.append(file)
+        return real_open(file, *args, **kwargs)
+
+    monkeypatch.setattr(PIL.Image, "open", recording_open)
+    stream = io.BytesIO(b"\x00\x00\x01\x00" + b"\x00" * 64)
+    with stream.getbuffer() as view:
+        assert get_image_format(view) == ("application/octet-stream", ".bin")
+    assert not isinstance(opened[0], (bytes, io.BytesIO))
+    stream.write(b"still writable")  # No export of the buffer outlives the call
+
+
+def test_langchain_caption_adapter_sniffs_without_copy(fake_caption_llm):
+    """Test the adapter fills in the mimetype from a view of the stream and leaves it usable."""
+    stream = io.BytesIO(_pil_bytes("PNG"))
+    stream_info = type("StreamInfo", (object,), {"mimetype": "", "extension": ""})()
+
+    caption = langchain_caption_adapter(stream, stream_info, fake_caption_llm, None)
+    assert caption == "a fake caption"
+    assert stream_info.mimetype == "image/png"
+    stream.write(b"still writable")  # The buffer view was released
+
+
+def test_caption_errors_are_logged_not_printed(caplog, capsys):
+    """Test that a failing LLM call is logged through the module logger on both paths."""
+    class FailingLLM:
+        def invoke(self, messages):
+            raise RuntimeError("model unavailable")
+
+        async def ainvoke(self, messages):
+            raise RuntimeError("model unavailable")
+
+    stream_info = type("StreamInfo", (object,), {"mimetype": "image/png", "extension": ".png"})()
+    with caplog.at_level(logging.ERROR, logger="langchain_markitdown.utils"):
+        assert get_image_caption(FailingLLM(), io.BytesIO(_pil_bytes("PNG")), stream_info) is None
+        assert asyncio.run(aget_image_caption(FailingLLM(), io.BytesIO(_pil_bytes("PNG")), stream_info)) is None
+
+    assert [record.getMessage() for record in caplog.records] == ["Error during LLM captioning: model unavailable"] * 2
+    assert capsys.readouterr().out == ""
@@ -27,4 +27,181 @@ def test_xlsx_loader_with_split_by_page(test_xlsx_file):
     assert "page_number" in documents[0].metadata, "When split_by_page=True, each document should have a page_number in metadata"
     
     # Make sure the content looks like what we'd expect from an Excel file
-    assert "|" in documents[0].page_content, "Document content should have table formatting with pipe characters"
\ No newline at end of file
+    assert "|" in documents[0].page_content, "Document content should have table formatting with pipe characters"
+
+def test_xlsx_loader_lazy_load_yields_each_sheet(tmp_path):
+    """Test that lazy_load yields one document per sheet."""
+    import openpyxl
+    fn = tmp_path / "sheets.xlsx"
+    wb = openpyxl.Workbook()
+    wb.active.title = "First"
+    wb.active["A1"] = "one"
+    wb.create_sheet("Second")["A1"] = "two"
+    wb.save(fn)
+
+    documents = list(XlsxLoader(str(fn), split_by_page=True).lazy_load())
+    assert [d.metadata["page_number"] for d in documents] == ["First", "Second"]
+    assert "one" in documents[0].page_content
+    assert "two" in documents[1].page_content
+
+
+def test_xlsx_loader_reads_core_properties(tmp_path):
+    """Test that workbook properties are read from docProps/core.xml."""
+    import openpyxl
+    fn = tmp_path / "props.xlsx"
+    wb = openpyxl.Workbook()
+    wb.properties.creator = "Analyst"
+    wb.properties.title = "Quarterly numbers"
+    wb.active["A1"] = 1
+    wb.save(fn)
+
+    documents = XlsxLoader(str(fn)).load()
+    assert documents[0].metadata["author"] == "Analyst"
+    assert documents[0].metadata["title"] == "Quarterly numbers"
+
+
+def test_xlsx_loader_streaming_row_windows(tmp_path):
+    """Test that streaming mode yields row windows with the header repeated."""
+    import openpyxl
+    fn = tmp_path / "rows.xlsx"
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = "Data"
+    ws.append(["id", "name"])
+    for index in range(1, 6):
+        ws.append([index, f"row {index}"])
+    wb.create_sheet("Empty")
+    wb.save(fn)
+
+    documents = XlsxLoader(str(fn), rows_per_document=2).load()
+
+    assert [(d.metadata["start_row"], d.metadata["end_row"]) for d in documents] == [(2, 3), (4, 5), (6, 6)]
+    for document in documents:
+        assert document.page_content.startswith("| id | name |\n| --- | --- |\n")
+        assert document.metadata["page_number"] == "Data"
+    assert "| 5 | row 5 |" in documents[2].page_content
+
+
+def test_xlsx_loader_streaming_table_width_from_sheet(tmp_path):
+    """Test that a narrow first row does not truncate the streamed table, and header_rows=0."""
+    import openpyxl
+    fn = tmp_path / "titled.xlsx"
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.append(["Quarterly report"])
+    ws.append(["region", "q1", "q2", "q3"])
+    ws.append(["north", 1, 2, 3])
+    wb.save(fn)
+
+    titled = XlsxLoader(str(fn), streaming=True).load()
+    assert titled[0].page_content == (
+        "| Quarterly report |  |  |  |\n| --- | --- | --- | --- |\n"
+        "| region | q1 | q2 | q3 |\n| north | 1 | 2 | 3 |\n"
+    )
+
+    headerless = XlsxLoader(str(fn), rows_per_document=2, header_rows=0).load()
+    assert [(d.metadata["start_row"], d.metadata["end_row"]) for d in headerless] == [(1, 2), (3, 3)]
+    assert headerless[0].page_content.startswith("| A | B | C | D |\n| --- | --- | --- | --- |\n| Quarterly report |")
+    assert "| north | 1 | 2 | 3 |" in headerless[1].page_content
+
+    with pytest.raises(ValueError):
+        XlsxLoader(str(fn), streaming=True, header_rows=-1)
+
+
+def test_xlsx_loader_streaming_closes_workbook(tmp_path):
+    """Test that the read-only workbook is closed, even if iteration stops early."""
+    from unittest.mock import patch
+    import openpyxl
+    fn = tmp_path / "close.xlsx"
+    wb = openpyxl.Workbook()
+    for index in range(10):
+        wb.active.append([index])
+    wb.save(fn)
+
+    opened = []
+    real_load_workbook = openpyxl.load_workbook
+
+    def tracking_load_workbook(*args, **kwargs):
+        opened.append(real_load_workbook(*args, **kwargs))
+        return opened[-1]
+
+    with patch("openpyxl.load_workbook", side_effect=tracking_load_workbook):
+        iterator = XlsxLoader(str(fn), rows_per_document=2).lazy_load()
+        next(iterator)
+        iterator.close()
+
+    assert opened[0]._archive.fp is None
+
+
+@pytest.mark.parametrize("use_processes", [False, True])
+def test_xlsx_loader_parallel_sheets_match_serial(tmp_path, use_processes):
+    """Test that sheets converted on a pool reassemble into the serial markdown."""
+    import openpyxl
+    fn = tmp_path / "many_sheets.xlsx"
+    wb = openpyxl.Workbook()
+    wb.active.title = "Sheet0"
+    for index in range(5):
+        ws = wb.active if index == 0 else wb.create_sheet(f"Sheet{index}")
+        ws.append(["name", "value"])
+        ws.append([f"row{index}", index])
+    wb.save(fn)
+
+    serial = XlsxLoader(str(fn)).load()
+    parallel = XlsxLoader(str(fn), parallel_workers=2, use_processes=use_processes).load()
+    assert parallel[0].page_content == serial[0].page_content
+
+    pages = XlsxLoader(str(fn), split_by_page=True, parallel_workers=2, use_processes=use_processes).load()
+    assert [d.metadata["page_number"] for d in pages] == [f"Sheet{i}" for i in range(5)]
+
+
+def test_xlsx_loader_parallel_uses_injected_converter_and_cache(tmp_path):
+    """Test that parallel units run through an injected converter and the cache is checked first."""
+    from unittest.mock import patch
+    import openpyxl
+    from langchain_markitdown import ConversionCache, get_converter
+
+    class RecordingConverter:
+        def __init__(self):
+            self.calls = 0
+
+        def convert_stream(self, stream, stream_info=None):
+            self.calls += 1
+            return get_converter().convert_stream(stream, stream_info=stream_info)
+
+    fn = tmp_path / "sheets.xlsx"
+    wb = openpyxl.Workbook()
+    for index in range(4):
+        ws = wb.active if index == 0 else wb.create_sheet(f"Sheet{index}")
+        ws.append(["value", index])
+    wb.save(fn)
+    serial = XlsxLoader(str(fn)).load()
+
+    converter = RecordingConverter()
+    cache = ConversionCache(str(tmp_path / "cache"))
+    first = XlsxLoader(str(fn), parallel_workers=2, converter=converter, conversion_cache=cache).load()
+    assert converter.calls == 2  # One per unit, on threads although use_processes defaults to True
+    assert first[0].page_content == serial[0].page_content
+
+    with patch("langchain_markitdown.xlsx_loader.map_in_order", side_effect=AssertionError("fanned out")):
+        second = XlsxLoader(str(fn), parallel_workers=2, converter=converter, conversion_cache=cache).load()
+    cached_serial = XlsxLoader(str(fn), converter=converter, conversion_cache=cache).load()
+    assert second[0].page_content == cached_serial[0].page_content == serial[0].page_content
+    assert converter.calls == 2 and cache.hits == 2
+
+
+def test_xlsx_loader_from_bytes(test_xlsx_file):
+    """Test the whole-workbook, streaming and parallel modes with bytes input."""
+    from markitdown import StreamInfo
+    with open(test_xlsx_file, "rb") as file:
+        data = file.read()
+    stream_info = StreamInfo(filename="book.xlsx")
+
+    whole = XlsxLoader(data, stream_info=stream_info).load()
+    streamed = XlsxLoader(data, streaming=True, stream_info=stream_info).load()
+    parallel = XlsxLoader(data, parallel_workers=2, use_processes=False, stream_info=stream_info).load()
+
+    assert "Test Data" in whole[0].page_content
+    assert "Test Data" in streamed[0].page_content
+    assert parallel[0].page_content == whole[0].page_content
+    assert whole[0].metadata["file_name"] == streamed[0].metadata["file_name"] == "book.xlsx"
+    assert streamed[0].metadata["file_size"] == len(data)
@@ -0,0 +1,101 @@
+import io
+import zipfile
+import pytest
+from langchain_markitdown import ZipLoader
+from langchain_markitdown.zip_loader import ZipLimitError
+
+
+def _zip_bytes(members):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for name, data in members.items():
+            archive.writestr(name, data)
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def mixed_zip(tmp_path, test_docx_file):
+    with open(test_docx_file, "rb") as file:
+        docx = file.read()
+    inner = _zip_bytes({"inner.txt": "Nested text"})
+    path = tmp_path / "mixed.zip"
+    path.write_bytes(_zip_bytes({
+        "docs/report.docx": docx,
+        "notes.txt": "Plain notes",
+        "folder/": "",
+        "bundle.zip": inner,
+        "table.csv": "a,b\n1,2\n",
+    }))
+    return str(path)
+
+
+@pytest.mark.parametrize("use_processes", [False, True])
+def test_zip_loader_yields_one_document_per_member(mixed_zip, use_processes):
+    """Test that members are converted individually and yielded in archive order."""
+    documents = ZipLoader(mixed_zip, max_workers=2, use_processes=use_processes).load()
+
+    names = [d.metadata["member_name"] for d in documents]
+    assert names == ["docs/report.docx", "notes.txt", "bundle.zip/inner.txt", "table.csv"]
+    assert all(d.metadata["conversion_success"] for d in documents)
+    assert all(d.metadata["archive_path"] == mixed_zip for d in documents)
+    assert "Plain notes" in documents[1].page_content
+    assert "Nested text" in documents[2].page_content
+    assert documents[0].metadata["file_name"] == "report.docx"
+
+
+def test_zip_loader_rejects_oversized_and_bomb_members(tmp_path):
+    """Test per-member size and compression-ratio limits."""
+    path = tmp_path / "bomb.zip"
+    path.write_bytes(_zip_bytes({"zeros.txt": b"\0" * (4 << 20), "big.txt": "x" * 5000, "ok.txt": "fine"}))
+
+    documents = ZipLoader(str(path), max_member_bytes=4096).load()
+    errors = {d.metadata["member_name"]: d.metadata.get("error") for d in documents}
+    assert "max_member_bytes" in errors["zeros.txt"]
+    assert "max_member_bytes" in errors["big.txt"]
+    assert errors["ok.txt"] is None
+
+    documents = ZipLoader(str(path), max_compression_ratio=50).load()
+    assert "max_compression_ratio" in documents[0].metadata["error"]
+    assert documents[0].metadata["conversion_success"] is False
+
+
+def test_zip_loader_archive_limits(tmp_path):
+    """Test the member-count and total-size limits, and nesting depth."""
+    path = tmp_path / "many.zip"
+    path.write_bytes(_zip_bytes({f"file{i}.txt": "text " * 100 for i in range(5)}))
+    with pytest.raises(ZipLimitError):
+        ZipLoader(str(path), max_members=3).load()
+    with pytest.raises(ZipLimitError):
+        ZipLoader(str(path), max_total_bytes=1000).load()
+
+    nested = _zip_bytes({"level1.zip": _zip_bytes({"level2.zip": _zip_bytes({"deep.txt": "deep"})})})
+    path = tmp_path / "nested.zip"
+    path.write_bytes(nested)
+    (document,) = ZipLoader(str(path), max_depth=1).load()
+    assert document.metadata["member_name"] == "level1.zip/level2.zip"
+    assert "max_depth" in document.metadata["error"]
+    (document,) = ZipLoader(str(path), max_depth=2).load()
+    assert document.page_content.strip() == "deep"
+
+
+def test_zip_loader_bad_archive(tmp_path):
+    """Test that a corrupt archive raises the usual conversion error."""
+    path = tmp_path / "broken.zip"
+    path.write_bytes(b"not a zip")
+    with pytest.raises(ValueError, match="Markitdown conversion failed"):
+        ZipLoader(str(path)).load()
+
+
+def test_zip_loader_routes_members_to_format_loaders(test_pptx_file):
+    """Test that members go to their format's loader, with per-extension kwargs, from bytes."""
+    with open(test_pptx_file, "rb") as file:
+        pptx = file.read()
+    archive = _zip_bytes({"deck.pptx": pptx, "notes.txt": "Plain notes"})
+
+    documents = ZipLoader(archive, loader_kwargs={".pptx": {"split_by_page": True}}).load()
+
+    assert [d.metadata["member_name"] for d in documents] == ["deck.pptx", "notes.txt"]
+    assert documents[0].metadata["content_type"] == "presentation_slide"
+    assert documents[0].metadata["slide_count"] == 1
+    assert documents[0].metadata["source"] == "<stream>"
+    assert "Test Presentation" in documents[0].page_content